@@ -3,8 +3,11 @@ from .standard_functions import (
     fractional_delay, fractional_octave_frequencies, activity_detector, fade,
     normalize, true_peak_level, resample, load_pkl_object,
     erb_frequencies, detrend, rms, CalibrationData, envelope,
+    WelchAccumulator,
 )
 from .classes import Filter, FilterBank, Signal, MultiBandSignal
+from ._config import set_default_precision
+from ._fft import set_fft_backend, fft_config
 from . import transfer_functions
 from . import distances
 from . import room_acoustics
@@ -25,7 +28,10 @@ __all__ = [
     'resample', 'activity_detector', 'normalize',
     'fractional_delay', 'true_peak_level', 'ir_to_filter', 'erb_frequencies',
     'load_pkl_object', 'fractional_octave_frequencies', 'filter_to_ir',
-    'detrend', 'rms', 'CalibrationData', 'envelope',
+    'detrend', 'rms', 'CalibrationData', 'envelope', 'WelchAccumulator',
+
+    # Configuration
+    'set_default_precision', 'set_fft_backend', 'fft_config',
 
     # Modules
     'transfer_functions', 'distances', 'room_acoustics', 'plots', 'generators',
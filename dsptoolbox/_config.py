@@ -0,0 +1,56 @@
+"""
+Package-wide configuration
+"""
+import numpy as np
+import scipy.fft
+
+_config = dict(precision='float64', fft_backend=scipy.fft, fft_workers=None)
+
+
+def set_default_precision(precision: str = 'float64'):
+    """Sets the floating point precision that is used by default for the time
+    data of new signals. Signals keep their precision through filtering,
+    transforms and effects.
+
+    Parameters
+    ----------
+    precision : str, optional
+        Choose from `'float64'` (double precision) or `'float32'` (single
+        precision). Single precision halves the memory and might speed up
+        some computations at the expense of accuracy. Default: `'float64'`.
+
+    """
+    _config['precision'] = _check_precision(precision)
+
+
+def _get_default_precision() -> str:
+    """Returns the package-wide default precision.
+
+    """
+    return _config['precision']
+
+
+def _check_precision(precision: str) -> str:
+    """Checks that the precision is valid and returns it.
+
+    """
+    assert precision in ('float32', 'float64'), \
+        f'{precision} is not a valid precision. Use float32 or float64'
+    return precision
+
+
+def _float_dtype(data: np.ndarray):
+    """Returns the real floating point type for computations with `data`. It
+    is single precision for single precision data and double otherwise.
+
+    """
+    if data.dtype in (np.float32, np.complex64):
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def _complex_dtype(data: np.ndarray):
+    """Returns the complex type for computations with `data`.
+
+    """
+    return np.result_type(_float_dtype(data), np.complex64)
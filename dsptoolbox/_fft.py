@@ -0,0 +1,149 @@
+"""
+Central dispatch for all FFT computations of the package
+"""
+from contextlib import contextmanager
+from functools import lru_cache
+from inspect import signature
+import numpy as np
+import scipy.fft
+
+from ._config import _config
+
+
+def set_fft_backend(backend='scipy', workers: int = None):
+    """Sets the backend and the number of workers that are used for all FFT
+    computations in the package.
+
+    Parameters
+    ----------
+    backend : str or object, optional
+        Use `'scipy'` (`scipy.fft`) or `'numpy'` (`numpy.fft`). Any other
+        object (e.g., a module) that provides the functions `fft`, `ifft`,
+        `rfft` and `irfft` with the same signature as `scipy.fft` can be
+        registered as well. Default: `'scipy'`.
+    workers : int, optional
+        Number of workers (threads) for the FFT computations. Negative values
+        wrap around the number of available CPUs, i.e., -1 uses all cores.
+        This is only passed to backends that support it. Pass `None` to use
+        the default of the backend (a single worker for `scipy.fft`).
+        Default: `None`.
+
+    """
+    _config['fft_backend'] = _check_backend(backend)
+    _config['fft_workers'] = workers
+
+
+@contextmanager
+def fft_config(workers: int = None, backend=None):
+    """Context manager to change the FFT settings temporarily. The workers
+    are also used for the computations inside of scipy that rely on
+    `scipy.fft` (e.g., fft convolution, hilbert transform or resampling).
+
+    Parameters
+    ----------
+    workers : int, optional
+        Number of workers (threads). Negative values wrap around the number of
+        available CPUs, i.e., -1 uses all cores. Pass `None` to keep the
+        current setting. Default: `None`.
+    backend : str or object, optional
+        Backend for the FFT. See `set_fft_backend` for details. Pass `None` to
+        keep the current backend. Default: `None`.
+
+    Examples
+    --------
+    >>> import dsptoolbox as dsp
+    >>> with dsp.fft_config(workers=8):
+    ...     f, csm = signal.get_csm()
+
+    """
+    previous = (_config['fft_backend'], _config['fft_workers'])
+    if backend is not None:
+        _config['fft_backend'] = _check_backend(backend)
+    if workers is not None:
+        _config['fft_workers'] = workers
+    try:
+        if workers is None:
+            yield
+        else:
+            with scipy.fft.set_workers(workers):
+                yield
+    finally:
+        _config['fft_backend'], _config['fft_workers'] = previous
+
+
+def _check_backend(backend):
+    """Returns the backend module (or object) for a valid backend.
+
+    """
+    if type(backend) == str:
+        backend = backend.lower()
+        assert backend in ('scipy', 'numpy'), \
+            f'{backend} is not a valid backend. Use scipy or numpy'
+        return scipy.fft if backend == 'scipy' else np.fft
+    for name in ('fft', 'ifft', 'rfft', 'irfft'):
+        assert callable(getattr(backend, name, None)), \
+            f'Backend does not provide the function {name}'
+    return backend
+
+
+@lru_cache(maxsize=None)
+def _supports_workers(function) -> bool:
+    """Checks (once) if an FFT function accepts the workers argument.
+
+    """
+    try:
+        return 'workers' in signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _dispatch(name: str, x, n, axis, norm):
+    """Calls the function of the current backend.
+
+    """
+    backend = _config['fft_backend']
+    function = getattr(backend, name)
+    kwargs = dict(n=n, axis=axis)
+    if norm is not None:
+        kwargs['norm'] = norm
+    if _config['fft_workers'] is not None and _supports_workers(function):
+        kwargs['workers'] = _config['fft_workers']
+    return function(x, **kwargs)
+
+
+def fft(x, n: int = None, axis: int = -1, norm: str = None) -> np.ndarray:
+    """FFT with the current backend. See `scipy.fft.fft`.
+
+    """
+    return _dispatch('fft', x, n, axis, norm)
+
+
+def ifft(x, n: int = None, axis: int = -1, norm: str = None) -> np.ndarray:
+    """Inverse FFT with the current backend. See `scipy.fft.ifft`.
+
+    """
+    return _dispatch('ifft', x, n, axis, norm)
+
+
+def rfft(x, n: int = None, axis: int = -1, norm: str = None) -> np.ndarray:
+    """FFT of real data with the current backend. See `scipy.fft.rfft`.
+
+    """
+    return _dispatch('rfft', x, n, axis, norm)
+
+
+def irfft(x, n: int = None, axis: int = -1, norm: str = None) -> np.ndarray:
+    """Inverse FFT with real output with the current backend. See
+    `scipy.fft.irfft`.
+
+    """
+    return _dispatch('irfft', x, n, axis, norm)
+
+
+def next_fast_len(n: int, real: bool = True) -> int:
+    """Smallest length larger or equal to `n` that can be transformed
+    efficiently. This should only be used for zero-padding where the result
+    does not depend on the FFT length, e.g., for linear convolutions.
+
+    """
+    return scipy.fft.next_fast_len(int(n), real=real)
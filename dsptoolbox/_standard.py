@@ -2,9 +2,13 @@
 Backend for standard functions
 """
 import numpy as np
-from scipy.signal import correlate, check_COLA, windows, hilbert
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import correlate, check_COLA, windows, hilbert, lfilter
 from ._general_helpers import _pad_trim, _compute_number_frames
 from warnings import warn
+from functools import lru_cache
+from ._config import _float_dtype, _complex_dtype
+from ._fft import rfft
 
 
 def _latency(in1: np.ndarray, in2: np.ndarray = None,
@@ -122,7 +126,8 @@ def _fractional_latency(td1: np.ndarray, td2: np.ndarray = None,
 def _welch(x, y, fs_hz: int, window_type: str = 'hann',
            window_length_samples: int = 1024, overlap_percent=50,
            detrend: bool = True, average: str = 'mean',
-           scaling: str = 'power spectral density') -> np.ndarray:
+           scaling: str = 'power spectral density',
+           max_chunk_bytes: int = 2**27) -> np.ndarray:
     """Cross spectral density computation with Welch's method.
 
     Parameters
@@ -151,6 +156,9 @@ def _welch(x, y, fs_hz: int, window_type: str = 'hann',
         `'amplitude spectrum'` or `'amplitude spectral density'`. Pass `None`
         to avoid any scaling. See references for details about scaling.
         Default: `'power spectral density'`.
+    max_chunk_bytes : int, optional
+        Approximate upper bound for the memory used by the spectra of the
+        frames that are processed at once. Default: 2**27 (128 MB).
 
     Returns
     -------
@@ -178,18 +186,171 @@ def _welch(x, y, fs_hz: int, window_type: str = 'hann',
         y = np.asarray(y).squeeze()
     assert x.shape == y.shape, \
         'Shapes of data do not match'
-    # NOTE: Computing the spectrum in a vectorized manner for all channels
-    # simultaneously does not seem to be faster than doing it sequentally
-    # for each channel. Maybe parallelizing with something like numba could
-    # be advantageous...
-    if x.ndim == 2:
-        multi_channel = True
-    else:
-        multi_channel = False
-
     assert len(x.shape) <= 2, f'{x.shape} are too many dimensions. Use flat' +\
         ' arrays or 2D-Arrays instead'
+    multi_channel = x.ndim == 2
+    if not multi_channel:
+        x = x[..., None]
+        y = y[..., None]
+
+    window, step, scaling = _welch_setup(
+        window_type, window_length_samples, overlap_percent, average, scaling)
+    frames_per_chunk = _welch_frames_per_chunk(
+        window_length_samples, 2*x.shape[1], max_chunk_bytes)
+
+    # Auto-spectrum: transform only once
+    same_input = x is y or np.shares_memory(x, y) and np.all(x == y)
+    x_spectra = _welch_spectra(x, window, step, detrend, frames_per_chunk)
+    if same_input:
+        products = (sp.real**2 + sp.imag**2 for sp in x_spectra)
+    else:
+        y_spectra = _welch_spectra(y, window, step, detrend, frames_per_chunk)
+        products = (xs.conjugate() * ys
+                    for xs, ys in zip(x_spectra, y_spectra))
+    csd = _welch_average(products, average)
+    csd = _welch_scaling(csd, window, fs_hz, scaling, detrend)
+
+    if not multi_channel:
+        csd = csd[..., 0]
+    # Cast to real output if there is no imaginary part
+    if np.iscomplexobj(csd) and np.all(csd.imag == 0):
+        csd = csd.real
+    return csd
+
+
+def _welch_multichannel(x: np.ndarray, fs_hz: int, window_type: str = 'hann',
+                        window_length_samples: int = 1024,
+                        overlap_percent=50, detrend: bool = True,
+                        average: str = 'mean',
+                        scaling: str = 'power spectral density',
+                        cross_spectra: bool = False,
+                        max_chunk_bytes: int = 2**27,
+                        y: np.ndarray = None) -> np.ndarray:
+    """Welch's method for all channels of a signal at once. Each channel is
+    framed, windowed and transformed exactly once. All auto-spectra (and
+    cross-spectra) are then obtained from the same spectra.
 
+    Parameters
+    ----------
+    x : `np.ndarray`
+        Signal with shape (time samples, channels).
+    fs_hz : int
+        Sampling rate in Hz.
+    window_type : str, optional
+        Window type to be used. Refer to scipy.signal.windows for available
+        ones. Default: `'hann'`
+    window_length_samples : int, optional
+        Window length to be used. Determines frequency resolution in the end.
+        Only powers of 2 are accepted. Default: 1024.
+    overlap_percent : int, optional
+        Overlap in percentage. Default: 50.
+    detrend : bool, optional
+        Detrending from each time segment (removing mean). Default: True.
+    average : str, optional
+        Type of mean to be computed. Take `'mean'` or `'median'`.
+        Default: `'mean'`
+    scaling : str, optional
+        Scaling. Use `'power spectrum'`, `'power spectral density'`,
+        `'amplitude spectrum'` or `'amplitude spectral density'`. Pass `None`
+        to avoid any scaling. Default: `'power spectral density'`.
+    cross_spectra : bool, optional
+        When `True`, the cross spectral matrix with shape
+        (frequency, channels, channels) is returned. Otherwise, only the
+        (real) auto-spectra with shape (frequency, channels). Default: `False`.
+    max_chunk_bytes : int, optional
+        Approximate upper bound for the memory used by the intermediate
+        spectra. Frames (or frequency bins when using the median) are
+        processed in chunks that respect it. Default: 2**27 (128 MB).
+    y : `np.ndarray`, optional
+        Second signal with shape (time samples, channels y). If passed (only
+        for cross-spectra), the cross-spectra between all channels of `y` and
+        `x` are returned with shape (frequency, channels y, channels), i.e.,
+        some rows of a cross spectral matrix. Default: `None`.
+
+    Returns
+    -------
+    spectra : `np.ndarray`
+        Auto-spectra with shape (frequency, channels) or cross spectral
+        matrix with shape (frequency, channels, channels). In the latter,
+        the entry `[:, j, i]` corresponds to `_welch(x[:, i], x[:, j])`.
+
+    """
+    assert x.ndim == 2, \
+        'Signal must have shape (time samples, channels)'
+    window, step, scaling = _welch_setup(
+        window_type, window_length_samples, overlap_percent, average, scaling)
+    number_of_channels = x.shape[1]
+    if y is not None:
+        assert cross_spectra, \
+            'A second signal can only be passed for the cross-spectra'
+        assert y.ndim == 2 and len(y) == len(x), \
+            'Second signal must have shape (time samples, channels)'
+
+    if not cross_spectra:
+        frames_per_chunk = _welch_frames_per_chunk(
+            window_length_samples, number_of_channels, max_chunk_bytes)
+        products = (
+            sp.real**2 + sp.imag**2 for sp in
+            _welch_spectra(x, window, step, detrend, frames_per_chunk))
+        spectra = _welch_average(products, average)
+        return _welch_scaling(spectra, window, fs_hz, scaling, detrend)
+
+    number_of_rows = number_of_channels if y is None else y.shape[1]
+    total_channels = number_of_channels if y is None else \
+        number_of_channels + number_of_rows
+
+    if average == 'mean':
+        # Accumulate Y X^H for each frequency over chunks of frames
+        frames_per_chunk = _welch_frames_per_chunk(
+            window_length_samples, total_channels, max_chunk_bytes)
+        x_spectra = _welch_spectra(x, window, step, detrend, frames_per_chunk)
+        y_spectra = x_spectra if y is None else \
+            _welch_spectra(y, window, step, detrend, frames_per_chunk)
+        csm = np.zeros((window_length_samples//2+1, number_of_rows,
+                        number_of_channels), dtype=_complex_dtype(x))
+        n_frames = 0
+        for sp in x_spectra:
+            # sp has shape (frequency, frames, channels)
+            sp_y = sp if y is None else next(y_spectra)
+            csm += np.swapaxes(sp_y, 1, 2) @ sp.conjugate()
+            n_frames += sp.shape[1]
+        csm /= n_frames
+    else:
+        # All frames are needed for the median, the products are computed
+        # for chunks of frequency bins
+        sp = np.concatenate(
+            list(_welch_spectra(x, window, step, detrend, None)), axis=1)
+        sp_y = sp if y is None else np.concatenate(
+            list(_welch_spectra(y, window, step, detrend, None)), axis=1)
+        n_frames = sp.shape[1]
+        bins_per_chunk = max(
+            1, max_chunk_bytes //
+            (16 * n_frames * number_of_channels * number_of_rows))
+        csm = np.zeros((sp.shape[0], number_of_rows, number_of_channels),
+                       dtype=sp.dtype)
+        for start in range(0, sp.shape[0], bins_per_chunk):
+            chunk = sp[start:start+bins_per_chunk]
+            chunk_y = sp_y[start:start+bins_per_chunk]
+            products = chunk_y[..., :, None] * chunk[..., None, :].conjugate()
+            csm[start:start+bins_per_chunk] = \
+                np.median(products.real, axis=1) + \
+                1j*np.median(products.imag, axis=1)
+        csm /= _median_bias(n_frames)
+
+    csm = _welch_scaling(csm, window, fs_hz, scaling, detrend)
+    if y is not None:
+        return csm
+    # Enforce hermitian matrices by only using the lower triangle
+    csm = np.tril(csm) + np.swapaxes(np.tril(csm, -1), 1, 2).conjugate()
+    return csm
+
+
+def _welch_setup(window_type: str, window_length_samples: int,
+                 overlap_percent, average: str, scaling: str):
+    """Checks parameters for Welch's method and returns the window, the step
+    size and the scaling (`None` is returned as empty string).
+
+    """
     valid_window_sizes = np.array([int(2**x) for x in range(3, 19)])
     assert window_length_samples in valid_window_sizes, \
         'Window length should be a power of 2 between [8, 262_144] or ' +\
@@ -217,43 +378,145 @@ def _welch(x, y, fs_hz: int, window_type: str = 'hann',
     if not check_COLA(window, nperseg=len(window), noverlap=overlap_samples):
         warn('Selected window type and overlap do not meet the constant ' +
              'overlap and add constraint! Results might be distorted')
+    return window, step, scaling
 
-    if not multi_channel:
-        x = x[..., None]
-        y = y[..., None]
 
-    x_frames = _get_framed_signal(x, window_length_samples, step)
-    y_frames = _get_framed_signal(y, window_length_samples, step)
+def _welch_frames_per_chunk(window_length_samples: int,
+                            number_of_channels: int,
+                            max_chunk_bytes: int) -> int:
+    """Number of frames whose (real) time data and (complex) spectra fit
+    into `max_chunk_bytes`.
 
-    # Window
-    x_frames *= window[:, np.newaxis, np.newaxis]
-    y_frames *= window[:, np.newaxis, np.newaxis]
+    """
+    bytes_per_frame = number_of_channels * \
+        (8*window_length_samples + 16*(window_length_samples//2+1))
+    return max(1, int(max_chunk_bytes // bytes_per_frame))
 
-    if not multi_channel:
-        x_frames = np.squeeze(x_frames)
-        y_frames = np.squeeze(y_frames)
 
-    # Detrend
-    if detrend:
-        x_frames -= np.mean(x_frames, axis=0)
-        y_frames -= np.mean(y_frames, axis=0)
+def _welch_spectra(x: np.ndarray, window: np.ndarray, step: int,
+                   detrend: bool, frames_per_chunk: int = None,
+                   number_of_frames: int = None):
+    """Generator that yields the spectra of windowed (and detrended) frames
+    of `x` with shape (frequency, frames, channels). The frames are
+    transformed in chunks of `frames_per_chunk` (all at once if `None`).
+    Only the first `number_of_frames` are used if it is not `None`.
 
-    # Combine
-    sp_frames = np.fft.rfft(x_frames, axis=0).conjugate() * \
-        np.fft.rfft(y_frames, axis=0)
+    """
+    x_frames = _get_framed_signal(x, len(window), step, read_only_view=True)
+    if number_of_frames is not None:
+        x_frames = x_frames[:, :number_of_frames, :]
+    # Computations are done in the precision of the data
+    window = window.astype(_float_dtype(x))
+    n_frames = x_frames.shape[1]
+    if frames_per_chunk is None:
+        frames_per_chunk = n_frames
+    for start in range(0, n_frames, frames_per_chunk):
+        frames = x_frames[:, start:start+frames_per_chunk, :] * \
+            window[:, np.newaxis, np.newaxis]
+        if detrend:
+            frames -= np.mean(frames, axis=0)
+        yield rfft(frames, axis=0)
+
+
+def _welch_average(products, average: str) -> np.ndarray:
+    """Averages an iterable of spectral products with shape
+    (frequency, frames, ...) along the frames.
 
-    # Direct averaging much faster
+    """
     if average == 'mean':
-        csd = np.mean(sp_frames, axis=1)
-    else:
+        n_frames = 0
+        csd = 0
+        for p in products:
+            csd = csd + np.sum(p, axis=1)
+            n_frames += p.shape[1]
+        return csd / n_frames
+
+    sp_frames = np.concatenate(list(products), axis=1)
+    if np.iscomplexobj(sp_frames):
         csd = np.median(sp_frames.real, axis=1) + 1j * \
             np.median(sp_frames.imag, axis=1)
-        # Bias according to reference
-        n = sp_frames.shape[1] if sp_frames.shape[1] % 2 == 1 else \
-            sp_frames.shape[1] - 1
-        bias = np.sum((-1)**(n+1)/n)
-        csd /= bias
+    else:
+        csd = np.median(sp_frames, axis=1)
+    return csd / _median_bias(sp_frames.shape[1])
+
+
+def _welch_weighted_sum(x: np.ndarray, window: np.ndarray, step: int,
+                        detrend: bool, cross_spectra: bool,
+                        forgetting_factor: float = 1.,
+                        number_of_frames: int = None,
+                        max_chunk_bytes: int = 2**27):
+    """Sum of the spectral products of all frames of `x`, where frame `k` out
+    of `n` is weighted with `forgetting_factor**(n-1-k)`, i.e., the most
+    recent frame has weight 1.
+
+    Parameters
+    ----------
+    x : `np.ndarray`
+        Signal with shape (time samples, channels).
+    window : `np.ndarray`
+        Window for each frame.
+    step : int
+        Step size in samples.
+    detrend : bool
+        Detrending of each frame.
+    cross_spectra : bool
+        When `True`, the sum of the cross spectral matrices with shape
+        (frequency, channels, channels) is returned. Otherwise, the sum of
+        the auto-spectra with shape (frequency, channels).
+    forgetting_factor : float, optional
+        Weight factor between consecutive frames. Default: 1.
+    number_of_frames : int, optional
+        Only the first frames of `x` are used if passed. Default: `None`.
+    max_chunk_bytes : int, optional
+        Approximate upper bound for the memory used by the spectra of the
+        frames that are processed at once. Default: 2**27 (128 MB).
+
+    Returns
+    -------
+    products_sum : `np.ndarray`
+        Weighted sum of the spectral products.
+    weights_sum : float
+        Sum of all weights.
+    n_frames : int
+        Number of frames that were used.
+
+    """
+    frames_per_chunk = _welch_frames_per_chunk(
+        len(window), x.shape[1], max_chunk_bytes)
+    products_sum = 0
+    weights_sum = 0
+    n_frames = 0
+    for sp in _welch_spectra(x, window, step, detrend, frames_per_chunk,
+                             number_of_frames):
+        m = sp.shape[1]
+        weights = forgetting_factor**np.arange(m-1, -1, -1)
+        if cross_spectra:
+            # Entry [:, j, i] is X_j X_i^* as in _welch_multichannel
+            products = (np.swapaxes(sp, 1, 2) * weights) @ sp.conjugate()
+        else:
+            products = np.einsum(
+                'ftc,t->fc', sp.real**2 + sp.imag**2, weights)
+        decay = forgetting_factor**m
+        products_sum = products_sum*decay + products
+        weights_sum = weights_sum*decay + np.sum(weights)
+        n_frames += m
+    return products_sum, weights_sum, n_frames
+
 
+def _median_bias(n_frames: int) -> float:
+    """Bias of the median average according to Allen et al. (2005).
+
+    """
+    n = n_frames if n_frames % 2 == 1 else n_frames - 1
+    return np.sum((-1)**(n+1)/n)
+
+
+def _welch_scaling(csd: np.ndarray, window: np.ndarray, fs_hz: int,
+                   scaling: str, detrend: bool) -> np.ndarray:
+    """Applies the scaling of Welch's method to the averaged spectra. The
+    first axis must be frequency.
+
+    """
     # Weightning (with 2 because one-sided)
     if scaling in ('power spectrum', 'amplitude spectrum'):
         factor = 2 / np.sum(window)**2
@@ -274,10 +537,6 @@ def _welch(x, y, fs_hz: int, window_type: str = 'hann',
 
     if 'amplitude' in scaling:
         csd = np.sqrt(csd)
-
-    # Cast to real output if there is no imaginary part
-    if np.all(csd.imag == 0):
-        csd = csd.real
     return csd
 
 
@@ -407,14 +666,16 @@ def _stft(x: np.ndarray, fs_hz: int, window_length_samples: int = 2048,
     if padding:
         x = np.pad(x, ((overlap_samples, overlap_samples), (0, 0)))
     # Framed signal
-    time_x = _get_framed_signal(x, window_length_samples, step, True)
-    # Windowing
-    time_x *= window[..., np.newaxis, np.newaxis]
+    time_x = _get_framed_signal(x, window_length_samples, step, True,
+                                read_only_view=True)
+    # Windowing (in the precision of the data)
+    time_x = time_x * \
+        window.astype(_float_dtype(x))[..., np.newaxis, np.newaxis]
     # Detrend
     if detrend:
         time_x -= np.mean(time_x, axis=0)
     # Spectra
-    stft = np.fft.rfft(time_x, axis=0, n=fft_length_samples)
+    stft = rfft(time_x, axis=0, n=fft_length_samples)
     # Scaling
     if scaling:
         factor = np.sqrt(2 / np.sum(window)**2)
@@ -430,7 +691,7 @@ def _stft(x: np.ndarray, fs_hz: int, window_length_samples: int = 2048,
 def _csm(time_data: np.ndarray, sampling_rate_hz: int,
          window_length_samples: int = 1024, window_type: str = 'hann',
          overlap_percent: int = 50, detrend: bool = True,
-         average: str = 'mean', scaling: str = 'power'):
+         average: str = 'mean', scaling: str = 'power spectral density'):
     """Computes the cross spectral matrix of a multichannel signal.
     Output matrix has (frequency, channels, channels).
 
@@ -473,39 +734,53 @@ def _csm(time_data: np.ndarray, sampling_rate_hz: int,
       comprehensive list of window functions and some new at-top windows.
 
     """
-    # ===== Remarks on speed =============
-    # It has been tried to vectorize the whole computation of the CSM by using
-    # a multi-channel approach in the _welch() function or with a class. This
-    # leads to a dramatic drop in performance and an elevated memory cost.
-    # Maybe using some parallel computing framework like numba would make it
-    # faster, but less readable and it would be a new dependency of the
-    # package... So far the double loop has been best solution
-    # =====================================
-    number_of_channels = time_data.shape[1]
-    csm = np.zeros((window_length_samples//2+1,
-                    number_of_channels,
-                    number_of_channels), dtype='cfloat')
-    for ind1 in range(number_of_channels):
-        for ind2 in range(ind1, number_of_channels):
-            # Complex conjugate second signal and not first (like transposing
-            # the matrix)
-            csm[:, ind2, ind1] = \
-                _welch(time_data[:, ind1],
-                       time_data[:, ind2],
-                       sampling_rate_hz,
-                       window_length_samples=window_length_samples,
-                       window_type=window_type,
-                       overlap_percent=overlap_percent,
-                       detrend=detrend,
-                       average=average,
-                       scaling=scaling)
-            if ind1 == ind2:
-                csm[:, ind1, ind2] *= 0.5
-    csm += np.swapaxes(csm, 1, 2).conjugate()
+    csm = _welch_multichannel(
+        time_data, sampling_rate_hz, window_type=window_type,
+        window_length_samples=window_length_samples,
+        overlap_percent=overlap_percent, detrend=detrend, average=average,
+        scaling=scaling, cross_spectra=True)
     f = np.fft.rfftfreq(window_length_samples, 1/sampling_rate_hz)
     return f, csm
 
 
+def _csm_add_channels(csm: np.ndarray, time_data: np.ndarray,
+                      new_time_data: np.ndarray, sampling_rate_hz: int,
+                      window_length_samples: int = 1024,
+                      window_type: str = 'hann', overlap_percent: int = 50,
+                      detrend: bool = True, average: str = 'mean',
+                      scaling: str = 'power spectral density') -> np.ndarray:
+    """Extends the cross spectral matrix of `time_data` by the channels of
+    `new_time_data`. Only the new rows and columns are computed. See `_csm`
+    for the parameters.
+
+    Returns
+    -------
+    csm : `np.ndarray`
+        Cross spectral matrix with shape (frequency, channels + new channels,
+        channels + new channels).
+
+    """
+    parameters = dict(
+        window_length_samples=window_length_samples, window_type=window_type,
+        overlap_percent=overlap_percent, detrend=detrend, average=average,
+        scaling=scaling)
+    rows = _welch_multichannel(time_data, sampling_rate_hz,
+                               cross_spectra=True, y=new_time_data,
+                               **parameters)
+    new_block = _welch_multichannel(new_time_data, sampling_rate_hz,
+                                    cross_spectra=True, **parameters)
+    number_of_channels = time_data.shape[1]
+    new_csm = np.zeros(
+        (csm.shape[0], number_of_channels + new_time_data.shape[1],
+         number_of_channels + new_time_data.shape[1]), dtype=csm.dtype)
+    new_csm[:, :number_of_channels, :number_of_channels] = csm
+    new_csm[:, number_of_channels:, :number_of_channels] = rows
+    new_csm[:, :number_of_channels, number_of_channels:] = \
+        np.swapaxes(rows, 1, 2).conjugate()
+    new_csm[:, number_of_channels:, number_of_channels:] = new_block
+    return new_csm
+
+
 def _center_frequencies_fractional_octaves_iec(nominal, num_fractions):
     """Returns the exact center frequencies for fractional octave bands
     according to the IEC 61260:1:2014 standard.
@@ -638,55 +913,69 @@ def _kaiser_window_beta(A):
 
 
 def _indices_above_threshold_dbfs(time_vec: np.ndarray, threshold_dbfs: float,
-                                  attack_smoothing_coeff: int,
-                                  release_smoothing_coeff: int,
+                                  attack_smoothing_coeff: float,
+                                  release_smoothing_coeff: float,
                                   normalize: bool = True):
     """Returns indices with power above a given power threshold (in dBFS) in a
     time series. time_vec can be normalized to peak value prior to computation.
+    The level is the power averaged by a one-pole filter with the release
+    coefficient. It is held while the power of the previous sample is zero.
+    All channels are computed at once.
 
     Parameters
     ----------
     time_vec : `np.ndarray`
-        Time series for which to find indices above power threshold. Can only
-        take one channel.
+        Time series for which to find indices above power threshold with
+        shape (time samples) or (time samples, channels).
     threshold_dbfs : float
         Threshold in dBFS to be regarded for activation.
-    attack_smoothing_coeff : int
+    attack_smoothing_coeff : float
         Coefficient for attack smoothing for level computation.
-    release_smoothing_coeff : int
+    release_smoothing_coeff : float
         Coefficient for release smoothing for level computation.
     normalize : bool, optional
-        When `True`, signal is normalized such that the threshold is relative
-        to peak level and not absolute. Default: `True`.
+        When `True`, each channel is normalized such that the threshold is
+        relative to its peak level and not absolute. Default: `True`.
 
     Returns
     -------
     indices_above : `np.ndarray`
-        Array of type boolean with length of time_vec indicating indices
+        Array of type boolean with the shape of time_vec indicating indices
         above threshold with `True` and below with `False`.
 
     """
-    time_vec = np.asarray(time_vec).squeeze()
-    assert time_vec.ndim == 1, \
-        'Function is implemented for 1D-arrays only'
+    time_vec = np.asarray(time_vec)
+    if time_vec.ndim == 2 and time_vec.shape[1] == 1:
+        time_vec = time_vec[:, 0]
+    assert time_vec.ndim in (1, 2), \
+        'Function is implemented for 1D- and 2D-arrays only'
 
     # Normalization
     if normalize:
-        time_vec /= np.abs(time_vec).max()
-
-    # Power in dB
-    time_power = time_vec.squeeze()**2
-
-    momentary_gain = np.zeros(len(time_power))
-    for i in np.arange(1, len(time_power)):
-        if momentary_gain[i] > time_power[i-1]:
-            coeff = attack_smoothing_coeff
-        elif momentary_gain[i] < time_power[i-1]:
-            coeff = release_smoothing_coeff
-        else:
-            coeff = 0
-        momentary_gain[i] = coeff*time_power[i] + (1-coeff)*momentary_gain[i-1]
-    momentary_gain = 10*np.log10(momentary_gain)
+        peak = np.max(np.abs(time_vec), axis=0)
+        time_vec = time_vec / np.where(peak == 0, 1, peak)
+
+    # Power averaged with the release coefficient. The level starts at zero
+    # and is only updated after samples with non-zero power, otherwise it is
+    # held. The attack coefficient does not shape the level
+    time_power = time_vec**2
+    momentary_gain = np.zeros_like(time_power)
+    for channel in np.ndindex(time_power.shape[1:]):
+        power = time_power[(slice(None), *channel)]
+        updated = np.flatnonzero(power[:-1] != 0) + 1
+        if len(updated) == 0:
+            continue
+        gain = np.zeros_like(power)
+        gain[updated] = lfilter(
+            [release_smoothing_coeff], [1, release_smoothing_coeff - 1],
+            power[updated])
+        # Held samples take the level of the last update
+        last_update = np.zeros(len(power), dtype=int)
+        last_update[updated] = updated
+        momentary_gain[(slice(None), *channel)] = \
+            gain[np.maximum.accumulate(last_update)]
+    with np.errstate(divide='ignore'):
+        momentary_gain = 10*np.log10(momentary_gain)
 
     # Get Indices above threshold
     indices_above = momentary_gain > threshold_dbfs
@@ -747,8 +1036,8 @@ def _rms(x: np.ndarray) -> float | np.ndarray:
 
 
 def _get_framed_signal(td: np.ndarray, window_length_samples: int,
-                       step_size: int, keep_last_frame: bool = True) \
-        -> np.ndarray:
+                       step_size: int, keep_last_frame: bool = True,
+                       read_only_view: bool = False) -> np.ndarray:
     """This method computes a framed version of a signal and returns it.
 
     Parameters
@@ -763,6 +1052,11 @@ def _get_framed_signal(td: np.ndarray, window_length_samples: int,
         When `True`, the last frame (probably with padded zeroes) is kept.
         Otherwise, it is not returned and hence the signal is cropped.
         Default: `True`.
+    read_only_view : bool, optional
+        When `True`, the frames are returned as a read-only strided view of
+        the (padded) signal, i.e., overlapping samples are not copied. This
+        should be preferred when the frames are not modified, e.g., when
+        windowing creates a new array anyway. Default: `False`.
 
     Returns
     -------
@@ -780,17 +1074,16 @@ def _get_framed_signal(td: np.ndarray, window_length_samples: int,
     n_frames, padding_samp = \
         _compute_number_frames(window_length_samples, step_size, td.shape[0])
     td = _pad_trim(td, td.shape[0] + padding_samp)
-    td_framed = np.zeros((window_length_samples, n_frames, td.shape[1]),
-                         dtype='float')
 
-    # Create time frames
-    start = 0
-    for n in range(n_frames):
-        td_framed[:, n, :] = td[start:start+window_length_samples, :].copy()
-        start += step_size
+    # Create time frames – view with shape (frames, channels, time samples)
+    td_framed = sliding_window_view(
+        td, window_length_samples, axis=0)[::step_size][:n_frames]
+    td_framed = np.moveaxis(td_framed, -1, 0)
 
     if not keep_last_frame:
         td_framed = td_framed[:, :-1, :]
+    if not read_only_view:
+        td_framed = td_framed.astype(_float_dtype(td))
     return td_framed
 
 
@@ -840,12 +1133,7 @@ def _reconstruct_framed_signal(td_framed: np.ndarray, step_size: int,
 
     total_length = int(step_size * td_framed.shape[1] +
                        td_framed.shape[0]*(1 - step_size/td_framed.shape[0]))
-    td = np.zeros((total_length, td_framed.shape[-1]))
-
-    start = 0
-    for i in range(td_framed.shape[1]):
-        td[start:start+td_framed.shape[0], :] += td_framed[:, i, :]
-        start += step_size
+    td = _overlap_add(td_framed, step_size)[:total_length]
 
     if window is not None:
         envelope = _get_window_envelope(
@@ -854,26 +1142,101 @@ def _reconstruct_framed_signal(td_framed: np.ndarray, step_size: int,
         if safety_threshold is not None:
             envelope = np.clip(envelope, a_min=safety_threshold, a_max=None)
         non_zero = envelope > np.finfo(td.dtype).tiny
-        td[non_zero, ...] /= envelope[non_zero, np.newaxis]
+        td /= np.where(non_zero, envelope, 1)[:, np.newaxis]
 
     if original_signal_length is not None:
         td = _pad_trim(td, original_signal_length)
     return td
 
 
+def _overlap_add(td_framed: np.ndarray, step_size: int) -> np.ndarray:
+    """Overlap-add of frames with shape (time samples, frames, channels).
+    Each frame is split into blocks of length `step_size` so that the
+    summation only needs one vectorized addition per block (instead of one
+    per frame).
+
+    Parameters
+    ----------
+    td_framed : `np.ndarray`
+        Framed signal with shape (time samples, frames, channels).
+    step_size : int
+        Step size in samples between frames (also known as hop length).
+
+    Returns
+    -------
+    td : `np.ndarray`
+        Signal with shape (time samples, channels). Its length is a multiple
+        of the step size and might contain some zeros at the end.
+
+    """
+    length_frame, n_frames, n_channels = td_framed.shape
+    n_blocks = int(np.ceil(length_frame / step_size))
+    # Pad frames to a multiple of step size and reshape into blocks with
+    # shape (blocks, step, frames, channels)
+    if n_blocks*step_size != length_frame:
+        td_framed = np.pad(
+            td_framed,
+            ((0, n_blocks*step_size - length_frame), (0, 0), (0, 0)))
+    td_framed = td_framed.reshape(n_blocks, step_size, n_frames, n_channels)
+
+    # Output blocks with shape (step, output blocks, channels)
+    td = np.zeros((step_size, n_frames + n_blocks - 1, n_channels),
+                  dtype=np.result_type(td_framed, float))
+    for block in range(n_blocks):
+        td[:, block:block+n_frames] += td_framed[block]
+    return np.moveaxis(td, 0, 1).reshape(-1, n_channels)
+
+
 def _get_window_envelope(window: np.ndarray, total_length_samples: int,
                          step_size_samples: int, number_frames: int,
                          squared: bool = True):
     """Compute the window envelope for a given window with step size and total
-    length. The window can be squared or not.
+    length. The window can be squared or not. The envelope is assembled from
+    its rising and falling edges and one period of the full overlap, which
+    are cached for each window and hop length.
+
+    """
+    window = np.asarray(window, dtype=float)
+    length = len(window)
+    step_size_samples = int(step_size_samples)
+    total_frames_length = (number_frames - 1)*step_size_samples + length
+    if (number_frames - 1)*step_size_samples < length:
+        # Edges overlap (short signal)
+        if squared:
+            window = window**2
+        frames = np.repeat(window[:, None, None], number_frames, axis=1)
+        envelope = _overlap_add(frames, step_size_samples)[:, 0]
+    else:
+        rising, falling, period = _window_envelope_cached(
+            window.tobytes(), step_size_samples, squared)
+        envelope = np.resize(period, total_frames_length)
+        envelope[:length] = rising
+        envelope[-length:] = falling
+    return _pad_trim(envelope, total_length_samples)
+
+
+@lru_cache(maxsize=32)
+def _window_envelope_cached(window_bytes: bytes, step_size_samples: int,
+                            squared: bool) -> tuple:
+    """Rising edge (first window length), falling edge (last window length)
+    and one period (step size) of the envelope of overlapping windows. The
+    window is passed as bytes (so that it is hashable). The returned arrays
+    are read-only since they are shared between calls.
 
     """
+    window = np.frombuffer(window_bytes, dtype=float)
     if squared:
-        window **= 2
-    envelope = np.zeros(total_length_samples)
-
-    start = 0
-    for _ in range(number_frames):
-        envelope[start:start+len(window)] += window
-        start += step_size_samples
-    return envelope
+        window = window**2
+    length = len(window)
+    rising = np.zeros(length)
+    falling = np.zeros(length)
+    for start in range(0, length, step_size_samples):
+        rising[start:] += window[:length-start]
+        falling[:length-start] += window[start:]
+    # Full overlap is periodic and equals the beginning of the falling edge
+    period = falling[:step_size_samples].copy()
+    if len(period) < step_size_samples:
+        period = np.pad(period, (0, step_size_samples - len(period)))
+    for envelope_part in (rising, falling, period):
+        envelope_part.flags.writeable = False
+    return rising, falling, period
@@ -1348,7 +1348,7 @@ class BeamformerDASTime(BaseBeamformer):
             (r0 - min_distance)/self.c * self.signal.sampling_rate_hz
         longest_delay_samples = int(longest_delay_samples + 2)
         total_length_samples = \
-            out_sig.time_data.shape[0] + longest_delay_samples
+            len(out_sig) + longest_delay_samples
         out_sig = pad_trim(out_sig, total_length_samples)
 
         # Start computation for each grid point
@@ -1361,7 +1361,7 @@ class BeamformerDASTime(BaseBeamformer):
             new_time_data = np.zeros((total_length_samples, 1))
             for im in range(self.mics.number_of_points):
                 ntd = fractional_delay(
-                    self.signal.get_channels(im), delays[im]).time_data *\
+                    self.signal.get_channels(im), delays[im]).time_data_view *\
                         ds[im, ig]
                 new_time_data += _pad_trim(ntd, total_length_samples)
             new_time_data *= (4*np.pi/self.mics.number_of_points)
@@ -1422,7 +1422,7 @@ class MonopoleSource():
             ns = fractional_delay(
                 self.emitted_signal, delays[i], keep_length=True)
             # Amplitude scaling – 1 on point and decays with distance
-            ns.time_data = ns.time_data/(1+distances[i])
+            ns.time_data = ns.time_data_view/(1+distances[i])
             # Append to final signal
             multi_channel_signal = merge_signals(
                 multi_channel_signal, ns, padding_trimming=True)
@@ -1462,23 +1462,23 @@ def mix_sources_on_array(sources: list | MonopoleSource, mics: MicArray,
         'All sources in list should be of type Source'
     # Take first source
     multi_channel_sig = sources[0].get_signals_on_array(mics, c)
-    total_length_samples = multi_channel_sig.time_data.shape[0]
+    total_length_samples = len(multi_channel_sig)
     sources.pop(0)
 
     # Add all other sources progressively checking for shortest duration
     for s in sources:
         # Warning if lengths do not match
-        if total_length_samples != s.emitted_signal.time_data.shape[0]:
+        if total_length_samples != len(s.emitted_signal):
             warn('Emitted signals from sources differ in length. Trimming to '
                  'shortest will be done')
             total_length_samples = min(
-                total_length_samples, s.emitted_signal.time_data.shape[0])
+                total_length_samples, len(s.emitted_signal))
             multi_channel_sig = pad_trim(
                 multi_channel_sig, total_length_samples)
             s.emitted_signal = pad_trim(s.emitted_signal, total_length_samples)
         # Add to multi-channel data
         ns = s.get_signals_on_array(mics, c)
-        multi_channel_sig.time_data += ns.time_data
+        multi_channel_sig.time_data += ns.time_data_view
     return multi_channel_sig
 
 
@@ -4,10 +4,14 @@ Backend for filter class and general filtering functions.
 import numpy as np
 from warnings import warn
 from enum import Enum
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+import os
 import scipy.signal as sig
 from .signal_class import Signal
 from .multibandsignal import MultiBandSignal
-from .._general_helpers import _polyphase_decomposition
+from ._partitioned_convolution import PartitionedConvolver
+from .._config import _float_dtype, _complex_dtype
 
 
 def _get_biquad_type(number: int = None, name: str = None):
@@ -205,6 +209,74 @@ def _group_delay_filter(ba, length_samples: int = 512, fs_hz: int = 48000):
     return f, gd
 
 
+def _filter_array(time_data: np.ndarray, sos=None, ba=None, zi=None,
+                  zero_phase: bool = False, filter_type: str = 'iir',
+                  partition_size_samples: int = None):
+    """Filters time data with shape (time samples, channels) along the time
+    axis with either SOS or ba coefficients. All filtering functions use this
+    backend.
+
+    Parameters
+    ----------
+    time_data : `np.ndarray`
+        Time data with shape (time samples, channels).
+    sos : array-like, optional
+        SOS coefficients of filter. Default: `None`.
+    ba : list, optional
+        List with ba coefficients of filter. It is only used when `sos` is
+        `None`. Default: `None`.
+    zi : `np.ndarray`, optional
+        Initial filter states with the layout of `scipy.signal`, i.e.,
+        (sections, 2, channels) for SOS and (order, channels) for ba. When
+        not `None`, the final states are returned and `zero_phase` is
+        ignored. Default: `None`.
+    zero_phase : bool, optional
+        Uses zero-phase filtering on signal. Be aware that the filter
+        is doubled in this case. Default: `False`.
+    filter_type : str, optional
+        Filter type of the ba coefficients. When FIR, an own implementation
+        of lfilter is used, otherwise scipy.signal.lfilter is used.
+        Default: `'iir'`.
+    partition_size_samples : int, optional
+        When not `None`, FIR filters are applied with a uniformly partitioned
+        convolution with this partition size. This is not used with zi's or
+        zero-phase filtering. Default: `None`.
+
+    Returns
+    -------
+    y : `np.ndarray`
+        Filtered time data.
+    zf : `np.ndarray`
+        Final filter states. `None` if passed zi was `None`.
+
+    """
+    if sos is not None:
+        if zi is not None:
+            return sig.sosfilt(sos, time_data, zi=zi, axis=0)
+        if zero_phase:
+            return sig.sosfiltfilt(sos, time_data, axis=0), None
+        return sig.sosfilt(sos, time_data, axis=0), None
+
+    # Take lfilter function, might be a different one depending if filter is
+    # FIR or IIR
+    if filter_type == 'fir':
+        lfilter = _lfilter_fir
+        if partition_size_samples is not None and zi is None:
+            lfilter = partial(_lfilter_fir_partitioned,
+                              partition_size_samples=partition_size_samples)
+    elif filter_type in ('iir', 'biquad'):
+        lfilter = sig.lfilter
+    else:
+        raise ValueError(
+            f'{filter_type} is not supported. Use either fir or iir')
+
+    if zi is not None:
+        return lfilter(ba[0], a=ba[1], x=time_data, zi=zi, axis=0)
+    if zero_phase:
+        return sig.filtfilt(b=ba[0], a=ba[1], x=time_data, axis=0), None
+    return lfilter(ba[0], a=ba[1], x=time_data, axis=0), None
+
+
 def _filter_on_signal(signal: Signal, sos, channels=None,
                       zi=None, zero_phase: bool = False,
                       warning_on_complex_output: bool = True):
@@ -238,9 +310,6 @@ def _filter_on_signal(signal: Signal, sos, channels=None,
         None if passed zi was None.
 
     """
-    # Time Data
-    new_time_data = signal.time_data
-
     # zi unpacking
     if zi is not None:
         zi = np.moveaxis(np.asarray(zi), 0, -1)
@@ -250,41 +319,27 @@ def _filter_on_signal(signal: Signal, sos, channels=None,
         channels = np.arange(signal.number_of_channels)
 
     # Filtering
-    if zi is not None:
-        y, zi[:, :, channels] = \
-            sig.sosfilt(
-                sos, signal.time_data[:, channels],
-                zi=zi[:, :, channels], axis=0)
-    else:
-        if zero_phase:
-            y = sig.sosfiltfilt(sos, signal.time_data[:, channels], axis=0)
-        else:
-            y = sig.sosfilt(sos, signal.time_data[:, channels], axis=0)
-
-    # Check for complex output
-    if np.iscomplexobj(y):
-        if warning_on_complex_output:
-            warn('Filter output is complex. Imaginary part is saved in ' +
-                 'Signal as time_data_imaginary')
-        new_time_data = new_time_data.astype('cfloat')
-
-    # Create new signal
-    new_time_data[:, channels] = y
-    new_signal = signal.copy()
-    new_signal.time_data = new_time_data
+    y, zf = _filter_array(
+        signal.time_data_view[:, channels], sos=sos,
+        zi=None if zi is None else zi[:, :, channels], zero_phase=zero_phase)
+    new_signal = _signal_with_filtered_channels(
+        signal, y, channels, warning_on_complex_output)
 
     # zi packing
     if zi is not None:
+        zi[:, :, channels] = zf
         zi_new = []
         for n in range(signal.number_of_channels):
             zi_new.append(zi[:, :, n])
+        return new_signal, zi_new
     return new_signal, zi
 
 
 def _filter_on_signal_ba(signal: Signal, ba, channels=None,
                          zi: list = None, zero_phase: bool = False,
                          filter_type: str = 'iir',
-                         warning_on_complex_output: bool = True):
+                         warning_on_complex_output: bool = True,
+                         partition_size_samples: int = None):
     """Takes in a `Signal` object and filters selected channels. Exports a new
     `Signal` object.
 
@@ -311,6 +366,10 @@ def _filter_on_signal_ba(signal: Signal, ba, channels=None,
     warning_on_complex_output: bool, optional
         When `True`, there is a warning when the output is complex. Either way,
         only the real part is regarded. Default: `True`.
+    partition_size_samples : int, optional
+        When not `None`, FIR filters are applied with a uniformly partitioned
+        convolution with this partition size. This is not used with zi's or
+        zero-phase filtering. Default: `None`.
 
     Returns
     -------
@@ -320,19 +379,6 @@ def _filter_on_signal_ba(signal: Signal, ba, channels=None,
         None if passed zi was None.
 
     """
-    # Take lfilter function, might be a different one depending if filter is
-    # FIR or IIR
-    if filter_type == 'fir':
-        lfilter = _lfilter_fir
-    elif filter_type in ('iir', 'biquad'):
-        lfilter = sig.lfilter
-    else:
-        raise ValueError(
-            f'{filter_type} is not supported. Use either fir or iir')
-
-    # Time Data
-    new_time_data = signal.time_data
-
     # zi unpacking
     if zi is not None:
         zi = np.asarray(zi).T
@@ -342,41 +388,49 @@ def _filter_on_signal_ba(signal: Signal, ba, channels=None,
         channels = np.arange(signal.number_of_channels)
 
     # Filtering
+    y, zf = _filter_array(
+        signal.time_data_view[:, channels], ba=ba,
+        zi=None if zi is None else zi[:, channels], zero_phase=zero_phase,
+        filter_type=filter_type,
+        partition_size_samples=partition_size_samples)
+    new_signal = _signal_with_filtered_channels(
+        signal, y, channels, warning_on_complex_output)
+
+    # zi packing
     if zi is not None:
-        y, zi[:, channels] = lfilter(
-                ba[0], a=ba[1], x=signal.time_data[:, channels],
-                zi=zi[:, channels], axis=0)
-    else:
-        if zero_phase:
-            y = sig.filtfilt(
-                b=ba[0], a=ba[1], x=signal.time_data[:, channels], axis=0)
-        else:
-            y = lfilter(
-                ba[0], a=ba[1], x=signal.time_data[:, channels], axis=0)
+        zi[:, channels] = zf
+        zi_new = []
+        for n in range(zi.shape[1]):
+            zi_new.append(zi[:, n])
+        return new_signal, zi_new
+    return new_signal, zi
+
 
+def _signal_with_filtered_channels(signal: Signal, y: np.ndarray, channels,
+                                   warning_on_complex_output: bool) -> Signal:
+    """Returns a copy of `signal` where the selected channels are replaced by
+    their filtered time data `y`.
+
+    """
     # Check for complex output
+    new_time_data = signal.time_data
     if np.iscomplexobj(y):
         if warning_on_complex_output:
             warn('Filter output is complex. Imaginary part is saved in ' +
                  'Signal as time_data_imaginary')
-        new_time_data = new_time_data.astype('cfloat')
+        new_time_data = new_time_data.astype(_complex_dtype(new_time_data))
 
     # Create new signal
     new_time_data[:, channels] = y
-    new_signal = signal.copy()
+    new_signal = signal.copy(with_time_data=False)
     new_signal.time_data = new_time_data
-
-    # zi packing
-    if zi is not None:
-        zi_new = []
-        for n in range(zi.shape[1]):
-            zi_new.append(zi[:, n])
-    return new_signal, zi
+    return new_signal
 
 
 def _filterbank_on_signal(signal: Signal, filters, activate_zi: bool = False,
                           mode: str = 'parallel', zero_phase: bool = False,
-                          same_sampling_rate: bool = True):
+                          same_sampling_rate: bool = True,
+                          workers: int = None):
     """Applies filter bank on a given signal.
 
     Parameters
@@ -397,6 +451,10 @@ def _filterbank_on_signal(signal: Signal, filters, activate_zi: bool = False,
     same_sampling_rate : bool, optional
         When `True`, the output MultiBandSignal (parallel filtering) has
         same sampling rate for all bands. Default: `True`.
+    workers : int, optional
+        Number of threads for filtering the bands in `'parallel'` and
+        `'summed'` mode. Negative values wrap around the number of CPUs.
+        `None` filters all bands in the calling thread. Default: `None`.
 
     Returns
     -------
@@ -405,34 +463,191 @@ def _filterbank_on_signal(signal: Signal, filters, activate_zi: bool = False,
 
     """
     n_filt = len(filters)
+    if mode == 'sequential':
+        # Filtering does not modify the input signal
+        out_sig = signal
+        for n in range(n_filt):
+            out_sig = \
+                filters[n].filter_signal(
+                    out_sig, activate_zi=activate_zi, zero_phase=zero_phase)
+        return out_sig
+
+    time_data = signal.time_data_view
+    outputs = _map_in_threads(
+        lambda f: _filter_time_data(f, time_data, activate_zi, zero_phase),
+        filters, workers)
+
     if mode == 'parallel':
+        # All bands are written into one array (bands, time, channels)
+        for n, y in enumerate(outputs):
+            if n == 0:
+                new_time_data = np.empty((n_filt, *y.shape), dtype=y.dtype)
+            elif np.iscomplexobj(y) and not np.iscomplexobj(new_time_data):
+                new_time_data = new_time_data.astype(y.dtype)
+            new_time_data[n] = y
         ss = []
         for n in range(n_filt):
-            ss.append(
-                filters[n].filter_signal(
-                    signal, activate_zi=activate_zi, zero_phase=zero_phase))
+            band = signal.copy(with_time_data=False)
+            band.time_data = new_time_data[n]
+            ss.append(band)
         out_sig = MultiBandSignal(
             ss, same_sampling_rate=same_sampling_rate)
-    elif mode == 'sequential':
-        out_sig = signal.copy()
-        for n in range(n_filt):
-            out_sig = \
-                filters[n].filter_signal(
-                    out_sig, activate_zi=activate_zi, zero_phase=zero_phase)
     else:
-        new_time_data = \
-            np.zeros((signal.time_data.shape[0],
-                      signal.number_of_channels, n_filt))
-        for n in range(n_filt):
-            s = filters[n].filter_signal(
-                    signal, activate_zi=activate_zi, zero_phase=zero_phase)
-            new_time_data[:, :, n] = s.time_data
-        new_time_data = np.sum(new_time_data, axis=-1)
-        out_sig = signal.copy()
+        # Bands are accumulated as soon as they are available
+        for n, y in enumerate(outputs):
+            if n == 0:
+                new_time_data = y.copy()
+            elif np.iscomplexobj(y) and not np.iscomplexobj(new_time_data):
+                new_time_data = new_time_data + y
+            else:
+                new_time_data += y
+        out_sig = signal.copy(with_time_data=False)
         out_sig.time_data = new_time_data
     return out_sig
 
 
+def _filter_time_data(filt, time_data: np.ndarray, activate_zi: bool = False,
+                      zero_phase: bool = False) -> np.ndarray:
+    """Filters all channels of time data with shape (time samples, channels)
+    with a `Filter` without creating any `Signal`. If `activate_zi=True`, the
+    zi's of the filter must have been initialized for the number of channels
+    and they are updated.
+
+    """
+    zi = filt.zi if activate_zi else None
+    if hasattr(filt, 'sos'):
+        y, zf = _filter_array(
+            time_data, sos=filt.sos, zero_phase=zero_phase,
+            zi=None if zi is None else np.moveaxis(np.asarray(zi), 0, -1))
+        if zf is not None:
+            filt.zi = [zf[:, :, n] for n in range(zf.shape[-1])]
+    else:
+        partition_size_samples = filt.partition_size_samples if \
+            getattr(filt, 'fir_engine', 'convolution') == 'partitioned' \
+            else None
+        y, zf = _filter_array(
+            time_data, ba=filt.ba, zero_phase=zero_phase,
+            zi=None if zi is None else np.asarray(zi).T,
+            filter_type=filt.filter_type,
+            partition_size_samples=partition_size_samples)
+        if zf is not None:
+            filt.zi = [zf[:, n] for n in range(zf.shape[-1])]
+
+    if np.iscomplexobj(y) and filt.warning_if_complex:
+        warn('Filter output is complex. Imaginary part is saved in ' +
+             'Signal as time_data_imaginary')
+    return y
+
+
+def _map_in_threads(function, items: list, workers: int = None):
+    """Generator that yields `function(item)` for all items in order. When
+    `workers` is not `None`, the items are processed by a pool of threads
+    (in batches of the number of workers to bound the memory of the results
+    that are waiting). This is useful for functions that release the GIL,
+    e.g., `scipy.signal.sosfilt`.
+
+    """
+    if workers is not None and workers < 0:
+        workers = max(1, os.cpu_count() + 1 + workers)
+    if workers is None or workers == 1 or len(items) < 2:
+        for item in items:
+            yield function(item)
+        return
+    assert workers > 0, 'Number of workers must be positive'
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for start in range(0, len(items), workers):
+            yield from executor.map(function, items[start:start+workers])
+
+
+def _fuse_filters(filters: list) -> tuple[dict, list]:
+    """Combines a chain of filters that are applied sequentially into the
+    coefficients of a single filter. FIR filters are convolved into one
+    kernel when all filters are FIR. Otherwise, all filters are stacked into
+    one SOS matrix (FIR filters in it can have at most order 2). The zi's are
+    combined as well if all filters have them for the same number of
+    channels.
+
+    Parameters
+    ----------
+    filters : list
+        List with `Filter` objects in order of application.
+
+    Returns
+    -------
+    coefficients : dict
+        Dictionary with the key `'ba'` or `'sos'` and the fused coefficients.
+    zi : list
+        Combined zi's (one per channel) or `None` if they are not available.
+
+    """
+    use_zi = all([hasattr(f, 'zi') for f in filters]) and \
+        len(set([len(f.zi) for f in filters])) == 1
+    number_channels = len(filters[0].zi) if use_zi else 0
+
+    # Only FIR filters -> single kernel
+    if all([not hasattr(f, 'sos') and f.filter_type == 'fir'
+            for f in filters]):
+        b = np.ones(1)
+        zi = np.zeros((0, number_channels))
+        for f in filters:
+            b_filt = np.atleast_1d(np.squeeze(f.ba[0])) / f.ba[1][0]
+            # The future output due to past samples of the chain passes
+            # through the next filter
+            new_zi = np.zeros(
+                (len(b) + len(b_filt) - 2, number_channels),
+                dtype=np.result_type(zi, b_filt))
+            if len(zi) > 0 and len(b_filt) > 0:
+                new_zi += sig.convolve(zi, b_filt[..., None])
+            if use_zi:
+                new_zi[:len(b_filt) - 1] += np.asarray(f.zi).T
+            zi = new_zi
+            b = np.convolve(b, b_filt)
+        zi = [zi[:, n] for n in range(number_channels)] if use_zi else None
+        return dict(ba=[b, np.ones(1)]), zi
+
+    # SOS cascade
+    sos, zi = [], []
+    for f in filters:
+        if hasattr(f, 'sos'):
+            sos_filt = np.atleast_2d(f.sos)
+            zi_filt = np.moveaxis(np.asarray(f.zi), 0, -1) if use_zi \
+                else None
+        else:
+            b, a = np.atleast_1d(f.ba[0]), np.atleast_1d(f.ba[1])
+            order = max(len(b), len(a)) - 1
+            if order <= 2:
+                # A single section has the same states as lfilter
+                sos_filt = np.zeros((1, 6), dtype=np.result_type(b, a, 1.))
+                sos_filt[0, :len(b)] = b / a[0]
+                sos_filt[0, 3:3+len(a)] = a / a[0]
+                zi_filt = None
+                if use_zi:
+                    zi_filt = np.zeros(
+                        (1, 2, number_channels),
+                        dtype=np.result_type(*f.zi, 1.))
+                    zi_filt[0, :order] = np.asarray(f.zi).T
+            else:
+                # Factorizing an FIR into sections (roots of its
+                # polynomial) is numerically unreliable
+                assert f.filter_type != 'fir', \
+                    'FIR filters with order above 2 cannot be fused with ' +\
+                    'IIR filters. Apply them separately'
+                sos_filt = sig.tf2sos(b, a)
+                zi_filt = None
+        sos.append(sos_filt)
+        zi.append(zi_filt)
+    sos = np.concatenate(sos, axis=0)
+
+    if use_zi and any([z is None for z in zi]):
+        warn('zi values of filters that are not given as second-order ' +
+             'sections cannot be fused. The new filter has no zi values')
+        use_zi = False
+    if not use_zi:
+        return dict(sos=sos), None
+    zi = np.concatenate(zi, axis=0)
+    return dict(sos=sos), [zi[:, :, n] for n in range(number_channels)]
+
+
 def _lfilter_fir(b: np.ndarray, a: np.ndarray, x: np.ndarray,
                  zi: np.ndarray = None, axis: int = 0):
     """Variant to the `scipy.signal.lfilter` that uses `scipy.signal.convolve`
@@ -465,13 +680,14 @@ def _lfilter_fir(b: np.ndarray, a: np.ndarray, x: np.ndarray,
     assert x.ndim == 2, \
         'Filtering only works on 2D-arrays'
 
-    # Convolving
+    # Convolving (in the precision of the data)
+    b = b.astype(_complex_dtype(x) if np.iscomplexobj(b) else _float_dtype(x))
     y = sig.convolve(x, b[..., None], mode='full')
 
     # Use zi's and take zf's
     if zi is not None:
         y[:zi.shape[0], :] += zi
-        zf = y[-zi.shape[0]:, :]
+        zf = y[x.shape[0]:, :]
 
     # Trim output
     y = y[:x.shape[0], :]
@@ -480,83 +696,54 @@ def _lfilter_fir(b: np.ndarray, a: np.ndarray, x: np.ndarray,
     return y, zf
 
 
-def _filter_and_downsample(time_data: np.ndarray, down_factor: int,
-                           ba_coefficients: list, polyphase: bool) \
-        -> np.ndarray:
-    """Filters and downsamples time data. If polyphase is `True`, it is
-    assumed that the filter is FIR and only b-coefficients are used. In
-    that case, an efficient downsampling is done, otherwise standard filtering
-    and downsampling is applied.
-
-    NOTE: There must be a bug with this implementation because it is not
-    exactly the same output as when one uses normal filtering or
-    `scipy.signal.resample_poly`. Perceptually there is no difference between
-    the two results, though.
-
-    Parameters
-    ----------
-    time_data : `np.ndarray`
-        Time data to be filtered and resampled. Shape should be (time samples,
-        channels).
-    down_factor : int
-        Factor by which it will be downsampled.
-    ba_coefficients : list
-        List containing [b, a] coefficients. If polyphase is set to `True`,
-        only b coefficients are regarded.
-    polyphase : bool
-        Use polyphase representation or not.
-
-    Returns
-    -------
-    new_time_data : `np.ndarray`
-        New time data with downsampling.
+def _lfilter_fir_partitioned(b: np.ndarray, a: np.ndarray, x: np.ndarray,
+                             axis: int = 0,
+                             partition_size_samples: int = 1024):
+    """Variant of `_lfilter_fir` that uses a uniformly partitioned
+    convolution. Only the first axis is used and no zi's are supported.
 
     """
-    if time_data.ndim == 1:
-        time_data = time_data[..., None]
-    assert time_data.ndim == 2, \
-        'Shape for time data should be (time samples, channels)'
-
-    if polyphase:
-        poly, _ = _polyphase_decomposition(time_data, down_factor, flip=False)
-        # (time samples, polyphase components, channels)
-        # Polyphase representation of filter and filter length
-        b = ba_coefficients[0]
-        half_length = (len(b) - 1) // 2
-        b_poly, _ = _polyphase_decomposition(b, down_factor, flip=True)
-        new_time_data = np.zeros(
-            (poly.shape[0]+b_poly.shape[0]-1, poly.shape[2]))
-        # Accumulator for each channel – it would be better to find a way
-        # to do it without loops, but using scipy.signal.convolve since it
-        # is advantageous compared to numpy.convolve
-        for ch in range(poly.shape[2]):
-            temp = np.zeros(new_time_data.shape[0])
-            for n in range(poly.shape[1]):
-                temp += sig.convolve(
-                    poly[:, n, ch], b_poly[:, n, 0], mode='full')
-            new_time_data[:, ch] = temp
-        # Take correct values from vector
-        new_time_data = \
-            new_time_data[
-                half_length//down_factor:-half_length//down_factor, :]
-    else:
-        new_time_data = sig.lfilter(
-            ba_coefficients[0], ba_coefficients[1], x=time_data, axis=0)
-        new_time_data = new_time_data[::down_factor]
-
-    return new_time_data
+    assert len(a) == 1, \
+        f'{a} is not valid. It has to be 1 in order to be a valid FIR filter'
+    if x.ndim < 2:
+        return _lfilter_fir_partitioned(
+            b, a, x[..., None], partition_size_samples=partition_size_samples
+            )[..., 0]
+    return PartitionedConvolver(
+        b, partition_size_samples, x.shape[1]).process(x)
 
 
-def _filter_and_upsample(time_data: np.ndarray, up_factor: int,
-                         ba_coefficients: list, polyphase: bool):
-    """Filters and upsamples time data. If polyphase is `True`, it is
-    assumed that the filter is FIR and only b-coefficients are used. In
-    that case, an efficient polyphase upsampling is done, otherwise standard
-    upsampling and filtering is applied.
+def _get_block_state(filt, x: np.ndarray) -> np.ndarray:
+    """Returns zero initial states for block processing of `x` with shape
+    (time samples, channels) with a filter. They have the shape needed by
+    `sosfilt` (sections, 2, channels) or `lfilter` (order, channels) along
+    the first axis. For FIR filters with the partitioned engine, a
+    `PartitionedConvolver` is returned.
 
-    NOTE: The polyphase implementation uses two loops: once for the polyphase
-    components and once for the channels. Hence, it might not be much faster
-    than usual filtering.
+    """
+    dtype = np.result_type(x, np.float64)
+    if filt.filter_type == 'fir' and not hasattr(filt, 'sos') and \
+            filt.fir_engine == 'partitioned':
+        return PartitionedConvolver(
+            filt.ba[0], filt.partition_size_samples, x.shape[1])
+    if hasattr(filt, 'sos'):
+        return np.zeros((len(filt.sos), 2, x.shape[1]), dtype=dtype)
+    order = max(len(filt.ba[0]), len(filt.ba[1])) - 1
+    return np.zeros((order, x.shape[1]), dtype=dtype)
+
+
+def _filter_and_resample(time_data: np.ndarray, up_factor: int,
+                         down_factor: int, ba_coefficients: list,
+                         polyphase: bool) -> np.ndarray:
+    """Upsamples, filters and downsamples time data by a rational factor.
+    The filter works at the intermediate sampling rate.
+
+    If polyphase is `True`, it is assumed that the filter is FIR and only
+    b-coefficients are used. All channels are then resampled at once with
+    `scipy.signal.resample_poly`, using the filter as window (including the
+    gain of `up_factor`) and zero padding. Its delay is compensated.
+    Otherwise, the signal is upsampled with zeros, filtered (causal) and
+    downsampled.
 
     Parameters
     ----------
@@ -565,6 +752,8 @@ def _filter_and_upsample(time_data: np.ndarray, up_factor: int,
         channels).
     up_factor : int
         Factor by which it will be upsampled.
+    down_factor : int
+        Factor by which it will be downsampled.
     ba_coefficients : list
         List containing [b, a] coefficients. If polyphase is set to `True`,
         only b coefficients are regarded.
@@ -574,44 +763,27 @@ def _filter_and_upsample(time_data: np.ndarray, up_factor: int,
     Returns
     -------
     new_time_data : `np.ndarray`
-        New time data with downsampling.
+        Resampled time data with length
+        `ceil(time samples * up_factor / down_factor)`.
 
     """
     if time_data.ndim == 1:
         time_data = time_data[..., None]
     assert time_data.ndim == 2, \
         'Shape for time data should be (time samples, channels)'
+    assert up_factor > 0 and down_factor > 0, \
+        'Resampling factors must be positive integers'
 
     if polyphase:
-        b = ba_coefficients[0]
-        half_length = (len(b) - 1) // 2
-
-        # Decompose filter
-        b_poly, padding = _polyphase_decomposition(b, up_factor)
-        b_poly *= up_factor
-
-        # Accumulator – Length is not right!
-        new_time_data = np.zeros(
-            ((time_data.shape[0] + b_poly.shape[0] - 1)*up_factor,
-             time_data.shape[1]))
-
-        # Interpolate per channel and per polyphase component – should be
-        # a better way to do it without the loops...
-        for ch in range(time_data.shape[1]):
-            for ind in range(up_factor):
-                new_time_data[ind::up_factor, ch] = sig.convolve(
-                        time_data[:, ch], b_poly[:, ind, 0], mode='full')
-
-        # Take right samples from filtered signal
-        if padding == up_factor:
-            new_time_data = new_time_data[half_length:-half_length, :]
-        else:
-            new_time_data = \
-                new_time_data[half_length+padding:-half_length+padding, :]
+        new_time_data = sig.resample_poly(
+            time_data, up_factor, down_factor, axis=0,
+            window=np.squeeze(ba_coefficients[0]), padtype='constant')
     else:
         new_time_data = np.zeros(
-            (time_data.shape[0]*up_factor, time_data.shape[1]))
+            (time_data.shape[0]*up_factor, time_data.shape[1]),
+            dtype=time_data.dtype)
         new_time_data[::up_factor] = time_data
         new_time_data = sig.lfilter(
-            ba_coefficients[0], ba_coefficients[1], x=new_time_data, axis=0)
-    return new_time_data
+            ba_coefficients[0], ba_coefficients[1], x=new_time_data,
+            axis=0)[::down_factor]
+    return new_time_data.astype(_float_dtype(time_data), copy=False)
@@ -0,0 +1,160 @@
+"""
+Uniformly partitioned convolution for long FIR filters
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .._fft import rfft, irfft, next_fast_len
+from .._config import _float_dtype
+
+
+class PartitionedConvolver():
+    """Uniformly partitioned overlap-save convolution (UPOLS) with a
+    frequency-domain delay line. The filter is split into partitions of equal
+    length whose spectra are computed only once. The signal can be passed in
+    blocks of arbitrary length and the output is exactly the same as
+    filtering the whole signal at once (with zero initial states).
+
+    """
+    def __init__(self, b: np.ndarray, partition_size_samples: int = 1024,
+                 number_of_channels: int = 1,
+                 max_chunk_bytes: int = 2**27):
+        """Constructor of the partitioned convolution.
+
+        Parameters
+        ----------
+        b : `np.ndarray`
+            Real FIR filter coefficients.
+        partition_size_samples : int, optional
+            Length of each partition of the filter. It is also the length of
+            the blocks in which the signal is processed, so that the
+            computational effort and memory do not depend on the length of the
+            signal. Default: 1024.
+        number_of_channels : int, optional
+            Number of channels that are filtered in parallel. Default: 1.
+        max_chunk_bytes : int, optional
+            Approximate upper bound for the memory of the spectra of the
+            blocks that are processed at once. Default: 2**27 (128 MB).
+
+        References
+        ----------
+        - Wefers, F. (2015). Partitioned convolution algorithms for real-time
+          auralization.
+
+        """
+        b = np.squeeze(b)
+        assert b.ndim == 1, 'FIR Filters for audio must be 1D-arrays'
+        assert not np.iscomplexobj(b), \
+            'Partitioned convolution is only supported for real filters'
+        assert partition_size_samples > 0, \
+            'Partition size must be positive'
+        assert number_of_channels > 0, \
+            'There must be at least one channel'
+        self.partition_size_samples = int(partition_size_samples)
+        self.number_of_channels = number_of_channels
+
+        # Transform length can be longer than twice the partition size since
+        # only the last samples of each transformed frame are valid anyway
+        block = self.partition_size_samples
+        self.fft_length = next_fast_len(2*block)
+        number_partitions = int(np.ceil(len(b) / block))
+        partitions = np.zeros((number_partitions*block))
+        partitions[:len(b)] = b
+        partitions = partitions.reshape(number_partitions, block)
+        self.__partitions_spectra = rfft(
+            partitions, n=self.fft_length, axis=1)[..., None]
+        # Spectra, output spectra and output of each block
+        bytes_per_block = number_of_channels * \
+            (3*16*(self.fft_length//2+1) + 8*self.fft_length)
+        self.__blocks_per_chunk = max(1, max_chunk_bytes // bytes_per_block)
+        self.reset()
+
+    @property
+    def number_of_partitions(self) -> int:
+        return self.__partitions_spectra.shape[0]
+
+    def reset(self):
+        """Sets all states to zero.
+
+        """
+        number_bins = self.fft_length//2 + 1
+        # Input samples that precede the current block
+        self.__input_history = np.zeros(
+            (self.fft_length - self.partition_size_samples,
+             self.number_of_channels))
+        # Frequency-domain delay line with the spectra of the previous blocks
+        self.__fdl = np.zeros(
+            (self.number_of_partitions - 1, number_bins,
+             self.number_of_channels), dtype='cfloat')
+        # Samples of the current (incomplete) block. Their output has been
+        # already returned
+        self.__pending = np.zeros((0, self.number_of_channels))
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        """Filters the next block of the signal.
+
+        Parameters
+        ----------
+        x : `np.ndarray`
+            Time data with shape (time samples, channels). Its length is
+            arbitrary.
+
+        Returns
+        -------
+        y : `np.ndarray`
+            Filtered time data with the same shape as the input.
+
+        """
+        assert x.ndim == 2 and x.shape[1] == self.number_of_channels, \
+            'Time data must have shape (time samples, channels) with ' +\
+            'the number of channels of the convolver'
+        y = np.zeros(x.shape, dtype=np.result_type(_float_dtype(x), x))
+        chunk_samples = self.__blocks_per_chunk*self.partition_size_samples
+        for start in range(0, len(x), chunk_samples):
+            chunk = x[start:start+chunk_samples]
+            y[start:start+len(chunk)] = self.__process_chunk(chunk)
+        return y
+
+    def __process_chunk(self, x: np.ndarray) -> np.ndarray:
+        """Filters a chunk of time data and updates all states.
+
+        """
+        block = self.partition_size_samples
+        number_partitions = self.number_of_partitions
+
+        already_returned = len(self.__pending)
+        new_samples = np.concatenate([self.__pending, x], axis=0)
+        complete_blocks = len(new_samples) // block
+        remainder = len(new_samples) - complete_blocks*block
+
+        # Frames with the previous samples and each block. The incomplete
+        # last block is zero-padded and it is not saved in the states
+        number_blocks = complete_blocks + (remainder > 0)
+        data = np.concatenate(
+            [self.__input_history, new_samples,
+             np.zeros((number_blocks*block - len(new_samples),
+                       self.number_of_channels))], axis=0)
+        frames = sliding_window_view(
+            data, self.fft_length, axis=0)[::block][:number_blocks]
+        spectra = rfft(frames, axis=-1)
+        # Shape (blocks, frequency, channels)
+        spectra = np.moveaxis(spectra, -1, 1)
+
+        # Convolution of the spectra along the blocks with the partitions
+        delay_line = np.concatenate([self.__fdl, spectra], axis=0)
+        output_spectra = np.zeros_like(spectra)
+        for p in range(number_partitions):
+            output_spectra += self.__partitions_spectra[p] * \
+                delay_line[number_partitions-1-p:
+                           number_partitions-1-p+number_blocks]
+        output = irfft(output_spectra, n=self.fft_length, axis=1)
+        output = output[:, -block:, :].reshape(-1, self.number_of_channels)
+
+        # Update states with complete blocks
+        self.__fdl = delay_line[complete_blocks:
+                                complete_blocks+number_partitions-1].copy()
+        self.__input_history = data[complete_blocks*block:
+                                    complete_blocks*block +
+                                    self.fft_length - block].copy()
+        self.__pending = new_samples[complete_blocks*block:].copy()
+        return output[already_returned:len(new_samples)]
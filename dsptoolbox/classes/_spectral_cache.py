@@ -0,0 +1,130 @@
+"""
+Cache for spectral representations of signals
+"""
+from collections import OrderedDict
+import numpy as np
+
+
+class SpectralCache():
+    """Least-recently-used cache for spectra, cross-spectral matrices and
+    spectrograms. Entries are keyed by the full set of parameters that were
+    used to compute them and the cache is bounded by the total amount of bytes
+    of the saved arrays.
+
+    """
+    def __init__(self, max_bytes: int = 2**28):
+        """Constructor of the spectral cache.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Maximum number of bytes that the saved arrays can occupy. When
+            exceeded, the least recently used entries are discarded. Pass 0
+            to deactivate caching. Default: 2**28 (256 MB).
+
+        """
+        self.max_bytes = max_bytes
+        self.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, new_max_bytes: int):
+        assert new_max_bytes >= 0, \
+            'Maximum number of bytes must be a non-negative integer'
+        self.__max_bytes = int(new_max_bytes)
+        if hasattr(self, '_SpectralCache__entries'):
+            self.__evict()
+
+    @property
+    def current_bytes(self) -> int:
+        return sum(self.__entry_bytes.values())
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @staticmethod
+    def make_key(kind: str, parameters: dict, *args) -> tuple:
+        """Returns a hashable key for a kind of computation (e.g.
+        `'spectrum'`) and its parameters. Further hashable arguments that
+        determine the result (e.g. sampling rate) can be passed.
+
+        """
+        return (kind, *args, *sorted(parameters.items()))
+
+    def get(self, key: tuple):
+        """Returns the saved entry or `None` if it is not in the cache.
+
+        """
+        if key in self.__entries:
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return self.__entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple, value: tuple):
+        """Saves a new entry (a tuple of arrays). If it alone exceeds the
+        maximum number of bytes, it is not saved.
+
+        """
+        self.pop(key)
+        nbytes = sum([v.nbytes for v in value if type(v) == np.ndarray])
+        if nbytes > self.max_bytes:
+            return
+        self.__entries[key] = value
+        self.__entry_bytes[key] = nbytes
+        self.__evict()
+
+    def entries(self) -> list:
+        """Returns a list with all (key, value) pairs. The least recently used
+        entries come first. Hit and miss counters are not modified.
+
+        """
+        return list(self.__entries.items())
+
+    def update_entry(self, key: tuple, value: tuple):
+        """Replaces the value of an existing entry without changing its
+        position in the cache.
+
+        """
+        assert key in self.__entries, 'Entry does not exist'
+        self.__entries[key] = value
+        self.__entry_bytes[key] = \
+            sum([v.nbytes for v in value if type(v) == np.ndarray])
+        self.__evict()
+
+    def pop(self, key: tuple):
+        """Removes an entry (if it exists).
+
+        """
+        self.__entries.pop(key, None)
+        self.__entry_bytes.pop(key, None)
+
+    def clear(self):
+        """Removes all entries. Hit and miss counters are kept.
+
+        """
+        self.__entries = OrderedDict()
+        self.__entry_bytes = {}
+
+    def info(self) -> dict:
+        """Returns a dictionary with the state of the cache.
+
+        """
+        return dict(hits=self.hits, misses=self.misses,
+                    entries=len(self), current_bytes=self.current_bytes,
+                    max_bytes=self.max_bytes)
+
+    def __evict(self):
+        """Discards least recently used entries until the cache fits into the
+        maximum number of bytes.
+
+        """
+        while self.current_bytes > self.max_bytes:
+            key = next(iter(self.__entries))
+            self.pop(key)
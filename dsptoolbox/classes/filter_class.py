@@ -14,11 +14,14 @@ from .signal_class import Signal
 from ._filter import (_biquad_coefficients, _impulse,
                       _group_delay_filter, _get_biquad_type,
                       _filter_on_signal, _filter_on_signal_ba,
-                      _filter_and_downsample,
-                      _filter_and_upsample)
+                      _filter_and_resample, _filter_array,
+                      _get_block_state)
+from ._partitioned_convolution import PartitionedConvolver
+from ._spectral_cache import SpectralCache
 from ._plots import _zp_plot
 from ..plots import general_plot
 from .._general_helpers import _check_format_in_path
+from .._config import _float_dtype
 
 
 class Filter():
@@ -111,11 +114,13 @@ class Filter():
             show_filter_parameters, plot_magnitude, plot_group_delay,
             plot_phase, plot_zp.
         Filtering
-            filter_signal, filter_and_resample_signal.
+            filter_signal, filter_and_resample_signal, process_block, reset,
+            set_fir_engine.
 
         """
         self.warning_if_complex = True
         self.sampling_rate_hz = sampling_rate_hz
+        self.set_fir_engine()
         if filter_configuration is None:
             filter_configuration = \
                 {'eq_type': 0, 'freqs': 1000, 'gain': 0, 'q': 1,
@@ -143,6 +148,45 @@ class Filter():
             for _ in range(number_of_channels):
                 self.zi.append(sig.lfilter_zi(self.ba[0], self.ba[1]))
 
+    def set_fir_engine(self, engine: str = 'convolution',
+                       partition_size_samples: int = 1024):
+        """Selects how FIR filters are applied in `filter_signal` and
+        `process_block`. It has no effect on IIR filters.
+
+        Parameters
+        ----------
+        engine : str {'convolution', 'partitioned'}, optional
+            `'convolution'` convolves the whole signal at once (fft or direct
+            convolution depending on the lengths). `'partitioned'` uses a
+            uniformly partitioned overlap-save convolution, which is
+            recommended for long filters and for processing blocks with low
+            latency. Filtering with zi's or zero-phase always uses the
+            standard convolution. Default: `'convolution'`.
+        partition_size_samples : int, optional
+            Length of the partitions of the filter for the partitioned
+            convolution. Computational effort and memory scale with it
+            instead of the length of the signal. A power of 2 is recommended.
+            Default: 1024.
+
+        """
+        engine = engine.lower()
+        assert engine in ('convolution', 'partitioned'), \
+            f'{engine} is not valid. Use convolution or partitioned'
+        assert partition_size_samples > 0, \
+            'Partition size must be positive'
+        self.fir_engine = engine
+        self.partition_size_samples = int(partition_size_samples)
+        self._block_state = None
+
+    def reset(self):
+        """Resets the filter states, i.e., the state of `process_block` and
+        the zi's used by `filter_signal` with `activate_zi=True`.
+
+        """
+        self._block_state = None
+        if hasattr(self, 'zi'):
+            del self.zi
+
     @property
     def sampling_rate_hz(self):
         return self.__sampling_rate_hz
@@ -243,7 +287,7 @@ class Filter():
             zi_old = None
 
         # Check filter length compared to signal
-        if self.info['order'] > signal.time_data.shape[0]:
+        if self.info['order'] > len(signal):
             warn('Filter is longer than signal, results might be ' +
                  'meaningless!')
 
@@ -258,7 +302,10 @@ class Filter():
                     zero_phase=zero_phase,
                     warning_on_complex_output=self.warning_if_complex)
         else:
-            # Filter with ba
+            # Filter with ba (FIR filters might use partitioned convolution)
+            partition_size_samples = self.partition_size_samples if \
+                getattr(self, 'fir_engine', 'convolution') == 'partitioned' \
+                else None
             new_signal, zi_new = \
                 _filter_on_signal_ba(
                     signal=signal,
@@ -267,21 +314,27 @@ class Filter():
                     zi=zi_old,
                     zero_phase=zero_phase,
                     filter_type=self.filter_type,
-                    warning_on_complex_output=self.warning_if_complex)
+                    warning_on_complex_output=self.warning_if_complex,
+                    partition_size_samples=partition_size_samples)
         if activate_zi:
             self.zi = zi_new
         return new_signal
 
     def filter_and_resample_signal(self, signal: Signal,
                                    new_sampling_rate_hz: int) -> Signal:
-        """Filters and resamples signal. This is only available for all
-        channels and sampling rates that are achievable by (only) down- or
-        upsampling. This method is for allowing specific filters to be
+        """Filters and resamples signal by a rational factor `up/down`. The
+        signal is upsampled, filtered and downsampled, so the sampling rate of
+        the filter must be the intermediate sampling rate, i.e., the one of
+        the signal for pure downsampling and the new one for pure upsampling.
+        This method is for allowing specific filters to be
         decimators/interpolators. If you just want to resample a signal,
         use the function in the standard module.
 
         If this filter is iir, standard resampling is applied. If it is
-        fir, an efficient polyphase representation will be used.
+        fir, an efficient polyphase representation will be used for all
+        channels at once and the filter delay is compensated. The result is
+        the same as `scipy.signal.resample_poly` with the filter coefficients
+        as window.
 
         NOTE: Beware that no additional lowpass filter is used in the
         resampling step which can lead to aliases or other effects if this
@@ -297,14 +350,15 @@ class Filter():
         Returns
         -------
         new_sig : `Signal`
-            New down- or upsampled signal.
+            New resampled signal.
 
         """
-        fraction = Fraction(
+        up_factor, down_factor = Fraction(
             new_sampling_rate_hz, signal.sampling_rate_hz).as_integer_ratio()
-        assert fraction[0] == 1 or fraction[1] == 1, \
-            f'{new_sampling_rate_hz} is not valid because it needs down- ' +\
-            f'AND upsampling (Up/Down: {fraction[0]}/{fraction[1]})'
+        assert signal.sampling_rate_hz*up_factor == self.sampling_rate_hz, \
+            'Sampling rates do not match. The sampling rate of the filter ' +\
+            'should be the one of the signal multiplied by the upsampling ' +\
+            f'factor ({up_factor})'
 
         # Check if standard or polyphase representation is to be used
         if self.filter_type == 'fir':
@@ -316,36 +370,70 @@ class Filter():
         else:
             raise ValueError('Wrong filter type for filtering and resampling')
 
-        # Check if down- or upsampling is required
-        if fraction[0] == 1:
-            assert signal.sampling_rate_hz == self.sampling_rate_hz, \
-                'Sampling rates do not match'
-            new_time_data = _filter_and_downsample(
-                time_data=signal.time_data,
-                down_factor=fraction[1],
-                ba_coefficients=self.ba,
-                polyphase=polyphase)
-        elif fraction[1] == 1:
-            assert signal.sampling_rate_hz*fraction[0] == \
-                self.sampling_rate_hz, \
-                'Sampling rates do not match. For the upsampler, the ' +\
-                '''sampling rate of the filter should match the output's'''
-            new_time_data = _filter_and_upsample(
-                time_data=signal.time_data,
-                up_factor=fraction[0],
-                ba_coefficients=self.ba,
-                polyphase=polyphase)
-
-        new_sig = signal.copy()
+        new_time_data = _filter_and_resample(
+            time_data=signal.time_data_view,
+            up_factor=up_factor,
+            down_factor=down_factor,
+            ba_coefficients=self.ba,
+            polyphase=polyphase)
+
+        new_sig = signal.copy(with_time_data=False)
         if hasattr(new_sig, 'window'):
             del new_sig.window
         new_sig.sampling_rate_hz = new_sampling_rate_hz
         new_sig.time_data = new_time_data
         return new_sig
 
+    def process_block(self, block: np.ndarray) -> np.ndarray:
+        """Filters a block of time data and keeps the filter states for the
+        next block, so that consecutive blocks are filtered as one continuous
+        signal. No `Signal` objects are created, which makes this suitable
+        for real-time or chunked processing. The states start from zero and
+        can be reset with `reset()`.
+
+        Parameters
+        ----------
+        block : `np.ndarray`
+            Time data with shape (time samples, channels) or (time samples).
+            The number of channels must remain the same for all blocks.
+
+        Returns
+        -------
+        `np.ndarray`
+            Filtered block with the same shape as the input.
+
+        """
+        x = block if block.ndim == 2 else block[:, None]
+        state = getattr(self, '_block_state', None)
+        if state is None:
+            state = _get_block_state(self, x)
+        partitioned = type(state) == PartitionedConvolver
+        assert (state.number_of_channels if partitioned else
+                state.shape[-1]) == x.shape[1], \
+            'Number of channels does not match the filter state. Use ' +\
+            'reset() before processing a different number of channels'
+
+        if partitioned:
+            y = state.process(x)
+            self._block_state = state
+        else:
+            y, self._block_state = _filter_array(
+                x, sos=getattr(self, 'sos', None),
+                ba=getattr(self, 'ba', None), zi=state,
+                filter_type=self.filter_type)
+
+        # Output has the precision of the input
+        if not np.iscomplexobj(y):
+            y = y.astype(_float_dtype(x), copy=False)
+        return y if block.ndim == 2 else y[:, 0]
+
     # ======== Setters ========================================================
     def set_filter_parameters(self, filter_type: str,
                               filter_configuration: dict):
+        # Coefficients of the previous parameters are discarded
+        for coefficients in ('ba', 'sos'):
+            if hasattr(self, coefficients):
+                delattr(self, coefficients)
         if filter_type == 'iir':
             if 'filter_design_method' not in filter_configuration:
                 filter_configuration['filter_design_method'] = 'butter'
@@ -418,6 +506,11 @@ class Filter():
             # Change filter type to 'fir' or 'iir' depending on coefficients
             self._check_and_update_filter_type()
 
+        # New coefficients invalidate the state of block processing and all
+        # cached representations and responses
+        self._block_state = None
+        self._response_cache = SpectralCache(2**24)
+
         # Update Metadata about the Filter
         self.info = filter_configuration
         self.info['sampling_rate_hz'] = self.sampling_rate_hz
@@ -479,9 +572,43 @@ class Filter():
                      capitalize()}: {self.info[k]}\n"""
         return txt
 
+    def _get_cached(self, key: tuple, compute) -> tuple:
+        """Returns a representation or response of the filter (tuple) from
+        the cache or computes and saves it. The cache is discarded whenever
+        the filter parameters are set. Cached arrays must not be modified.
+
+        """
+        # Filters saved without a cache
+        if getattr(self, '_response_cache', None) is None:
+            self._response_cache = SpectralCache(2**24)
+        value = self._response_cache.get(key)
+        if value is None:
+            value = compute()
+            if value is not None:
+                self._response_cache.put(key, value)
+        return value
+
+    def _get_ir_time_data(self, length_samples: int,
+                          zero_phase: bool = False) -> np.ndarray:
+        """Returns the (cached) time data of the impulse response with shape
+        (time samples, 1). It must not be modified.
+
+        """
+        def compute():
+            ir_filt = Signal(None, _impulse(length_samples),
+                             self.sampling_rate_hz, 'ir',
+                             constrain_amplitude=False)
+            ir_filt = self.filter_signal(ir_filt, zero_phase=zero_phase)
+            return (ir_filt.time_data_view, )
+        return self._get_cached(
+            ('ir', length_samples, self.sampling_rate_hz, zero_phase),
+            compute)[0]
+
     def get_ir(self, length_samples: int = 512, zero_phase: bool = False) \
             -> Signal:
-        """Gets an impulse response of the filter with given length.
+        """Gets an impulse response of the filter with given length. It is
+        computed only once for each length and saved until the filter
+        parameters change.
 
         Parameters
         ----------
@@ -494,14 +621,14 @@ class Filter():
             Impulse response of the filter.
 
         """
-        ir_filt = _impulse(length_samples)
-        ir_filt = Signal(None, ir_filt, self.sampling_rate_hz, 'ir',
-                         constrain_amplitude=False)
-        return self.filter_signal(ir_filt, zero_phase=zero_phase)
+        return Signal(
+            None, self._get_ir_time_data(length_samples, zero_phase).copy(),
+            self.sampling_rate_hz, 'ir', constrain_amplitude=False)
 
     def get_coefficients(self, mode: str = 'sos') -> list | np.ndarray | \
             tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Returns the filter coefficients.
+        """Returns the filter coefficients. Conversions between
+        representations are saved until the filter parameters change.
 
         Parameters
         ----------
@@ -518,51 +645,47 @@ class Filter():
             - `'zpk'`: tuple(z, p, k) with z, p, k of type `np.ndarray`
 
         """
-        if mode == 'sos':
-            if hasattr(self, 'sos'):
-                coefficients = self.sos.copy()
-            else:
-                if self.info['order'] > 500:
-                    inp = None
-                    while inp not in ('y', 'n'):
-                        inp = input(
-                            'This filter has a large order ' +
-                            f'''({self.info['order']}). Are you sure you ''' +
-                            'want to get sos? Computation might' +
-                            ' take long time. (y/n)')
-                        inp = inp.lower()
-                        if inp == 'y':
-                            break
-                        if inp == 'n':
-                            return None
-                coefficients = sig.tf2sos(self.ba[0], self.ba[1])
-        elif mode == 'ba':
-            if hasattr(self, 'sos'):
-                coefficients = sig.sos2tf(self.sos)
-            else:
-                coefficients = deepcopy(self.ba)
-        elif mode == 'zpk':
-            if hasattr(self, 'sos'):
-                coefficients = sig.sos2zpk(self.sos)
-            else:
-                # Check if filter is too long
-                if self.info['order'] > 500:
-                    inp = None
-                    while inp not in ('y', 'n'):
-                        inp = input(
-                            'This filter has a large order ' +
-                            f'''({self.info['order']}). Are you sure you ''' +
-                            'want to get zeros and poles? Computation might' +
-                            ' take long time. (y/n)')
-                        inp = inp.lower()
-                        if inp == 'y':
-                            break
-                        if inp == 'n':
-                            return None
-                coefficients = sig.tf2zpk(self.ba[0], self.ba[1])
-        else:
+        if mode not in ('sos', 'ba', 'zpk'):
             raise ValueError(f'{mode} is not valid. Use sos, ba or zpk')
-        return coefficients
+        if mode == 'sos' and hasattr(self, 'sos'):
+            return self.sos.copy()
+        if mode == 'ba' and not hasattr(self, 'sos'):
+            return deepcopy(self.ba)
+
+        coefficients = self._get_cached(
+            ('coefficients', mode), lambda: self._convert_coefficients(mode))
+        if coefficients is None:
+            return None
+        coefficients = deepcopy(coefficients)
+        return coefficients[0] if mode == 'sos' else coefficients
+
+    def _convert_coefficients(self, mode: str) -> tuple:
+        """Converts the coefficients to `'sos'`, `'ba'` or `'zpk'` and returns
+        them in a tuple. For long FIR filters, the conversion to sos or zpk
+        must be confirmed and `None` is returned when declined.
+
+        """
+        if mode == 'ba':
+            return tuple(sig.sos2tf(self.sos))
+        if mode == 'zpk' and hasattr(self, 'sos'):
+            return sig.sos2zpk(self.sos)
+        if self.info['order'] > 500:
+            inp = None
+            while inp not in ('y', 'n'):
+                inp = input(
+                    'This filter has a large order ' +
+                    f'''({self.info['order']}). Are you sure you ''' +
+                    'want to get ' +
+                    ('sos' if mode == 'sos' else 'zeros and poles') +
+                    '? Computation might take long time. (y/n)')
+                inp = inp.lower()
+                if inp == 'y':
+                    break
+                if inp == 'n':
+                    return None
+        if mode == 'sos':
+            return (sig.tf2sos(self.ba[0], self.ba[1]), )
+        return sig.tf2zpk(self.ba[0], self.ba[1])
 
     # ======== Plots and prints ===============================================
     def show_info(self):
@@ -645,13 +768,12 @@ class Filter():
             warn(f'length_samples ({length_samples}) is shorter than the ' +
                  f'''filter order {self.info['order']}. Length will be ''' +
                  'automatically extended.')
-        if hasattr(self, 'sos'):
-            ba = sig.sos2tf(self.sos)
-        else:
-            ba = self.ba
-        f, gd = \
-            _group_delay_filter(ba, length_samples, self.sampling_rate_hz)
-        gd *= 1e3
+        f, gd = self._get_cached(
+            ('group_delay', length_samples, self.sampling_rate_hz),
+            lambda: _group_delay_filter(
+                self.get_coefficients(mode='ba'), length_samples,
+                self.sampling_rate_hz))
+        gd = gd*1e3
         ymax = None
         ymin = None
         if any(abs(gd) > 50):
@@ -722,25 +844,11 @@ class Filter():
             Axes.
 
         """
-        # Ask explicitely if filter is very long
-        if self.info['order'] > 500:
-            inp = None
-            while inp not in ('y', 'n'):
-                inp = input(
-                    'This filter has a large order ' +
-                    f'''({self.info['order']}). Are you sure you want to''' +
-                    ' plot zeros and poles? Computation might take long ' +
-                    'time. (y/n)')
-                inp = inp.lower()
-                if inp == 'y':
-                    break
-                if inp == 'n':
-                    return None
-        #
-        if hasattr(self, 'sos'):
-            z, p, k = sig.sos2zpk(self.sos)
-        else:
-            z, p, k = sig.tf2zpk(self.ba[0], self.ba[1])
+        # Asks explicitely if filter is very long
+        zpk = self.get_coefficients(mode='zpk')
+        if zpk is None:
+            return None
+        z, p, k = zpk
         fig, ax = _zp_plot(z, p, returns=True)
         ax.text(0.75, 0.91, rf'$k={k:.1e}$', transform=ax.transAxes,
                 verticalalignment='top')
@@ -8,7 +8,7 @@ from matplotlib.axes import Axes
 from .signal_class import Signal
 from .multibandsignal import MultiBandSignal
 from .filter_class import Filter
-from ._filter import _filterbank_on_signal
+from ._filter import _filterbank_on_signal, _fuse_filters
 from ..generators import dirac
 from ..plots import general_plot
 from .._general_helpers import (
@@ -45,7 +45,8 @@ class FilterBank():
         Methods
         -------
         General
-            add_filter, remove_filter, swap_filters, copy, save_filterbank.
+            add_filter, remove_filter, swap_filters, copy, save_filterbank,
+            compile.
         Prints and plots
             plot_magnitude, plot_phase, plot_group_delay, show_info.
 
@@ -228,8 +229,8 @@ class FilterBank():
 
     # ======== Filtering ======================================================
     def filter_signal(self, signal: Signal, mode: str = 'parallel',
-                      activate_zi: bool = False, zero_phase: bool = False) -> \
-            Signal | MultiBandSignal:
+                      activate_zi: bool = False, zero_phase: bool = False,
+                      workers: int = None) -> Signal | MultiBandSignal:
         """Applies the filter bank to a signal and returns a multiband signal
         or a `Signal` object.
         `'parallel'`: returns a `MultiBandSignal` object where each band is
@@ -252,6 +253,11 @@ class FilterBank():
         zero_phase : bool, optional
             Activates zero_phase filtering for the filter bank. It cannot be
             used at the same time with `zi=True`. Default: `False`.
+        workers : int, optional
+            Number of threads that filter the bands concurrently in
+            `'parallel'` and `'summed'` mode. Negative values wrap around the
+            number of CPUs, i.e., -1 uses all cores. Pass `None` to filter
+            all bands in the calling thread. Default: `None`.
 
         Returns
         -------
@@ -288,7 +294,8 @@ class FilterBank():
             mode=mode,
             activate_zi=activate_zi,
             zero_phase=zero_phase,
-            same_sampling_rate=self.same_sampling_rate)
+            same_sampling_rate=self.same_sampling_rate,
+            workers=workers)
         return new_sig
 
     def filter_multiband_signal(self, mbsignal: MultiBandSignal,
@@ -330,7 +337,7 @@ class FilterBank():
             if len(self.filters[0].zi) != mbsignal.number_of_channels:
                 self.initialize_zi(mbsignal.number_of_channels)
 
-        new_sig = mbsignal.copy()
+        new_sig = mbsignal.copy(with_time_data=False)
 
         for n in range(mbsignal.number_of_bands):
             new_sig.bands[n] = self.filters[n].filter_signal(
@@ -338,6 +345,42 @@ class FilterBank():
                 zero_phase=zero_phase)
         return new_sig
 
+    def compile(self) -> Filter:
+        """Fuses all filters into a single `Filter` that is equivalent to
+        `'sequential'` filtering with the filter bank. IIR filters are stacked
+        into one cascade of second-order sections, so that the signal is
+        filtered in one pass. If all filters are FIR, their coefficients are
+        convolved into one kernel. The zi's of the filters (if all of them
+        were initialized) are combined into the zi's of the new filter, so
+        that streaming can continue with it.
+
+        Returns
+        -------
+        filt : `Filter`
+            Fused filter.
+
+        Notes
+        -----
+        - zi's of IIR filters that are given by ba coefficients of order
+          higher than 2 cannot be fused. The new filter has no zi's in that
+          case.
+        - FIR filters with an order larger than 2 cannot be fused with IIR
+          filters, since their factorization into second-order sections is
+          numerically unreliable.
+
+        """
+        assert self.number_of_filters > 0, \
+            'There are no filters to compile'
+        assert self.same_sampling_rate, \
+            'Multirate filter banks cannot be compiled'
+        coefficients, zi = _fuse_filters(self.filters)
+        coefficients['filter_id'] = \
+            f'Compiled filter bank ({self.number_of_filters} filters)'
+        filt = Filter('other', coefficients, self.sampling_rate_hz)
+        if zi is not None:
+            filt.zi = zi
+        return filt
+
     # ======== Get impulse ====================================================
     def get_ir(self, mode: str = 'parallel', length_samples: int = 2048,
                test_zi: bool = False, zero_phase: bool = False) -> \
@@ -389,10 +432,33 @@ class FilterBank():
             number_of_channels=1, sampling_rate_hz=fs_hz)
 
         # Filtering
-        ir = self.filter_signal(
-            d, mode, activate_zi=test_zi, zero_phase=zero_phase)
+        ir = self._filter_impulse(d, mode, test_zi, zero_phase)
         return ir
 
+    def _filter_impulse(self, impulse: Signal, mode: str, test_zi: bool,
+                        zero_phase: bool = False) -> Signal | MultiBandSignal:
+        """Filters an impulse with the filter bank. Without zi's, the parallel
+        and summed outputs are assembled from the cached impulse responses of
+        the filters, so that repeated plots do not filter again.
+
+        """
+        # Subclasses with their own filtering are not bypassed
+        if test_zi or mode.lower() not in ('parallel', 'summed') or \
+                type(self).filter_signal is not FilterBank.filter_signal:
+            return self.filter_signal(
+                impulse, mode, activate_zi=test_zi, zero_phase=zero_phase)
+        irs = [f._get_ir_time_data(len(impulse), zero_phase)
+               for f in self.filters]
+        if mode.lower() == 'summed':
+            new_sig = impulse.copy(with_time_data=False)
+            new_sig.time_data = np.sum(irs, axis=0)
+            return new_sig
+        bands = []
+        for ir in irs:
+            bands.append(impulse.copy(with_time_data=False))
+            bands[-1].time_data = ir
+        return MultiBandSignal(bands, same_sampling_rate=True)
+
     # ======== Prints and plots ===============================================
     def show_info(self):
         """Show information about the filter bank.
@@ -471,7 +537,7 @@ class FilterBank():
 
         # Filtering and plot
         if mode == 'parallel':
-            bs = self.filter_signal(d, mode='parallel', activate_zi=test_zi)
+            bs = self._filter_impulse(d, 'parallel', test_zi)
             specs = []
             for b in bs.bands:
                 b.set_spectrum_parameters(method='standard')
@@ -493,7 +559,7 @@ class FilterBank():
                                    range_y=range_y,
                                    tight_layout=False)
         elif mode == 'sequential':
-            bs = self.filter_signal(d, mode='sequential', activate_zi=test_zi)
+            bs = self._filter_impulse(d, 'sequential', test_zi)
             bs.set_spectrum_parameters(method='standard')
             f, sp = bs.get_spectrum()
             f, sp = _get_normalized_spectrum(
@@ -503,7 +569,7 @@ class FilterBank():
                 labels=[f'Sequential - Channel {n}'
                         for n in range(bs.number_of_channels)])
         elif mode == 'summed':
-            bs = self.filter_signal(d, mode='summed', activate_zi=test_zi)
+            bs = self._filter_impulse(d, 'summed', test_zi)
             bs.set_spectrum_parameters(method='standard')
             f, sp = bs.get_spectrum()
             f, sp = _get_normalized_spectrum(
@@ -566,7 +632,7 @@ class FilterBank():
 
         # Plot
         if mode == 'parallel':
-            bs = self.filter_signal(d, mode='parallel', activate_zi=test_zi)
+            bs = self._filter_impulse(d, 'parallel', test_zi)
             phase = []
             f = bs.bands[0].get_spectrum()[0]
             for b in bs.bands:
@@ -580,7 +646,7 @@ class FilterBank():
                                            for h in range(bs.number_of_bands)],
                                    tight_layout=False)
         elif mode == 'sequential':
-            bs = self.filter_signal(d, mode='sequential', activate_zi=test_zi)
+            bs = self._filter_impulse(d, 'sequential', test_zi)
             f, sp = bs.get_spectrum()
             ph = np.angle(sp)
             if unwrap:
@@ -591,7 +657,7 @@ class FilterBank():
                 labels=[f'Sequential - Channel {n}'
                         for n in range(bs.number_of_channels)])
         elif mode == 'summed':
-            bs = self.filter_signal(d, mode='summed', activate_zi=test_zi)
+            bs = self._filter_impulse(d, 'summed', test_zi)
             f, sp = bs.get_spectrum()
             ph = np.angle(sp)
             if unwrap:
@@ -653,7 +719,7 @@ class FilterBank():
 
         # Plot
         if mode == 'parallel':
-            bs = self.filter_signal(d, mode='parallel', activate_zi=test_zi)
+            bs = self._filter_impulse(d, 'parallel', test_zi)
             gd = []
             f = bs.bands[0].get_spectrum()[0]
             for b in bs.bands:
@@ -666,7 +732,7 @@ class FilterBank():
                                            for h in range(bs.number_of_bands)],
                                    tight_layout=False)
         elif mode == 'sequential':
-            bs = self.filter_signal(d, mode='sequential', activate_zi=test_zi)
+            bs = self._filter_impulse(d, 'sequential', test_zi)
             f, sp = bs.get_spectrum()
             gd = _group_delay_direct(sp.squeeze(), f[1]-f[0])*1e3
             fig, ax = general_plot(
@@ -675,7 +741,7 @@ class FilterBank():
                 labels=[f'Sequential - Channel {n}'
                         for n in range(bs.number_of_channels)])
         elif mode == 'summed':
-            bs = self.filter_signal(d, mode='summed', activate_zi=test_zi)
+            bs = self._filter_impulse(d, 'summed', test_zi)
             f, sp = bs.get_spectrum()
             gd = _group_delay_direct(sp.squeeze(), f[1]-f[0])*1e3
             fig, ax = general_plot(
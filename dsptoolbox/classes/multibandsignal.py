@@ -5,6 +5,7 @@ from warnings import warn
 
 from .signal_class import Signal
 from .._general_helpers import _check_format_in_path
+from .._config import _complex_dtype
 
 
 class MultiBandSignal():
@@ -91,10 +92,12 @@ class MultiBandSignal():
                     'behaviour is not supported'
                 assert s.signal_type == self.signal_type, \
                     'Signal types do not match'
+                assert s.precision == new_bands[0].precision, \
+                    'Signals have different precision'
                 sr.append(s.sampling_rate_hz)
             if self.same_sampling_rate:
                 self.sampling_rate_hz = new_bands[0].sampling_rate_hz
-                self.band_length_samples = new_bands[0].time_data.shape[0]
+                self.band_length_samples = len(new_bands[0])
             else:
                 self.sampling_rate_hz = sr
             # Check sampling rate and duration
@@ -104,7 +107,7 @@ class MultiBandSignal():
                         'Not all Signals have the same sampling rate. ' +\
                         'If you wish to create a multirate system, set ' +\
                         'same_sampling_rate to False'
-                    assert s.time_data.shape[0] == self.band_length_samples,\
+                    assert len(s) == self.band_length_samples,\
                         'The length of the bands is not always the same. ' +\
                         'This behaviour is not supported if there is a ' +\
                         'constant sampling rate'
@@ -125,6 +128,16 @@ class MultiBandSignal():
     def number_of_bands(self) -> int:
         return len(self.bands)
 
+    @property
+    def precision(self) -> str | None:
+        """Floating point precision of the bands (`None` if there are no
+        bands).
+
+        """
+        if not self.bands:
+            return None
+        return self.bands[0].precision
+
     def __len__(self):
         return len(self.bands)
 
@@ -235,13 +248,15 @@ class MultiBandSignal():
         if self.bands[0].time_data_imaginary is None:
             initial = self.bands[0].time_data
             for n in range(1, len(self.bands)):
-                initial += self.bands[n].time_data
+                initial += self.bands[n].time_data_view
         else:
-            initial = zeros(self.bands[0].time_data.shape, dtype='cfloat')
+            initial = zeros(self.bands[0].time_data_view.shape,
+                            dtype=_complex_dtype(
+                                self.bands[0].time_data_view))
             for n in range(len(self.bands)):
-                initial += self.bands[n].time_data
+                initial += self.bands[n].time_data_view
                 initial += self.bands[n].time_data_imaginary * 1j
-        new_sig = self.bands[0].copy()
+        new_sig = self.bands[0].copy(with_time_data=False)
         if hasattr(new_sig, 'window'):
             del new_sig.window
         new_sig.time_data = initial
@@ -295,19 +310,22 @@ class MultiBandSignal():
             # Check if there is complex time data
             if self.bands[0].time_data_imaginary is None:
                 new_time_data = \
-                    zeros((self.bands[0].time_data.shape[0], len(self.bands)))
+                    zeros((len(self.bands[0]), len(self.bands)),
+                          dtype=self.precision)
                 for n in range(len(self.bands)):
                     new_time_data[:, n] = \
-                        self.bands[n].time_data[:, channel].copy()
+                        self.bands[n].time_data_view[:, channel]
             else:
                 new_time_data = \
-                    zeros((self.bands[0].time_data.shape[0],
-                          len(self.bands)), dtype='cfloat')
+                    zeros((len(self.bands[0]),
+                          len(self.bands)),
+                          dtype=_complex_dtype(self.bands[0].time_data_view))
                 for n in range(len(self.bands)):
                     new_time_data[:, n] = \
-                        self.bands[n].time_data[:, channel] + \
+                        self.bands[n].time_data_view[:, channel] + \
                         self.bands[n].time_data_imaginary[:, channel] * 1j
-            sig = Signal(None, new_time_data, self.sampling_rate_hz)
+            sig = Signal(None, new_time_data, self.sampling_rate_hz,
+                         precision=self.precision)
             return sig
         else:
             new_time_data = []
@@ -315,12 +333,12 @@ class MultiBandSignal():
             if self.bands[0].time_data_imaginary is None:
                 for n in range(len(self.bands)):
                     new_time_data.append(
-                        self.bands[n].time_data[:, channel])
+                        self.bands[n].time_data_view[:, channel])
                     sr.append(self.bands[n].sampling_rate_hz)
             else:
                 for n in range(len(self.bands)):
                     new_time_data.append(
-                        self.bands[n].time_data[:, channel] +
+                        self.bands[n].time_data_view[:, channel] +
                         self.bands[n].time_data_imaginary[:, channel] * 1j)
                     sr.append(self.bands[n].sampling_rate_hz)
                 warn('Output is complex since signal data had imaginary part')
@@ -342,13 +360,24 @@ class MultiBandSignal():
         with open(path, 'wb') as data_file:
             dump(self, data_file, HIGHEST_PROTOCOL)
 
-    def copy(self):
+    def copy(self, with_time_data: bool = True, with_caches: bool = True):
         """Returns a copy of the object.
 
+        Parameters
+        ----------
+        with_time_data : bool, optional
+            When `False`, the time data of the bands is not copied. See
+            `Signal.copy()`. Default: `True`.
+        with_caches : bool, optional
+            When `False`, cached spectral data of the bands is not copied.
+            Default: `True`.
+
         Returns
         -------
         new_sig : `MultiBandSignal`
             Copy of Signal.
 
         """
-        return deepcopy(self)
+        memo = {id(b): b.copy(with_time_data, with_caches)
+                for b in self.bands}
+        return deepcopy(self, memo)
@@ -14,7 +14,11 @@ from ._plots import _csm_plot
 from .._general_helpers import \
     (_get_normalized_spectrum, _pad_trim, _find_nearest,
      _fractional_octave_smoothing, _check_format_in_path)
-from .._standard import (_welch, _group_delay_direct, _stft, _csm)
+from .._standard import (_welch_multichannel, _group_delay_direct, _stft,
+                         _csm, _csm_add_channels)
+from ._spectral_cache import SpectralCache
+from .._config import _get_default_precision, _check_precision
+from .._fft import rfft
 
 
 class Signal():
@@ -27,7 +31,8 @@ class Signal():
     # ======== Constructor and State handler ==================================
     def __init__(self, path: str = None, time_data=None,
                  sampling_rate_hz: int = None, signal_type: str = 'general',
-                 signal_id: str = '', constrain_amplitude: bool = True):
+                 signal_id: str = '', constrain_amplitude: bool = True,
+                 precision: str = None):
         """Signal class that saves time data, channel and sampling rate
         information as well as spectrum, cross-spectral matrix and more.
 
@@ -55,6 +60,11 @@ class Signal():
             A warning is always shown when audio gets normalized and the used
             normalization factor is saved as `amplitude_scale_factor`.
             Default: `True`.
+        precision : str, optional
+            Floating point precision of the time data. Choose from
+            `'float64'` or `'float32'`. Pass `None` to use the package
+            default, see `dsptoolbox.set_default_precision()`.
+            Default: `None`.
 
         Methods
         -------
@@ -66,6 +76,8 @@ class Signal():
             set_csm_parameters, get_csm.
         Spectrogram:
             set_spectrogram_parameters, get_spectrogram.
+        Cache:
+            set_spectral_cache, spectral_cache_info.
         Plots:
             plot_magnitude, plot_time, plot_spectrogram, plot_phase, plot_csm.
         General:
@@ -76,14 +88,14 @@ class Signal():
         """
         self.signal_id = signal_id
         self.signal_type = signal_type
+        self.__precision = _get_default_precision() if precision is None \
+            else _check_precision(precision)
         # Handling amplitude
         self.constrain_amplitude = constrain_amplitude
         self.scale_factor = None
         self.calibrated_signal = False
         # State tracker
-        self.__spectrum_state_update = True
-        self.__csm_state_update = True
-        self.__spectrogram_state_update = True
+        self.__spectral_cache = SpectralCache()
         self.__time_vector_update = True
         # Import data
         if path is not None:
@@ -114,9 +126,7 @@ class Signal():
         added, new spectrum, csm or stft has to be computed.
 
         """
-        self.__spectrum_state_update = True
-        self.__csm_state_update = True
-        self.__spectrogram_state_update = True
+        self.__spectral_cache.clear()
         self.__time_vector_update = True
         self._generate_metadata()
 
@@ -128,9 +138,9 @@ class Signal():
             self.info = {}
         self.info['sampling_rate_hz'] = self.sampling_rate_hz
         self.info['number_of_channels'] = self.number_of_channels
-        self.info['signal_length_samples'] = self.time_data.shape[0]
+        self.info['signal_length_samples'] = self.__time_data.shape[0]
         self.info['signal_length_seconds'] = \
-            self.time_data.shape[0] / self.sampling_rate_hz
+            self.__time_data.shape[0] / self.sampling_rate_hz
         self.info['signal_type'] = self.signal_type
         self.info['signal_id'] = self.signal_id
 
@@ -140,14 +150,47 @@ class Signal():
         """
         self.__time_vector_update = False
         self.__time_vector_s = np.linspace(
-            0, len(self.time_data)/self.sampling_rate_hz,
-            len(self.time_data))
+            0, len(self.__time_data)/self.sampling_rate_hz,
+            len(self.__time_data))
 
     # ======== Properties and setters =========================================
     @property
     def time_data(self) -> np.ndarray:
         return self.__time_data.copy()
 
+    @property
+    def time_data_view(self) -> np.ndarray:
+        """Read-only view of the time data with shape (time samples,
+        channels). In contrast to `time_data`, no copy is made, so this should
+        be preferred whenever the data is only read. Modifying the time data
+        is only possible by assigning a new array to `time_data`.
+
+        """
+        view = self.__time_data.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def precision(self) -> str:
+        """Floating point precision of the time data (`'float32'` or
+        `'float64'`). Setting it casts the time data.
+
+        """
+        return self.__precision
+
+    @precision.setter
+    def precision(self, new_precision: str):
+        new_precision = _check_precision(new_precision)
+        if new_precision == self.__precision:
+            return
+        self.__precision = new_precision
+        if hasattr(self, '_Signal__time_data'):
+            if self.__time_data_imaginary is None:
+                self.time_data = self.__time_data
+            else:
+                self.time_data = \
+                    self.__time_data + 1j*self.__time_data_imaginary
+
     @time_data.setter
     def time_data(self, new_time_data):
         # Shape of Time Data array
@@ -166,12 +209,18 @@ class Signal():
         if new_time_data.shape[1] > new_time_data.shape[0]:
             new_time_data = new_time_data.T
 
+        # Read-only arrays (e.g. views of other signals) are not shared
+        if not new_time_data.flags.writeable:
+            new_time_data = new_time_data.copy()
+
         # Handle complex data
         if np.iscomplexobj(new_time_data):
-            new_time_data_imag = np.imag(new_time_data)
+            new_time_data_imag = \
+                np.imag(new_time_data).astype(self.__precision)
             new_time_data = np.real(new_time_data)
         else:
             new_time_data_imag = None
+        new_time_data = new_time_data.astype(self.__precision, copy=False)
 
         # Normalization for real time data
         if self.constrain_amplitude:
@@ -189,6 +238,7 @@ class Signal():
 
         # Set time data (real and imaginary)
         self.__time_data = new_time_data
+        self.__time_data_buffer = None
         self.time_data_imaginary = new_time_data_imag
 
         # Set number of channels
@@ -235,7 +285,7 @@ class Signal():
             'Number of channels must be integer'
         assert new_number > 0, \
             'There has to be at least one channel'
-        assert new_number == self.time_data.shape[1], \
+        assert new_number == self.__time_data.shape[1], \
             'Number of channels does not match with time data vector'
         self.__number_of_channels = new_number
 
@@ -285,7 +335,7 @@ class Signal():
         self.__calibrated_signal = ncs
 
     def __len__(self):
-        return self.time_data.shape[0]
+        return self.__time_data.shape[0]
 
     def __str__(self):
         return self._get_metadata_string()
@@ -359,16 +409,8 @@ class Signal():
                 detrend=detrend,
                 average=average,
                 scaling=scaling)
-        if not hasattr(self, '_spectrum_parameters'):
-            self._spectrum_parameters = _new_spectrum_parameters
-            self.__spectrum_state_update = True
-        else:
-            handler = \
-                [self._spectrum_parameters[k] == _new_spectrum_parameters[k]
-                 for k in self._spectrum_parameters.keys()]
-            if not all(handler):
-                self._spectrum_parameters = _new_spectrum_parameters
-                self.__spectrum_state_update = True
+        # Computed spectra are cached for each set of parameters
+        self._spectrum_parameters = _new_spectrum_parameters
 
     def set_window(self, window: np.ndarray):
         """Sets the window used for the IR. It only works for
@@ -384,8 +426,8 @@ class Signal():
         assert self.signal_type in valid_signal_types, \
             f'{self.signal_type} is not valid. Please set it to ir or ' +\
             'h1, h2, h3, rir'
-        assert window.shape == self.time_data.shape, \
-            f'{window.shape} does not match shape {self.time_data.shape}'
+        assert window.shape == self.__time_data.shape, \
+            f'{window.shape} does not match shape {self.__time_data.shape}'
         self.window = window
 
     def set_coherence(self, coherence: np.ndarray):
@@ -402,7 +444,7 @@ class Signal():
         assert self.signal_type in valid_signal_types, \
             f'{self.signal_type} is not valid. Please set it to ir or ' +\
             'h1, h2, h3, rir'
-        assert coherence.shape[0] == (self.time_data.shape[0]//2 + 1), \
+        assert coherence.shape[0] == (self.__time_data.shape[0]//2 + 1), \
             'Length of signals and given coherence do not match'
         assert coherence.shape[1] == self.number_of_channels, \
             'Number of channels between given coherence and signal ' +\
@@ -449,16 +491,8 @@ class Signal():
                 detrend=detrend,
                 average=average,
                 scaling=scaling)
-        if not hasattr(self, '_csm_parameters'):
-            self._csm_parameters = _new_csm_parameters
-            self.__csm_state_update = True
-        else:
-            handler = \
-                [self._csm_parameters[k] == _new_csm_parameters[k]
-                 for k in self._csm_parameters.keys()]
-            if not all(handler):
-                self._csm_parameters = _new_csm_parameters
-                self.__csm_state_update = True
+        # Computed matrices are cached for each set of parameters
+        self._csm_parameters = _new_csm_parameters
 
     def set_spectrogram_parameters(self,
                                    window_length_samples: int = 1024,
@@ -510,17 +544,34 @@ class Signal():
                 detrend=detrend,
                 padding=padding,
                 scaling=scaling)
-        if not hasattr(self, '_spectrogram_parameters'):
-            self._spectrogram_parameters = _new_spectrogram_parameters
-            self.__spectrogram_state_update = True
-        else:
-            handler = \
-                [self._spectrogram_parameters[k] ==
-                 _new_spectrogram_parameters[k]
-                 for k in self._spectrogram_parameters.keys()]
-            if not all(handler):
-                self._spectrogram_parameters = _new_spectrogram_parameters
-                self.__spectrogram_state_update = True
+        # Computed spectrograms are cached for each set of parameters
+        self._spectrogram_parameters = _new_spectrogram_parameters
+
+    def set_spectral_cache(self, max_bytes: int = 2**28):
+        """Sets the maximum size of the cache for spectra, cross-spectral
+        matrices and spectrograms. Results are cached for each set of
+        parameters, so that alternating between different parameters does not
+        trigger new computations. The least recently used results are
+        discarded when the cache exceeds its size. All results are discarded
+        when the time data changes.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Maximum number of bytes that the cached arrays can occupy. Pass 0
+            to deactivate caching. Default: 2**28 (256 MB).
+
+        """
+        self.__spectral_cache.max_bytes = max_bytes
+
+    @property
+    def spectral_cache_info(self) -> dict:
+        """Dictionary with the number of `hits` and `misses`, the number of
+        cached `entries`, their size in bytes (`current_bytes`) and the
+        maximum size (`max_bytes`) of the spectral cache.
+
+        """
+        return self.__spectral_cache.info()
 
     # ======== Add, remove and reorder channels ===============================
     def add_channel(self, path: str = None, new_time_data: np.ndarray = None,
@@ -565,23 +616,73 @@ class Signal():
         if new_time_data.shape[1] > new_time_data.shape[0]:
             new_time_data = new_time_data.T
 
-        diff = new_time_data.shape[0] - self.time_data.shape[0]
+        diff = new_time_data.shape[0] - self.__time_data.shape[0]
         if diff != 0:
             txt = 'Padding' if diff < 0 else 'Trimming'
             if padding_trimming:
                 new_time_data = \
-                    _pad_trim(new_time_data, self.time_data.shape[0],
+                    _pad_trim(new_time_data, self.__time_data.shape[0],
                               axis=0, in_the_end=True)
                 warn(f'{txt} has been performed ' +
                      'on the end of the new signal to match original one.')
             else:
                 raise AttributeError(
                     f'{new_time_data.shape[0]} does not match ' +
-                    f'{self.time_data.shape[0]}. Activate padding_trimming ' +
-                    'for allowing this channel to be added')
-        self.time_data = np.concatenate([self.time_data, new_time_data],
-                                        axis=1)
-        self.__update_state()
+                    f'{self.__time_data.shape[0]}. Activate ' +
+                    'padding_trimming for allowing this channel to be added')
+        # Normalization or complex data need the whole time data
+        if np.iscomplexobj(new_time_data) or \
+                self.__time_data_imaginary is not None or \
+                (self.constrain_amplitude and
+                 np.max(np.abs(new_time_data)) > 1):
+            self.time_data = np.concatenate(
+                [self.time_data_view, new_time_data], axis=1)
+            self.__update_state()
+            return
+
+        new_time_data = new_time_data.astype(self.__precision, copy=False)
+        old_time_data = self.__time_data
+        number_of_channels = old_time_data.shape[1]
+        total_channels = number_of_channels + new_time_data.shape[1]
+
+        # Append to preallocated buffer (grows geometrically)
+        buffer = self.__time_data_buffer
+        if buffer is None or buffer.shape[1] < total_channels or \
+                not np.shares_memory(buffer, old_time_data):
+            buffer = np.empty(
+                (old_time_data.shape[0],
+                 max(total_channels, 2*number_of_channels)),
+                dtype=old_time_data.dtype, order='F')
+            buffer[:, :number_of_channels] = old_time_data
+            self.__time_data_buffer = buffer
+        buffer[:, number_of_channels:total_channels] = new_time_data
+        self.__time_data = buffer[:, :total_channels]
+        if self.constrain_amplitude:
+            self.amplitude_scale_factor = 1
+        self.number_of_channels = total_channels
+        self.__time_vector_update = True
+        self._generate_metadata()
+
+        # Update cached spectral data only with the new channels
+        for key, value in self.__spectral_cache.entries():
+            kind, parameters = key[0], dict(key[2:])
+            if kind == 'spectrum':
+                _, spectrum = self.__compute_spectrum(
+                    new_time_data, parameters)
+                value = (value[0],
+                         np.concatenate([value[1], spectrum], axis=1))
+            elif kind == 'csm':
+                value = (value[0],
+                         _csm_add_channels(value[1], old_time_data,
+                                           new_time_data,
+                                           self.sampling_rate_hz,
+                                           **parameters))
+            elif kind == 'spectrogram':
+                _, _, stft = _stft(
+                    new_time_data, self.sampling_rate_hz, **parameters)
+                value = (value[0], value[1],
+                         np.concatenate([value[2], stft], axis=-1))
+            self.__spectral_cache.update_entry(key, value)
 
     def remove_channel(self, channel_number: int = -1):
         """Removes a channel.
@@ -593,14 +694,42 @@ class Signal():
 
         """
         if channel_number == -1:
-            channel_number = self.time_data.shape[1] - 1
-        assert self.time_data.shape[1] > 1, \
+            channel_number = self.__time_data.shape[1] - 1
+        assert self.__time_data.shape[1] > 1, \
             'Cannot not erase only channel'
-        assert self.time_data.shape[1]-1 >= channel_number, \
+        assert self.__time_data.shape[1]-1 >= channel_number, \
             f'Channel number {channel_number} does not exist. Signal only ' +\
             f'has {self.number_of_channels-1} channels (zero included).'
-        self.time_data = np.delete(self.time_data, channel_number, axis=-1)
-        self.__update_state()
+        if self.__time_data_imaginary is not None:
+            self.time_data = np.delete(
+                self.time_data_view, channel_number, axis=-1)
+            self.__update_state()
+            return
+
+        number_of_channels = self.__time_data.shape[1]
+        if channel_number < 0:
+            channel_number += number_of_channels
+        # New array, so that views of the previous time data do not change
+        self.__time_data = np.delete(
+            self.__time_data, channel_number, axis=-1)
+        self.__time_data_buffer = None
+        if self.constrain_amplitude:
+            self.amplitude_scale_factor = 1
+        self.number_of_channels = number_of_channels - 1
+        self.__time_vector_update = True
+        self._generate_metadata()
+
+        # Remove channel from cached spectral data
+        for key, value in self.__spectral_cache.entries():
+            if key[0] == 'spectrum':
+                value = (value[0], np.delete(value[1], channel_number, 1))
+            elif key[0] == 'csm':
+                csm = np.delete(value[1], channel_number, 1)
+                value = (value[0], np.delete(csm, channel_number, 2))
+            elif key[0] == 'spectrogram':
+                value = (value[0], value[1],
+                         np.delete(value[2], channel_number, -1))
+            self.__spectral_cache.update_entry(key, value)
 
     def swap_channels(self, new_order):
         """Rearranges the channels in the new given order.
@@ -623,7 +752,7 @@ class Signal():
             f'[0, {self.number_of_channels-1}]'
         assert len(np.unique(new_order)) == len(new_order), \
             'There are repeated indexes in the new order vector'
-        self.time_data = self.time_data[:, new_order]
+        self.time_data = self.time_data_view[:, new_order]
 
     def get_channels(self, channels):
         """Returns a signal object with the selected channels. Beware that
@@ -648,8 +777,8 @@ class Signal():
         assert all(channels < self.number_of_channels), \
             'Indexes of new channels have to be smaller than the number ' +\
             f'of channels {self.number_of_channels}'
-        new_sig = self.copy()
-        new_sig.time_data = self.time_data[:, channels]
+        new_sig = self.copy(with_time_data=False)
+        new_sig.time_data = self.time_data_view[:, channels]
         if hasattr(new_sig, 'window'):
             new_sig.window = new_sig.window[:, channels]
         return new_sig
@@ -672,57 +801,56 @@ class Signal():
             Spectrum matrix for each channel.
 
         """
-        condition = not hasattr(self, 'spectrum') or \
-            self.__spectrum_state_update or force_computation
-
-        if condition:
-            if self._spectrum_parameters['method'] == 'welch':
-                spectrum = np.zeros((self._spectrum_parameters
-                                     ['window_length_samples'] // 2 + 1,
-                                     self.number_of_channels), dtype='float')
-                for n in range(self.number_of_channels):
-                    spectrum[:, n] = _welch(
-                        self.time_data[:, n], self.time_data[:, n],
-                        self.sampling_rate_hz,
-                        self._spectrum_parameters['window_type'],
-                        self._spectrum_parameters['window_length_samples'],
-                        self._spectrum_parameters['overlap_percent'],
-                        self._spectrum_parameters['detrend'],
-                        self._spectrum_parameters['average'],
-                        self._spectrum_parameters['scaling'])
-                time_length = \
-                    self._spectrum_parameters['window_length_samples']
-            elif self._spectrum_parameters['method'] == 'standard':
-                # Get spectrum
-                spectrum = np.fft.rfft(self.time_data, axis=0)
-
-                # Smoothing
-                if self._spectrum_parameters['smoothe'] != 0:
-                    # Smoothing the power
-                    temp_abs = _fractional_octave_smoothing(
-                        np.abs(spectrum)**2,
-                        self._spectrum_parameters['smoothe'])**(0.5)
-                    # Smoothing the phase is not shift-invariant...
-                    temp_phase = _fractional_octave_smoothing(
-                        np.unwrap(np.angle(spectrum), axis=0),
-                        self._spectrum_parameters['smoothe'])
-                    spectrum = temp_abs*np.exp(1j*temp_phase)
-
-                # Length of signal for frequency vector and scaling
-                time_length = self.time_data.shape[0]
-                if self._spectrum_parameters['scaling'] \
-                        == 'amplitude spectrum':
-                    spectrum /= time_length
-            self.spectrum = []
-            self.spectrum.append(
-                np.fft.rfftfreq(time_length, 1/self.sampling_rate_hz))
-            self.spectrum.append(spectrum)
-            spectrum_freqs = self.spectrum[0]
-            self.__spectrum_state_update = False
+        key = SpectralCache.make_key(
+            'spectrum', self._spectrum_parameters, self.sampling_rate_hz)
+        cached = None if force_computation else self.__spectral_cache.get(key)
+
+        if cached is None:
+            spectrum_freqs, spectrum = self.__compute_spectrum(
+                self.time_data_view, self._spectrum_parameters)
+            self.__spectral_cache.put(key, (spectrum_freqs, spectrum))
         else:
-            spectrum_freqs, spectrum = self.spectrum[0], self.spectrum[1]
+            spectrum_freqs, spectrum = cached
         return spectrum_freqs.copy(), spectrum.copy()
 
+    def __compute_spectrum(self, time_data: np.ndarray,
+                           parameters: dict) -> tuple[np.ndarray, np.ndarray]:
+        """Computes the spectrum of the passed time data (with the sampling
+        rate of the signal) according to the spectrum parameters.
+
+        """
+        if parameters['method'] == 'welch':
+            spectrum = _welch_multichannel(
+                time_data, self.sampling_rate_hz,
+                parameters['window_type'],
+                parameters['window_length_samples'],
+                parameters['overlap_percent'],
+                parameters['detrend'],
+                parameters['average'],
+                parameters['scaling'])
+            time_length = parameters['window_length_samples']
+        elif parameters['method'] == 'standard':
+            # Get spectrum
+            spectrum = rfft(time_data, axis=0)
+
+            # Smoothing
+            if parameters['smoothe'] != 0:
+                # Smoothing the power
+                temp_abs = _fractional_octave_smoothing(
+                    np.abs(spectrum)**2, parameters['smoothe'])**(0.5)
+                # Smoothing the phase is not shift-invariant...
+                temp_phase = _fractional_octave_smoothing(
+                    np.unwrap(np.angle(spectrum), axis=0),
+                    parameters['smoothe'])
+                spectrum = temp_abs*np.exp(1j*temp_phase)
+
+            # Length of signal for frequency vector and scaling
+            time_length = time_data.shape[0]
+            if parameters['scaling'] == 'amplitude spectrum':
+                spectrum /= time_length
+        spectrum_freqs = np.fft.rfftfreq(time_length, 1/self.sampling_rate_hz)
+        return spectrum_freqs, spectrum
+
     def get_csm(self, force_computation=False) -> \
             tuple[np.ndarray, np.ndarray]:
         """Get Cross spectral matrix for all channels with the shape
@@ -739,14 +867,15 @@ class Signal():
         assert self.number_of_channels > 1, \
             'Cross spectral matrix can only be computed when at least two ' +\
             'channels are available'
-        condition = not hasattr(self, 'csm') or force_computation or \
-            self.__csm_state_update
+        key = SpectralCache.make_key(
+            'csm', self._csm_parameters, self.sampling_rate_hz)
+        csm = None if force_computation else self.__spectral_cache.get(key)
 
-        if condition:
-            self.csm = _csm(self.time_data, self.sampling_rate_hz,
-                            **self._csm_parameters)
-            self.__csm_state_update = False
-        return self.csm[0].copy(), self.csm[1].copy()
+        if csm is None:
+            csm = _csm(self.time_data_view, self.sampling_rate_hz,
+                       **self._csm_parameters)
+            self.__spectral_cache.put(key, csm)
+        return csm[0].copy(), csm[1].copy()
 
     def get_spectrogram(self, force_computation: bool = False) -> \
             tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -771,12 +900,14 @@ class Signal():
         - No scaling is performed while computing the DFT coefficients.
 
         """
-        condition = not hasattr(self, 'spectrogram') or force_computation or \
-            self.__spectrogram_state_update
-
-        if condition:
-            self.spectrogram = _stft(
-                self.time_data,
+        key = SpectralCache.make_key(
+            'spectrogram', self._spectrogram_parameters, self.sampling_rate_hz)
+        spectrogram = \
+            None if force_computation else self.__spectral_cache.get(key)
+
+        if spectrogram is None:
+            spectrogram = _stft(
+                self.time_data_view,
                 self.sampling_rate_hz,
                 self._spectrogram_parameters['window_length_samples'],
                 self._spectrogram_parameters['window_type'],
@@ -785,9 +916,9 @@ class Signal():
                 self._spectrogram_parameters['detrend'],
                 self._spectrogram_parameters['padding'],
                 self._spectrogram_parameters['scaling'])
-            self.__spectrogram_state_update = False
+            self.__spectral_cache.put(key, spectrogram)
         t_s, f_hz, spectrogram = \
-            self.spectrogram[0], self.spectrogram[1], self.spectrogram[2]
+            spectrogram[0], spectrogram[1], spectrogram[2]
         return t_s, f_hz, spectrogram
 
     def get_coherence(self) -> tuple[np.ndarray, np.ndarray]:
@@ -860,7 +991,7 @@ class Signal():
         f, sp = self.get_spectrum()
         if self._spectrum_parameters['method'] == 'standard' \
                 and normalize is None and scale:
-            sp = sp/self.time_data.shape[0]*2
+            sp = sp/self.__time_data.shape[0]*2
         f, mag_db = _get_normalized_spectrum(
             f=f,
             spectra=sp,
@@ -907,13 +1038,13 @@ class Signal():
             self._generate_time_vector()
         fig, ax = general_subplots_line(
             self.time_vector_s,
-            self.time_data,
+            self.time_data_view,
             sharex=True,
             ylabels=[f'Channel {n}' for n in range(self.number_of_channels)],
             xlabels='Time / s',
             returns=True)
         for n in range(self.number_of_channels):
-            mx = np.max(np.abs(self.time_data[:, n])) * 1.1
+            mx = np.max(np.abs(self.time_data_view[:, n])) * 1.1
             if hasattr(self, 'window'):
                 ax[n].plot(self.time_vector_s,
                            self.window[:, n] * mx / 1.1, alpha=0.75)
@@ -1121,7 +1252,7 @@ class Signal():
         mode = mode.lower()
         path = _check_format_in_path(path, mode)
         if mode in ('wav', 'flac'):
-            write(path, self.time_data, self.sampling_rate_hz)
+            write(path, self.time_data_view, self.sampling_rate_hz)
         elif mode == 'pkl':
             with open(path, 'wb') as data_file:
                 dump(self, data_file, HIGHEST_PROTOCOL)
@@ -1130,16 +1261,51 @@ class Signal():
                 f'{mode} is not a supported saving mode. Use ' +
                 'wav, flac or pkl')
 
-    def copy(self):
+    def copy(self, with_time_data: bool = True, with_caches: bool = True):
         """Returns a copy of the object.
 
+        Parameters
+        ----------
+        with_time_data : bool, optional
+            When `False`, the time data (and its imaginary part) is not copied
+            and the new signal has no time samples. This is useful when the
+            time data of the new signal is set right afterwards, since only
+            metadata and parameters are copied. Data that belongs to the time
+            samples, i.e., caches, `window` and `coherence`, is dropped as
+            well. Default: `True`.
+        with_caches : bool, optional
+            When `False`, cached spectra, cross-spectral matrices and
+            spectrograms are not copied. Default: `True`.
+
         Returns
         -------
         new_sig : `Signal`
             Copy of Signal.
 
         """
-        return deepcopy(self)
+        # Objects in the memo dictionary are not deep-copied but replaced
+        memo = {id(self.__time_data_buffer): None}
+        if not with_time_data:
+            memo[id(self.__time_data)] = \
+                np.zeros((0, self.number_of_channels), dtype=self.precision)
+            memo[id(self.__time_data_imaginary)] = None
+            memo[id(self.__spectral_cache)] = \
+                SpectralCache(self.__spectral_cache.max_bytes)
+            if hasattr(self, '_Signal__time_vector_s'):
+                memo[id(self.__time_vector_s)] = None
+            for attribute in ('window', 'coherence'):
+                if hasattr(self, attribute):
+                    memo[id(getattr(self, attribute))] = None
+        elif not with_caches:
+            memo[id(self.__spectral_cache)] = \
+                SpectralCache(self.__spectral_cache.max_bytes)
+        new_sig = deepcopy(self, memo)
+        if not with_time_data:
+            new_sig.__time_vector_update = True
+            for attribute in ('window', 'coherence'):
+                if hasattr(new_sig, attribute):
+                    delattr(new_sig, attribute)
+        return new_sig
 
     def _get_metadata_string(self) -> str:
         """Helper for creating a string containing all signal info.
@@ -1181,7 +1347,7 @@ class Signal():
 
         """
         stop_flag = False
-        if self.time_data.shape[0] - position_samples < 0:
+        if self.__time_data.shape[0] - position_samples < 0:
             stop_flag = True
         assert type(position_samples) == int, \
             'Position must be in samples and thus an integer'
@@ -1213,7 +1379,7 @@ class Signal():
         """
         if not hasattr(self, 'streaming_position'):
             stop_flag = self.set_streaming_position()
-        sig = self.time_data[
+        sig = self.time_data_view[
             self.streaming_position:self.streaming_position +
             blocksize_samples, :].copy()
         stop_flag = self.set_streaming_position(
@@ -3,8 +3,8 @@ Backend for distance measures
 """
 import numpy as np
 from scipy.integrate import simpson
-from .._general_helpers import _compute_number_frames, _pad_trim
-from .._standard import _rms
+from .._standard import _rms, _get_framed_signal
+from .._fft import rfft
 
 
 def _log_spectral_distance(x: np.ndarray, y: np.ndarray, f: np.ndarray) \
@@ -138,50 +138,40 @@ def _fw_snr_seg_per_channel(x: np.ndarray, xhat: np.ndarray,
 
     """
     eps = 1e-30  # Some small number for the logarithm function
-    length_signal = len(x)
     length_window = len(time_window)
-    n_frames, pad_samples = \
-        _compute_number_frames(length_window, step_samples, length_signal)
-    x = _pad_trim(x, length_signal+pad_samples)
-    xhat = _pad_trim(xhat, length_signal+pad_samples)
+    # Read-only frames with shape (time samples, frames, bands)
+    x = _get_framed_signal(x, length_window, step_samples,
+                           read_only_view=True)
+    xhat = _get_framed_signal(xhat, length_window, step_samples,
+                              read_only_view=True)
+    n_frames = x.shape[1]
 
     fw_snr_seg = 0
-    position = 0
-    # Loop for time frames
-    for _ in range(n_frames):
-        # Time signals
-        x_m = x[position:position+length_window, :]
-        xhat_m = xhat[position:position+length_window, :]
-        # "Collectors"
-        weights_jm = np.zeros(length_window//2+1)
-        snr_jm = np.zeros_like(weights_jm)
-        # Loop for bands
-        for ib in range(x.shape[1]):
-            X_jm = np.abs(np.fft.rfft(x_m[:, ib] * time_window))
-            Xhat_jm = np.abs(np.fft.rfft(xhat_m[:, ib] * time_window))
-            # Weightning function, gamma parameter can range between 0.1 and 2
-            W_jm = X_jm**gamma
-
-            # Normalization of spectra: probably for avoiding scaling
-            # inconsistencies when total energy in the signals is not the same
-            X_jm /= np.sum(X_jm)
-            Xhat_jm /= np.sum(Xhat_jm)
-
-            snr_jm += (np.log10(X_jm**2 / (X_jm - Xhat_jm + eps)**2)*W_jm)
-            weights_jm += W_jm
-
-        # Mean SNR over all frequencies
-        snr_frame = np.mean(10 * snr_jm / weights_jm)
-
-        # Range dB
-        if snr_frame < snr_range_db[0]:
-            snr_frame = snr_range_db[0]
-        if snr_frame > snr_range_db[1]:
-            snr_frame = snr_range_db[1]
-        fw_snr_seg += snr_frame
-
-        # Updating position
-        position += step_samples
+    # Process blocks of frames to limit memory usage
+    frames_per_block = 256
+    for start in range(0, n_frames, frames_per_block):
+        block = slice(start, start+frames_per_block)
+        X_jm = np.abs(rfft(
+            x[:, block, :] * time_window[:, None, None], axis=0))
+        Xhat_jm = np.abs(rfft(
+            xhat[:, block, :] * time_window[:, None, None], axis=0))
+        # Weightning function, gamma parameter can range between 0.1 and 2
+        W_jm = X_jm**gamma
+
+        # Normalization of spectra: probably for avoiding scaling
+        # inconsistencies when total energy in the signals is not the same
+        X_jm /= np.sum(X_jm, axis=0)
+        Xhat_jm /= np.sum(Xhat_jm, axis=0)
+
+        # Sum over bands
+        snr_jm = np.sum(
+            np.log10(X_jm**2 / (X_jm - Xhat_jm + eps)**2)*W_jm, axis=-1)
+        weights_jm = np.sum(W_jm, axis=-1)
+
+        # Mean SNR over all frequencies and range dB
+        snr_frame = np.mean(10 * snr_jm / weights_jm, axis=0)
+        fw_snr_seg += np.sum(
+            np.clip(snr_frame, snr_range_db[0], snr_range_db[1]))
 
     fw_snr_seg /= n_frames
     return fw_snr_seg
@@ -3,7 +3,12 @@ Backend for the effects module
 """
 from .._general_helpers import _get_smoothing_factor_ema
 from ..plots import general_plot
+from .._standard import _overlap_add
+from .._fft import rfft, irfft
+from functools import reduce
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
 # import matplotlib.pyplot as plt
 
 
@@ -62,11 +67,175 @@ def _clean_signal(inp: np.ndarray,
 
 
 # ========= Compressor ========================================================
+class CompressorEngine():
+    """Vectorized feed-forward compressor for time data with shape (time
+    samples, channels). The level of each sample is mapped by the static
+    compression function (with knee) to the required amount of gain change
+    in dB. This amount is smoothed by a peak detector with exponential
+    release (computed as a running maximum in the logarithmic domain) and a
+    one-pole filter for the attack. All channels are processed at once and
+    the states are kept, so that the time data can be passed in consecutive
+    blocks.
+
+    References
+    ----------
+    - Giannoulis, D., Massberg, M., & Reiss, J. D. (2012). Digital dynamic
+      range compressor design—A tutorial and analysis. Journal of the Audio
+      Engineering Society, 60(6), 399-408.
+
+    """
+    def __init__(self, threshold_db: float, ratio: float,
+                 knee_factor_db: float, attack_samples: int,
+                 release_samples: int, mix_compressed: float = 1,
+                 downward_compression: bool = True,
+                 linked_channels: bool = False,
+                 chunk_length_samples: int = 2**14):
+        """Constructor of the compressor engine.
+
+        Parameters
+        ----------
+        threshold_db : float
+            Threshold level.
+        ratio : float
+            Compression ratio.
+        knee_factor_db : float
+            Knee width in dB.
+        attack_samples : int
+            Time of attack in samples.
+        release_samples : int
+            Time of release in samples.
+        mix_compressed : float, optional
+            Amount of compressed signal in the output. Must be between 0 and
+            1 where 1 means there is only compressed signal in the output.
+            Default: 1.
+        downward_compression : bool, optional
+            When `True`, downward compression is applied. Otherwise, upward
+            compression is applied. Default: `True`.
+        linked_channels : bool, optional
+            When `True`, the level is detected with the maximum of all
+            channels and all of them get the same gain. Default: `False`.
+        chunk_length_samples : int, optional
+            Length of the chunks in which the running maximum of the release
+            is computed. Default: 2**14.
+
+        """
+        self.threshold_db = threshold_db
+        self.ratio = ratio
+        self.knee_factor_db = knee_factor_db
+        self.downward_compression = downward_compression
+        self.mix_compressed = min(mix_compressed, 1)
+        self.linked_channels = linked_channels
+        self.chunk_length_samples = int(chunk_length_samples)
+        # Poles of the smoothing (a time of 0 samples means no smoothing)
+        self.attack_pole = 0 if attack_samples == 0 else \
+            1 - _get_smoothing_factor_ema(attack_samples, 1)
+        self.release_pole = 0 if release_samples == 0 else \
+            1 - _get_smoothing_factor_ema(release_samples, 1)
+        self.reset()
+
+    def reset(self):
+        """Sets the states to zero (no gain change).
+
+        """
+        self.__held = None
+        self.__smoothed = None
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        """Compresses the next block of time data.
+
+        Parameters
+        ----------
+        x : `np.ndarray`
+            Time data with shape (time samples, channels). The number of
+            channels must remain the same for all blocks.
+
+        Returns
+        -------
+        `np.ndarray`
+            Compressed time data with the same shape.
+
+        """
+        assert x.ndim == 2, 'Time data must have shape (time samples, ' +\
+            'channels)'
+        level = np.abs(x)
+        if self.linked_channels:
+            # Pairwise maximum is much faster than a reduction along the
+            # (short) channel axis
+            level = reduce(np.maximum, level.T)[:, None]
+        if self.__held is None:
+            self.__held = np.zeros(level.shape[1])
+            self.__smoothed = np.zeros(level.shape[1])
+        assert level.shape[1] == len(self.__held), \
+            'Number of channels does not match the states of the ' +\
+            'compressor. Use reset() before processing a different number ' +\
+            'of channels'
+
+        # Required gain change in dB (silence is left unchanged)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            amount_db = _get_compression_amount_db(
+                20*np.log10(level), self.threshold_db, self.ratio,
+                self.knee_factor_db, self.downward_compression)
+        amount_db[np.isinf(amount_db)] = 0
+
+        # Peak detector with exponential release and one-pole attack
+        held = np.empty_like(amount_db)
+        for start in range(0, len(amount_db), self.chunk_length_samples):
+            chunk = slice(start, start+self.chunk_length_samples)
+            held[chunk] = self.__hold(amount_db[chunk])
+        smoothed, zi = lfilter(
+            [1 - self.attack_pole], [1, -self.attack_pole], held, axis=0,
+            zi=self.attack_pole*self.__smoothed[None, :])
+        self.__smoothed = smoothed[-1] if len(smoothed) > 0 \
+            else self.__smoothed
+
+        gain = 10**((-smoothed if self.downward_compression else smoothed)/20)
+        return x * (self.mix_compressed*gain + (1 - self.mix_compressed))
+
+    def __hold(self, amount: np.ndarray) -> np.ndarray:
+        """Computes `h[n] = max(amount[n], release_pole*h[n-1])` for a chunk
+        and updates the state. Since
+        `h[n] = max_k(release_pole**(n-k) * amount[k])`, it is a running
+        maximum in the logarithmic domain.
+
+        """
+        if self.release_pole == 0:
+            held = amount
+        else:
+            log_pole = np.log(self.release_pole)
+            ramp = np.arange(1, len(amount)+1)[:, None]*log_pole
+            with np.errstate(divide='ignore'):
+                log_amount = np.log(amount)
+                log_held = np.log(self.__held)
+            running = np.maximum.accumulate(log_amount - ramp, axis=0)
+            held = np.exp(np.maximum(running, log_held) + ramp)
+        if len(held) > 0:
+            self.__held = held[-1]
+        return held
+
+
+def _get_compression_amount_db(level_db: np.ndarray, threshold_db: float,
+                               ratio: float, knee_factor_db: float,
+                               downward_compression: bool) -> np.ndarray:
+    """Returns the absolute difference between the compression function
+    (see `_get_knee_func`) and the level in dB. It is computed in closed
+    form on whole arrays.
+
+    """
+    # Distance to the threshold in the direction of compression
+    distance = level_db - threshold_db if downward_compression else \
+        threshold_db - level_db
+    above = np.maximum(distance - knee_factor_db/2, 0)
+    if knee_factor_db > 0:
+        knee = np.clip(distance + knee_factor_db/2, 0, knee_factor_db)
+        above += knee**2 / 2 / knee_factor_db
+    return (1 - 1/ratio)*above
+
+
 def _compressor(x: np.ndarray, threshold_db: float, ratio: float,
                 knee_factor_db: float, attack_samples: int,
                 release_samples: int, mix_compressed: float,
-                downward_compression: bool) \
-        -> np.ndarray:
+                downward_compression: bool,
+                linked_channels: bool = False) -> np.ndarray:
     """Compresses the dynamic range of a signal.
 
     Parameters
@@ -89,6 +258,8 @@ def _compressor(x: np.ndarray, threshold_db: float, ratio: float,
     downward_compression : bool
         When `True`, downward compression is applied. Otherwise, upward
         compression is applied.
+    linked_channels : bool, optional
+        When `True`, all channels get the same gain. Default: `False`.
 
     Returns
     -------
@@ -96,56 +267,12 @@ def _compressor(x: np.ndarray, threshold_db: float, ratio: float,
         Compressed signal.
 
     """
-    if mix_compressed > 1:
-        mix_compressed = 1
-    x_ = x.copy()
-    single_channel = False
-    if x_.ndim == 1:
-        x_ = x_[..., None]
-        single_channel = True
-
-    # Get function
-    compression_func = _get_knee_func(threshold_db, ratio, knee_factor_db,
-                                      downward_compression)
-
-    # RMS detector
-    attack_coeff = _get_smoothing_factor_ema(attack_samples, 1)
-    release_coeff = _get_smoothing_factor_ema(release_samples, 1)
-
-    # Iterate process over channels
-    for n in range(x_.shape[1]):
-        momentary_rms = 0
-        momentary_gain = 1
-        for i in np.arange(len(x)):
-            # RMS Detection – if peaks, directly take rms
-            samp = x[i]**2
-            if samp < momentary_rms:
-                coeff = attack_coeff
-            else:
-                coeff = 1
-            coeff = 0.01
-            momentary_rms = coeff*samp + (1-coeff)*momentary_rms
-
-            # Amount of required compression
-            samp_db = 10*np.log10(samp)
-            samp_db_comp = compression_func(samp_db)
-            np.nan_to_num(samp_db, False, 0)
-            np.nan_to_num(samp_db_comp, False, 0)
-            gain_factor = 10**((samp_db_comp-samp_db)/20)
-
-            # Gain depending on attack and release
-            if gain_factor > momentary_gain:
-                coeff = attack_coeff
-            else:
-                coeff = release_coeff
-            momentary_gain = coeff*gain_factor + (1-coeff)*momentary_gain
-
-            # Apply gain
-            x_[i, n] *= momentary_gain
-
-    if single_channel:
-        x_ = x_.squeeze()
-    return x_
+    engine = CompressorEngine(
+        threshold_db, ratio, knee_factor_db, attack_samples, release_samples,
+        mix_compressed, downward_compression, linked_channels)
+    if x.ndim == 1:
+        return engine.process(x[:, None])[:, 0]
+    return engine.process(x)
 
 
 def _get_knee_func(threshold_db: float, ratio: float, knee_factor_db: float,
@@ -170,11 +297,11 @@ def _get_knee_func(threshold_db: float, ratio: float, knee_factor_db: float,
                 elif (x - T > W / 2):
                     return T + (x - T) / R
 
-            y = np.zeros_like(x)
-            first_section = x - T < -W/2
-            y[first_section] = x[first_section]
+            # Levels in the first section (and at the threshold for a hard
+            # knee) remain unchanged
+            y = np.array(x, dtype=float)
 
-            second_section = np.abs(x - T) <= W / 2
+            second_section = (np.abs(x - T) <= W / 2) & (W > 0)
             y[second_section] = x[second_section] + \
                 (1/R - 1)*(x[second_section]-T+W/2)**2 / 2 / W
 
@@ -191,16 +318,15 @@ def _get_knee_func(threshold_db: float, ratio: float, knee_factor_db: float,
                 elif (x - T > W / 2):
                     return x
 
-            y = np.zeros_like(x)
+            # Levels in the third section (and at the threshold for a hard
+            # knee) remain unchanged
+            y = np.array(x, dtype=float)
             first_section = x - T < - W / 2
             y[first_section] = T + (x[first_section] - T) / R
 
-            second_section = np.abs(x - T) <= W / 2
+            second_section = (np.abs(x - T) <= W / 2) & (W > 0)
             y[second_section] = x[second_section] - \
                 (1/R - 1)*(x[second_section]-T-W/2)**2 / 2 / W
-
-            third_section = x - T > W / 2
-            y[third_section] = x[third_section]
             return y
 
     return compress_in_db
@@ -283,6 +409,441 @@ def _cross_fade_samples(x_output: np.ndarray,
                 x_fade_out[i:i+length] * (1 - mix_in[:length])
 
 
+# ========= Delay =============================================================
+class DelayEngine():
+    """Feedback comb filter `y[n] = x[n] + feedback*f(y[n-delay])` for time
+    data with shape (time samples, channels), where `f` is a saturation
+    function. Each block of `delay` samples only depends on the previous
+    one, so that the recursion is evaluated block by block with vectorized
+    operations. For a linear delay line (`f(x) = x`) with a short delay
+    (many blocks), it is a first-order recursion along the blocks that is
+    computed at once with `lfilter`. The last `delay` output samples are kept
+    as state, so that the time data can be passed in consecutive blocks.
+
+    """
+    def __init__(self, delay_samples: int, feedback: float,
+                 saturation_func=None):
+        """Constructor of the delay engine.
+
+        Parameters
+        ----------
+        delay_samples : int
+            Delay of the feedback in samples.
+        feedback : float
+            Gain of the feedback.
+        saturation_func : callable, optional
+            Function that is applied to the delayed output. It must take and
+            return arrays. Pass `None` for a linear delay line.
+            Default: `None`.
+
+        """
+        assert delay_samples > 0, 'Delay must be at least one sample'
+        self.delay_samples = int(delay_samples)
+        self.feedback = feedback
+        self.saturation_func = saturation_func
+        self.reset()
+
+    def reset(self):
+        """Sets the delay line to zero.
+
+        """
+        self.__delay_line = None
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        """Applies the delay to the next block of time data.
+
+        Parameters
+        ----------
+        x : `np.ndarray`
+            Time data with shape (time samples, channels). The number of
+            channels must remain the same for all blocks.
+
+        Returns
+        -------
+        `np.ndarray`
+            Output with the same shape.
+
+        """
+        assert x.ndim == 2, 'Time data must have shape (time samples, ' +\
+            'channels)'
+        delay = self.delay_samples
+        if self.__delay_line is None:
+            self.__delay_line = np.zeros((delay, x.shape[1]))
+        assert self.__delay_line.shape[1] == x.shape[1], \
+            'Number of channels does not match the delay line. Use reset() ' +\
+            'before processing a different number of channels'
+
+        length = len(x)
+        if self.saturation_func is None and delay < 256:
+            # Blocks of the delay length with shape (blocks, delay, channels)
+            number_blocks = int(np.ceil(length / delay))
+            blocks = np.zeros((number_blocks*delay, x.shape[1]),
+                              dtype=np.result_type(x, float))
+            blocks[:length] = x
+            blocks = blocks.reshape(number_blocks, delay, -1)
+            y, _ = lfilter([1], [1, -self.feedback], blocks, axis=0,
+                           zi=self.feedback*self.__delay_line[None])
+            y = y.reshape(-1, x.shape[1])[:length]
+            output = np.concatenate([self.__delay_line, y])
+        else:
+            output = np.empty((delay + length, x.shape[1]),
+                              dtype=np.result_type(x, float))
+            output[:delay] = self.__delay_line
+            saturation_func = self.saturation_func or (lambda y: y)
+            for start in range(0, length, delay):
+                stop = min(start + delay, length)
+                output[delay+start:delay+stop] = x[start:stop] + \
+                    self.feedback*saturation_func(output[start:stop])
+        self.__delay_line = output[-delay:].copy()
+        return output[delay:]
+
+
+# ========= Modulated delay line ==============================================
+class ModulatedDelayLine():
+    """Delay line with time-varying fractional delays for chorus, flanger or
+    vibrato effects. For time data with shape (time samples, channels) and
+    delays with shape (time samples, voices), the delayed samples of all
+    channels are gathered at once for each voice and interpolated linearly
+    or with a first-order allpass. The last input samples (and the states of
+    the allpass interpolation) are kept, so that the time data can be passed
+    in consecutive blocks.
+
+    References
+    ----------
+    - Laakso, T. I., Välimäki, V., Karjalainen, M., & Laine, U. K. (1996).
+      Splitting the unit delay. IEEE Signal Processing Magazine, 13(1),
+      30-60.
+
+    """
+    # The fractional delay of the allpass lies in [offset, offset + 1[. With
+    # this offset, the magnitude of the allpass coefficient is at most 0.236
+    # and the influence of previous outputs is below 1e-20 after 32 samples
+    __allpass_offset = (np.sqrt(5) - 1) / 2
+    __allpass_memory_samples = 32
+
+    def __init__(self, max_delay_samples: float, number_of_voices: int = 1,
+                 interpolation: str = 'linear'):
+        """Constructor of the modulated delay line.
+
+        Parameters
+        ----------
+        max_delay_samples : float
+            Maximum delay in samples. Larger delays are clipped.
+        number_of_voices : int, optional
+            Number of delayed voices. Default: 1.
+        interpolation : {'linear', 'allpass'} str, optional
+            Interpolation of the fractional delays. The allpass has a flat
+            magnitude response but needs a delay of at least 0.62 samples.
+            Default: `'linear'`.
+
+        """
+        interpolation = interpolation.lower()
+        assert interpolation in ('linear', 'allpass'), \
+            f'{interpolation} is not supported. Use linear or allpass'
+        assert max_delay_samples >= 0, 'Maximum delay must be non-negative'
+        assert number_of_voices > 0, 'There must be at least one voice'
+        self.interpolation = interpolation
+        self.max_delay_samples = max_delay_samples
+        self.number_of_voices = int(number_of_voices)
+        self.min_delay_samples = self.__allpass_offset \
+            if interpolation == 'allpass' else 0
+        self.reset()
+
+    def reset(self):
+        """Sets the delay line to zero.
+
+        """
+        self.__history = None
+
+    def process(self, x: np.ndarray, delays_samples: np.ndarray) \
+            -> np.ndarray:
+        """Delays the next block of time data with the delays of each voice
+        and returns the sum of all voices.
+
+        Parameters
+        ----------
+        x : `np.ndarray`
+            Time data with shape (time samples, channels). The number of
+            channels must remain the same for all blocks.
+        delays_samples : `np.ndarray`
+            Delay of each sample and voice in samples with shape (time
+            samples, voices). They are clipped to the range of the delay
+            line.
+
+        Returns
+        -------
+        `np.ndarray`
+            Sum of all delayed voices with the shape of the time data.
+
+        """
+        assert x.ndim == 2, 'Time data must have shape (time samples, ' +\
+            'channels)'
+        delays_samples = np.clip(
+            np.asarray(delays_samples).reshape(len(x), -1),
+            self.min_delay_samples, self.max_delay_samples)
+        assert delays_samples.shape[1] == self.number_of_voices, \
+            'There must be one delay for each voice'
+        memory = self.__allpass_memory_samples
+        history_length = int(np.ceil(self.max_delay_samples)) + 2
+        if self.__history is None:
+            self.__history = np.zeros((history_length, x.shape[1]))
+            self.__allpass_inputs = np.zeros(
+                (self.number_of_voices, memory, x.shape[1]))
+            self.__allpass_coefficients = np.zeros(
+                (self.number_of_voices, memory))
+        assert self.__history.shape[1] == x.shape[1], \
+            'Number of channels does not match the delay line. Use reset() ' +\
+            'before processing a different number of channels'
+
+        buffer = np.concatenate([self.__history, x], axis=0)
+        # Position of the current samples in the buffer
+        position = np.arange(history_length, len(buffer))
+        y = np.zeros(x.shape, dtype=np.result_type(x, float))
+        for v in range(self.number_of_voices):
+            if self.interpolation == 'linear':
+                index = position - delays_samples[:, v]
+                integer = np.floor(index).astype(int)
+                fraction = (index - integer)[:, None]
+                current = np.take(buffer, integer, axis=0)
+                following = np.take(
+                    buffer, np.minimum(integer + 1, len(buffer) - 1), axis=0)
+                y += current + fraction*(following - current)
+                continue
+            # Allpass: y[n] = eta*x[n-i] + x[n-i-1] - eta*y[n-1] realizes a
+            # delay of i + fraction
+            integer = np.floor(
+                delays_samples[:, v] - self.__allpass_offset).astype(int)
+            fraction = delays_samples[:, v] - integer
+            eta = (1 - fraction) / (1 + fraction)
+            inputs = eta[:, None]*np.take(buffer, position - integer, axis=0)\
+                + np.take(buffer, position - integer - 1, axis=0)
+            y += self.__allpass_recursion(v, inputs, -eta)
+        self.__history = buffer[-history_length:]
+        return y
+
+    def __allpass_recursion(self, voice: int, inputs: np.ndarray,
+                            coefficients: np.ndarray) -> np.ndarray:
+        """Computes `y[n] = inputs[n] + coefficients[n]*y[n-1]` with a
+        doubling scan over the last samples (kept as state), which is exact
+        up to the influence of the outputs older than the memory.
+
+        """
+        memory = self.__allpass_memory_samples
+        inputs = np.concatenate([self.__allpass_inputs[voice], inputs])
+        coefficients = np.concatenate(
+            [self.__allpass_coefficients[voice], coefficients])
+        self.__allpass_inputs[voice] = inputs[-memory:]
+        self.__allpass_coefficients[voice] = coefficients[-memory:]
+
+        # After each step, every sample contains the recursion over twice as
+        # many previous samples
+        shift = 1
+        while shift < memory:
+            inputs = np.concatenate(
+                [inputs[:shift],
+                 inputs[shift:] + coefficients[shift:, None]*inputs[:-shift]])
+            coefficients = np.concatenate(
+                [coefficients[:shift],
+                 coefficients[shift:]*coefficients[:-shift]])
+            shift *= 2
+        return inputs[memory:]
+
+
+class SpectralSubtractionEngine():
+    """Spectral subtraction with short-time Fourier transforms for time data
+    with shape (time samples, channels). All frames of a block and all
+    channels are transformed at once. The noise is either fixed or estimated
+    as a running average of the magnitude spectra of the frames whose level
+    is below a threshold. The input that is not framed yet, the noise
+    estimate and the overlap-add tail are kept, so that the time data can be
+    passed in consecutive blocks of any length.
+
+    The output is delayed by one window length (the frames are computed as if
+    the signal was preceded by one window of zeros).
+
+    """
+    def __init__(self, window: np.ndarray, step_size: int,
+                 subtraction_factor: float, subtraction_exponent: float,
+                 noise_forgetting_factor: float = 0.9,
+                 threshold_rms_dbfs: float = -40,
+                 noise_psd: np.ndarray = None,
+                 safety_threshold: float = 1e-4):
+        """Constructor of the spectral subtraction engine.
+
+        Parameters
+        ----------
+        window : `np.ndarray`
+            Window for analysis and synthesis.
+        step_size : int
+            Step size in samples between frames.
+        subtraction_factor : float
+            Factor for the subtracted noise spectrum.
+        subtraction_exponent : float
+            Exponent of the spectra during subtraction.
+        noise_forgetting_factor : float, optional
+            Factor of the running average of the noise estimate.
+            Default: 0.9.
+        threshold_rms_dbfs : float, optional
+            Level of a frame below which it is regarded as noise.
+            Default: -40.
+        noise_psd : `np.ndarray`, optional
+            Fixed noise power spectrum with shape (frequency) or (frequency,
+            channels). Pass `None` to estimate the noise adaptively.
+            Default: `None`.
+        safety_threshold : float, optional
+            Minimum value of the window envelope by which the output is
+            divided. Default: 1e-4.
+
+        """
+        self.window = np.asarray(window, dtype=float)
+        self.step_size = int(step_size)
+        assert 0 < self.step_size <= len(self.window), \
+            'Step size must be positive and at most the window length'
+        self.subtraction_factor = subtraction_factor
+        self.subtraction_exponent = subtraction_exponent
+        self.noise_forgetting_factor = noise_forgetting_factor
+        self.threshold_rms_dbfs = threshold_rms_dbfs
+        self.noise_psd = noise_psd
+
+        # Envelope of the squared windows (periodic with the step size)
+        self.__envelope = np.zeros(self.step_size)
+        for start in range(0, len(self.window), self.step_size):
+            segment = self.window[start:start+self.step_size]**2
+            self.__envelope[:len(segment)] += segment
+        self.__envelope = np.clip(
+            self.__envelope, a_min=safety_threshold, a_max=None)
+        self.reset()
+
+    @property
+    def latency_samples(self) -> int:
+        return len(self.window)
+
+    def reset(self):
+        """Sets the buffers and the noise estimate to zero.
+
+        """
+        self.__input = None
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        """Denoises the next block of time data.
+
+        Parameters
+        ----------
+        x : `np.ndarray`
+            Time data with shape (time samples, channels). The number of
+            channels must remain the same for all blocks.
+
+        Returns
+        -------
+        `np.ndarray`
+            Denoised time data with the same shape, delayed by one window
+            length.
+
+        """
+        assert x.ndim == 2, 'Time data must have shape (time samples, ' +\
+            'channels)'
+        length = len(self.window)
+        if self.__input is None:
+            # Time positions of the next frame and the next output sample
+            self.__next_frame = 0
+            self.__next_output = 0
+            self.__input = np.zeros((length, x.shape[1]))
+            self.__accumulator = np.zeros((0, x.shape[1]))
+            if self.noise_psd is None:
+                self.__noise = np.zeros((length//2+1, x.shape[1]))
+            else:
+                self.__noise = np.broadcast_to(
+                    np.abs(np.asarray(self.noise_psd).reshape(
+                        length//2+1, -1))**0.5,
+                    (length//2+1, x.shape[1]))
+        assert self.__input.shape[1] == x.shape[1], \
+            'Number of channels does not match the buffers. Use reset() ' +\
+            'before processing a different number of channels'
+
+        # All complete frames
+        buffer = np.concatenate([self.__input, x], axis=0)
+        number_frames = max(0, (len(buffer) - length)//self.step_size + 1)
+        self.__input = buffer[number_frames*self.step_size:]
+
+        if number_frames > 0:
+            frames = np.moveaxis(sliding_window_view(
+                buffer, length, axis=0)[::self.step_size][:number_frames],
+                -1, 0)
+            processed = self.__subtract(frames)
+            # Overlap-add starting at the position of the first frame
+            offset = self.__next_frame - self.__next_output
+            added = _overlap_add(
+                processed * self.window[:, None, None], self.step_size)
+            if len(self.__accumulator) < offset + len(added):
+                self.__accumulator = np.concatenate(
+                    [self.__accumulator,
+                     np.zeros((offset + len(added) - len(self.__accumulator),
+                               x.shape[1]))])
+            self.__accumulator[offset:offset+len(added)] += added
+            self.__next_frame += number_frames*self.step_size
+
+        # Output samples are complete once all frames that start before them
+        # have been added
+        if len(self.__accumulator) < len(x):
+            self.__accumulator = np.concatenate(
+                [self.__accumulator,
+                 np.zeros((len(x) - len(self.__accumulator), x.shape[1]))])
+        positions = self.__next_output + np.arange(len(x))
+        y = self.__accumulator[:len(x)] / \
+            self.__envelope[positions % self.step_size, None]
+        # Output of the zeros that precede the signal
+        y[positions < length] = 0
+        self.__accumulator = self.__accumulator[len(x):]
+        self.__next_output += len(x)
+        return y
+
+    def __subtract(self, frames: np.ndarray) -> np.ndarray:
+        """Applies the spectral subtraction to frames with shape (time
+        samples, frames, channels) and updates the noise estimate.
+
+        """
+        spectra = rfft(frames * self.window[:, None, None], axis=0)
+        magnitude = np.abs(spectra)
+
+        if self.noise_psd is None:
+            noise = self.__update_noise(
+                magnitude, 20*np.log10(np.clip(
+                    np.var(frames, axis=0), a_min=1e-25, a_max=None)))
+        else:
+            noise = self.__noise[:, None, :]
+
+        exponent = self.subtraction_exponent
+        subtracted = np.clip(
+            magnitude**exponent - self.subtraction_factor*noise**exponent,
+            a_min=0, a_max=None)
+        gain = np.divide(subtracted**(1/exponent), magnitude,
+                         out=np.zeros_like(magnitude), where=magnitude > 0)
+        return irfft(spectra * gain, n=len(self.window), axis=0)
+
+    def __update_noise(self, magnitude: np.ndarray,
+                       level_db: np.ndarray) -> np.ndarray:
+        """Running average of the magnitude spectra of the frames below the
+        threshold. Returns the noise estimate of each frame with shape
+        (frequency, frames, channels).
+
+        """
+        factor = self.noise_forgetting_factor
+        noise = np.empty_like(magnitude)
+        for channel, quiet in enumerate(level_db.T < self.threshold_rms_dbfs):
+            quiet_frames = np.flatnonzero(quiet)
+            estimates = self.__noise[:, channel, None]
+            if len(quiet_frames) > 0:
+                averaged, _ = lfilter(
+                    [1 - factor], [1, -factor],
+                    magnitude[:, quiet_frames, channel], axis=1,
+                    zi=factor*self.__noise[:, channel, None])
+                estimates = np.concatenate([estimates, averaged], axis=1)
+            # The estimate is held between frames below the threshold
+            noise[..., channel] = estimates[:, np.cumsum(quiet)]
+            self.__noise[:, channel] = estimates[:, -1]
+        return noise
+
+
 # ========= LFO ===============================================================
 class LFO():
     """Low-frequency oscillator.
@@ -1,13 +1,18 @@
 from ..classes import Signal, MultiBandSignal
-from .. import activity_detector
 from .._standard import (_get_framed_signal,
                          _reconstruct_framed_signal,
                          _pad_trim,
-                         _rms)
-from .._general_helpers import _get_next_power_2
+                         _rms,
+                         _indices_above_threshold_dbfs,
+                         _welch_setup,
+                         _welch_spectra,
+                         _welch_scaling)
+from .._general_helpers import _get_next_power_2, _get_smoothing_factor_ema
+from .._fft import rfft, irfft
 from ._effects import (
     _arctan_distortion, _clean_signal, _hard_clip_distortion,
-    _soft_clip_distortion, _compressor, _get_knee_func, LFO,
+    _soft_clip_distortion, _compressor, _get_knee_func, CompressorEngine,
+    DelayEngine, ModulatedDelayLine, SpectralSubtractionEngine, LFO,
     get_frequency_from_musical_rhythm, get_time_period_from_musical_rhythm)
 from ..plots import general_plot
 
@@ -55,8 +60,8 @@ class AudioEffect():
         if type(signal) == Signal:
             return self._apply_this_effect(signal)
         elif type(signal) == MultiBandSignal:
-            new_mbs = signal.copy()
-            for i, b in enumerate(new_mbs.bands):
+            new_mbs = signal.copy(with_time_data=False)
+            for i, b in enumerate(signal.bands):
                 new_mbs.bands[i] = self.apply(b)
             return new_mbs
         else:
@@ -174,6 +179,8 @@ class SpectralSubtractor(AudioEffect):
         - `set_advanced_parameters()`: fine-tuning parameters for both adaptive
           and static mode.
         - `apply()`: Apply effect on a given signal.
+        - `process_block()`: Denoise consecutive blocks of time data (adaptive
+          mode or with a spectrum to subtract).
 
         """
         super().__init__(description='Spectral Subtraction (Denoiser)')
@@ -218,6 +225,9 @@ class SpectralSubtractor(AudioEffect):
                     self.adaptive_mode = False
             self.spectrum_to_subtract = spectrum_to_subtract
 
+        # New parameters invalidate the state of block processing
+        self._block_engine = None
+
     def set_advanced_parameters(
             self, overlap_percent: int = 50,
             window_type: str = 'hann',
@@ -316,6 +326,7 @@ class SpectralSubtractor(AudioEffect):
         assert ad_release_time_ms >= 0, \
             'Release time for activity detector must be 0 or above'
         self.ad_release_time_ms = ad_release_time_ms
+        self._block_engine = None
 
     def set_parameters(self, adaptive_mode: bool = None,
                        threshold_rms_dbfs: float = None,
@@ -379,64 +390,112 @@ class SpectralSubtractor(AudioEffect):
         """Internal method to trigger the effect on a given signal.
 
         """
-        self._save_peak_values(signal.time_data)
+        self._save_peak_values(signal.time_data_view)
         if self.adaptive_mode:
             out = self._apply_adaptive_mode(signal)
         else:
             out = self._apply_offline(signal)
-        out.time_data = self._restore_peak_values(out.time_data)
+        out.time_data = self._restore_peak_values(out.time_data_view)
         return out
 
+    def _get_noise_psd(self, time_data: np.ndarray,
+                       sampling_rate_hz: int) -> np.ndarray:
+        """Estimates the noise power spectrum of all channels at once. The
+        noise samples of each channel are found with an activity detector and
+        their spectrum is computed with Welch's method (without scaling), as
+        if they were a signal on their own.
+
+        Parameters
+        ----------
+        time_data : `np.ndarray`
+            Time data with shape (time samples, channels).
+        sampling_rate_hz : int
+            Sampling rate of the time data.
+
+        Returns
+        -------
+        noise_psd : `np.ndarray`
+            Noise power spectrum with shape (frequency, channels).
+
+        """
+        noise = ~_indices_above_threshold_dbfs(
+            time_data, threshold_dbfs=self.threshold_rms_dbfs,
+            attack_smoothing_coeff=_get_smoothing_factor_ema(
+                self.ad_attack_time_ms/1e3, sampling_rate_hz),
+            release_smoothing_coeff=_get_smoothing_factor_ema(
+                self.ad_release_time_ms/1e3, sampling_rate_hz),
+            normalize=True).reshape(time_data.shape)
+
+        # Noise samples of each channel are moved to the beginning (in their
+        # order) and followed by zeros, so that all channels are framed and
+        # transformed at once
+        order = np.argsort(~noise, axis=0, kind='stable')
+        noise_td = np.take_along_axis(time_data, order, axis=0)
+        number_noise_samples = np.sum(noise, axis=0)
+        noise_td[np.arange(len(noise_td))[:, None] >=
+                 number_noise_samples[None, :]] = 0
+        if np.any(number_noise_samples == 0):
+            warn('No detected noise in some channels, threshold might be ' +
+                 'too low. No noise is subtracted from them')
+
+        # Welch's method (without scaling) on the noise of each channel. As
+        # for a single channel, the last frame is zero-padded
+        window, step, _ = _welch_setup(
+            self.window_type, len(self.window), self.overlap*100, 'mean',
+            None)
+        spectra = next(_welch_spectra(noise_td, window, step, detrend=True))
+        number_frames = number_noise_samples // step + 1
+        valid = np.arange(spectra.shape[1])[:, None] < number_frames[None, :]
+        noise_psd = np.sum(
+            (spectra.real**2 + spectra.imag**2) * valid[None, ...], axis=1)
+        return _welch_scaling(
+            noise_psd / number_frames, window, sampling_rate_hz, '', True)
+
     def _apply_offline(self, signal: Signal) -> Signal:
-        """Spectral Subtraction in static mode (offline).
+        """Spectral Subtraction in static mode (offline). All frames and
+        channels are processed at once.
 
         """
         # Lengths according to sampling rate
         self._compute_window(signal.sampling_rate_hz)
 
+        # Noise power spectrum of each channel
+        if not np.any(self.spectrum_to_subtract):
+            noise_psd = self._get_noise_psd(
+                signal.time_data_view, signal.sampling_rate_hz)
+        else:
+            noise_psd = np.repeat(
+                self.spectrum_to_subtract[:, None],
+                signal.number_of_channels, axis=1)
+        # It is already raised to the power of 2!
+        noise_psd = np.abs(noise_psd) ** (self.subtraction_exponent/2)
+
         # Pad zeros in beginning and end to avoid window instabilities
-        td = signal.time_data
+        td = signal.time_data_view
         td = _pad_trim(td, td.shape[0]+len(self.window), in_the_end=True)
         td = _pad_trim(td, td.shape[0]+len(self.window), in_the_end=False)
         original_length = td.shape[0]
 
         # Frame initial time data
-        td_framed = _get_framed_signal(td, len(self.window), self.step_size)
+        td_framed = _get_framed_signal(td, len(self.window), self.step_size,
+                                       read_only_view=True)
 
         # Windowed signal
-        td_windowed = td_framed * self.window[:, np.newaxis, np.newaxis]
-        td_spec = np.fft.rfft(td_windowed, axis=0)
-
-        # Phase
-        td_spec_phase = np.angle(td_spec)
-        td_spec_power = np.abs(td_spec) ** self.subtraction_exponent
-
-        for n in range(signal.number_of_channels):
-            if not np.any(self.spectrum_to_subtract):
-                # Obtain noise psd
-                _, noise = activity_detector(
-                    signal, channel=n, threshold_dbfs=self.threshold_rms_dbfs,
-                    attack_time_ms=self.ad_attack_time_ms,
-                    release_time_ms=self.ad_release_time_ms)
-                noise['noise'].set_spectrum_parameters(
-                    method='welch',
-                    window_length_samples=len(self.window),
-                    overlap_percent=self.overlap*100,
-                    window_type=self.window_type,
-                    scaling=None)
-                _, noise_psd = noise['noise'].get_spectrum()
-            else:
-                noise_psd = self.spectrum_to_subtract.copy()
-            # It is already raised to the power of 2!
-            noise_psd = np.abs(noise_psd).squeeze() ** \
-                (self.subtraction_exponent/2)
-            for i in range(td_spec.shape[1]):
-                temp = np.clip(
-                    td_spec_power[:, i, n] - self.subtraction_factor *
-                    noise_psd, a_min=0, a_max=None)
-                td_framed[:, i, n] = np.fft.irfft(
-                    temp**(1/self.subtraction_exponent) *
-                    np.exp(1j*td_spec_phase[:, i, n]))
+        td_framed = td_framed * self.window[:, np.newaxis, np.newaxis]
+        td_spec = rfft(td_framed, axis=0)
+
+        # Subtraction on the magnitudes of all frames and channels. The
+        # phase is kept by scaling the complex spectra
+        td_spec_magnitude = np.abs(td_spec)
+        temp = np.clip(
+            td_spec_magnitude ** self.subtraction_exponent -
+            self.subtraction_factor * noise_psd[:, np.newaxis, :],
+            a_min=0, a_max=None)
+        gain = np.divide(temp**(1/self.subtraction_exponent),
+                         td_spec_magnitude,
+                         out=np.zeros_like(td_spec_magnitude),
+                         where=td_spec_magnitude > 0)
+        td_framed = irfft(td_spec * gain, n=len(self.window), axis=0)
 
         # Reconstruct signal from time frames
         new_td = _reconstruct_framed_signal(
@@ -449,71 +508,93 @@ class SpectralSubtractor(AudioEffect):
         new_td = _pad_trim(new_td, new_td.shape[0]-len(self.window),
                            in_the_end=False)
 
-        denoised_signal = signal.copy()
+        denoised_signal = signal.copy(with_time_data=False)
         denoised_signal.time_data = new_td
         return denoised_signal
 
+    def __get_engine(self, sampling_rate_hz: int) \
+            -> SpectralSubtractionEngine:
+        """Returns a new engine for the adaptive mode or for a spectrum to
+        subtract.
+
+        """
+        self._compute_window(sampling_rate_hz)
+        return SpectralSubtractionEngine(
+            self.window, self.step_size, self.subtraction_factor,
+            self.subtraction_exponent, self.noise_forgetting_factor,
+            self.threshold_rms_dbfs,
+            None if self.adaptive_mode else self.spectrum_to_subtract)
+
     def _apply_adaptive_mode(self, signal: Signal) -> Signal:
         """Spectral Subtraction in adaptive mode.
 
         """
-        # Lengths and window
-        self._compute_window(signal.sampling_rate_hz)
+        engine = self.__get_engine(signal.sampling_rate_hz)
 
-        td = signal.time_data
-        td = _pad_trim(td, td.shape[0]+len(self.window), in_the_end=True)
-        td = _pad_trim(td, td.shape[0]+len(self.window), in_the_end=False)
-        original_length = td.shape[0]
+        # Pad zeros in the end so that the delayed output is complete
+        td = signal.time_data_view
+        td = _pad_trim(td, td.shape[0]+engine.latency_samples)
 
-        # Framed signal
-        td = _get_framed_signal(td, len(self.window), self.step_size)
+        # Passing the time data in chunks bounds the memory of the frames
+        chunk_length = 2**14
+        new_td = np.concatenate(
+            [engine.process(td[start:start+chunk_length])
+             for start in range(0, len(td), chunk_length)],
+            axis=0)[engine.latency_samples:]
 
-        # Get RMS values in dB for each time frame and channel
-        td_rms_db = 20*np.log10(np.clip(np.var(td, axis=0), a_min=1e-25,
-                                        a_max=None))
+        denoised_signal = signal.copy(with_time_data=False)
+        denoised_signal.time_data = new_td
+        return denoised_signal
 
-        # Windowed signal
-        td_windowed = td * self.window[:, np.newaxis, np.newaxis]
-        td_spec = np.fft.rfft(td_windowed, axis=0)
-
-        # Phase
-        td_spec_phase = np.angle(td_spec)
-        td_spec = np.abs(td_spec)
-
-        # Power spectrum
-        td_spec_power = td_spec ** self.subtraction_exponent
-
-        # Iterate over frames
-        for n in range(signal.number_of_channels):
-            # Noise estimate
-            noise_psd = np.zeros((len(self.window)//2+1))
-
-            print(f'Denoising channel {n+1} of {signal.number_of_channels}')
-            for i in range(td_spec.shape[1]):
-                if td_rms_db[i, n] < self.threshold_rms_dbfs:
-                    noise_psd = noise_psd * self.noise_forgetting_factor + \
-                        td_spec[:, i, n] * (1 - self.noise_forgetting_factor)
-                temp = np.clip(
-                    td_spec_power[:, i, n] - self.subtraction_factor *
-                    noise_psd**self.subtraction_exponent,
-                    a_min=0, a_max=None)
-                td[:, i, n] = np.fft.irfft(
-                    temp**(1/self.subtraction_exponent) *
-                    np.exp(1j*td_spec_phase[:, i, n]))
+    def process_block(self, block: np.ndarray,
+                      sampling_rate_hz: int) -> np.ndarray:
+        """Denoises a block of time data in adaptive mode or with a spectrum
+        to subtract. The frames that are not complete yet, the noise estimate
+        and the overlap-add tail are kept for the next block, so that
+        arbitrarily long signals can be denoised with constant memory. They
+        are reset with `reset()` or when the parameters change. Peak levels
+        are not restored.
 
-        # Reconstruct signal from time frames
-        new_td = _reconstruct_framed_signal(
-            td, self.step_size, self.window, original_length)
+        Parameters
+        ----------
+        block : `np.ndarray`
+            Time data with shape (time samples, channels) or (time samples).
+            The number of channels must remain the same for all blocks.
+        sampling_rate_hz : int
+            Sampling rate of the time data.
 
-        # Trim back to original length
-        new_td = _pad_trim(new_td, new_td.shape[0]-len(self.window),
-                           in_the_end=True)
-        new_td = _pad_trim(new_td, new_td.shape[0]-len(self.window),
-                           in_the_end=False)
+        Returns
+        -------
+        `np.ndarray`
+            Denoised block with the same shape as the input.
 
-        denoised_signal = signal.copy()
-        denoised_signal.time_data = new_td
-        return denoised_signal
+        Notes
+        -----
+        - The output is delayed by one window length (see `window_length`
+          after the first block). The first window of the output is zero.
+        - The static mode without a spectrum to subtract needs the whole
+          signal and is not supported.
+
+        """
+        if self._block_engine is None:
+            assert self.adaptive_mode or \
+                np.any(self.spectrum_to_subtract), \
+                'Block processing needs adaptive mode or a spectrum to ' +\
+                'subtract'
+            self._block_engine = self.__get_engine(sampling_rate_hz)
+            self._block_sampling_rate_hz = sampling_rate_hz
+        assert self._block_sampling_rate_hz == sampling_rate_hz, \
+            'Sampling rate does not match the buffers. Use reset() before ' +\
+            'processing a different sampling rate'
+        x = block if block.ndim == 2 else block[:, None]
+        y = self._block_engine.process(x)
+        return y if block.ndim == 2 else y[:, 0]
+
+    def reset(self):
+        """Resets the buffers and the noise estimate of block processing.
+
+        """
+        self._block_engine = None
 
 
 class Distortion(AudioEffect):
@@ -705,7 +786,7 @@ class Distortion(AudioEffect):
             Distorted signal.
 
         """
-        td = signal.time_data
+        td = signal.time_data_view
         self._save_peak_values(td)
 
         new_td = np.zeros_like(td)
@@ -717,7 +798,7 @@ class Distortion(AudioEffect):
 
         new_td = self._add_gain_in_db(new_td, self.post_gain_db)
 
-        distorted_signal = signal.copy()
+        distorted_signal = signal.copy(with_time_data=False)
         distorted_signal.time_data = new_td
         return distorted_signal
 
@@ -786,6 +867,9 @@ class Compressor(AudioEffect):
         if relative_to_peak_level is not None:
             self.relative_to_peak_level = relative_to_peak_level
 
+        # New parameters invalidate the state of block processing
+        self._block_engine = None
+
     def set_parameters(self, threshold_dbfs: float = None,
                        attack_time_ms: float = None,
                        release_time_ms: float = None, ratio: float = None,
@@ -825,7 +909,8 @@ class Compressor(AudioEffect):
                                 post_gain_db: float = 0,
                                 mix_percent: float = 100,
                                 automatic_make_up_gain: bool = True,
-                                downward_compression: bool = True):
+                                downward_compression: bool = True,
+                                linked_channels: bool = False):
         """The advanced parameters of the compressor.
 
         Parameters
@@ -851,6 +936,10 @@ class Compressor(AudioEffect):
             signal above the threshold level gets attenuated. If `False`,
             it acts as an upward compressor (expander) where the signal below
             the threshold gets amplified. Default: `True`.
+        linked_channels : bool, optional
+            When `True`, the level is detected with the maximum of all
+            channels and all channels get the same gain (linked stereo), so
+            that the stereo image is not altered. Default: `False`.
 
         Notes
         -----
@@ -871,6 +960,8 @@ class Compressor(AudioEffect):
         self.automatic_make_up_gain = automatic_make_up_gain
 
         self.downward_compression = downward_compression
+        self.linked_channels = linked_channels
+        self._block_engine = None
 
     def show_compression(self):
         """Plot the compressor with the actual settings.
@@ -922,13 +1013,10 @@ class Compressor(AudioEffect):
         if self.relative_to_peak_level:
             td /= self._peak_values
 
-        attack_time_samples = int(self.attack_time_ms*1e-3 * fs_hz)
-        release_time_samples = int(self.release_time_ms*1e-3 * fs_hz)
-
         td = _compressor(td, self.threshold_dbfs, self.ratio,
-                         self.knee_factor_db, attack_time_samples,
-                         release_time_samples, self.mix,
-                         self.downward_compression)
+                         self.knee_factor_db,
+                         *self.__get_times_samples(fs_hz), self.mix,
+                         self.downward_compression, self.linked_channels)
 
         # Restore original signal level
         if self.relative_to_peak_level:
@@ -939,12 +1027,68 @@ class Compressor(AudioEffect):
             td = self._restore_rms_values(td)
 
         # Post-compression gain
-        td = self._add_gain_in_db(td, self.pre_gain_db)
+        td = self._add_gain_in_db(td, self.post_gain_db)
 
-        compressed_sig = signal.copy()
+        compressed_sig = signal.copy(with_time_data=False)
         compressed_sig.time_data = td
         return compressed_sig
 
+    def __get_times_samples(self, sampling_rate_hz: int) -> tuple[int, int]:
+        """Returns attack and release times in samples.
+
+        """
+        return int(self.attack_time_ms*1e-3 * sampling_rate_hz), \
+            int(self.release_time_ms*1e-3 * sampling_rate_hz)
+
+    def process_block(self, block: np.ndarray,
+                      sampling_rate_hz: int) -> np.ndarray:
+        """Compresses a block of time data and keeps the states of the level
+        detection and gain smoothing for the next block, so that consecutive
+        blocks are compressed as one continuous signal. The states are reset
+        with `reset()` or when the parameters change.
+
+        Since the whole signal is unknown, the threshold must be absolute
+        (`relative_to_peak_level=False`) and no automatic make-up gain is
+        applied.
+
+        Parameters
+        ----------
+        block : `np.ndarray`
+            Time data with shape (time samples, channels) or (time samples).
+            The number of channels must remain the same for all blocks.
+        sampling_rate_hz : int
+            Sampling rate of the time data.
+
+        Returns
+        -------
+        `np.ndarray`
+            Compressed block with the same shape as the input.
+
+        """
+        assert not self.relative_to_peak_level, \
+            'Block processing is only supported with an absolute threshold'
+        if self._block_engine is None:
+            self._block_engine = CompressorEngine(
+                self.threshold_dbfs, self.ratio, self.knee_factor_db,
+                *self.__get_times_samples(sampling_rate_hz), self.mix,
+                self.downward_compression, self.linked_channels)
+            self._block_sampling_rate_hz = sampling_rate_hz
+        assert self._block_sampling_rate_hz == sampling_rate_hz, \
+            'Sampling rate does not match the states of the compressor. ' +\
+            'Use reset() before processing a different sampling rate'
+
+        x = block if block.ndim == 2 else block[:, None]
+        x = self._add_gain_in_db(x, self.pre_gain_db)
+        y = self._add_gain_in_db(
+            self._block_engine.process(x), self.post_gain_db)
+        return y if block.ndim == 2 else y[:, 0]
+
+    def reset(self):
+        """Resets the states of block processing.
+
+        """
+        self._block_engine = None
+
 
 class Tremolo(AudioEffect):
     """Tremolo effect that varies the amplitude of a signal according to a
@@ -1025,8 +1169,9 @@ class Tremolo(AudioEffect):
             modulation_signal = _pad_trim(self.modulator.copy(), len(signal))
         modulation_signal = np.abs(modulation_signal * self.depth + 1)
 
-        modulated_signal = signal.copy()
-        modulated_signal.time_data *= modulation_signal[..., None]
+        modulated_signal = signal.copy(with_time_data=False)
+        modulated_signal.time_data = \
+            signal.time_data_view * modulation_signal[..., None]
         return modulated_signal
 
 
@@ -1080,6 +1225,7 @@ class Chorus(AudioEffect):
             modulators = LFO(2, 'harmonic', random_phase=True)
         self.__set_parameters(depths_ms, base_delays_ms, modulators,
                               mix_percent)
+        self.set_advanced_parameters()
 
     def __set_parameters(self, depths_ms: float | np.ndarray,
                          base_delays_ms: float | np.ndarray,
@@ -1168,6 +1314,9 @@ class Chorus(AudioEffect):
                 'Mix percent must be below 100 and above 0'
             self.mix = mix_percent
 
+        # New parameters invalidate the state of block processing
+        self._block_engine = None
+
     def set_parameters(self, depths_ms: float | np.ndarray = None,
                        base_delays_ms: float | np.ndarray = None,
                        modulators: LFO | list | tuple | np.ndarray = None,
@@ -1199,6 +1348,33 @@ class Chorus(AudioEffect):
         assert self.number_of_voices is not None
         assert self.base_delays_ms is not None, 'Base delay cannot be None'
 
+    def set_advanced_parameters(self, interpolation: str = 'linear'):
+        """Sets the advanced parameters for the chorus effect.
+
+        Parameters
+        ----------
+        interpolation : {'linear', 'allpass'} str, optional
+            Interpolation of the fractional delays of the voices. `'allpass'`
+            uses a first-order allpass, which does not attenuate high
+            frequencies, but it needs delays of at least 0.62 samples.
+            Default: `'linear'`.
+
+        """
+        interpolation = interpolation.lower()
+        assert interpolation in ('linear', 'allpass'), \
+            f'{interpolation} is not supported. Use linear or allpass'
+        self.interpolation = interpolation
+        self._block_engine = None
+
+    def __get_engine(self, sampling_rate_hz: int,
+                     max_delay_ms: float) -> ModulatedDelayLine:
+        """Returns a new modulated delay line for the voices.
+
+        """
+        return ModulatedDelayLine(
+            max(max_delay_ms, 0)*1e-3*sampling_rate_hz, self.number_of_voices,
+            self.interpolation)
+
     def _apply_this_effect(self, signal: Signal) -> Signal:
         """Apply chorus effect.
 
@@ -1215,30 +1391,91 @@ class Chorus(AudioEffect):
         else:
             modulation = _pad_trim(self.modulators.copy(), len(signal))
 
-        # Delays in samples
-        modulation = np.round(modulation*1e-3*fs).astype(int)
-        max_delay_samples = np.abs(modulation).max()
-
-        # Original time data
-        td = _pad_trim(signal.time_data, le+max_delay_samples)
+        td = signal.time_data_view
         self._save_peak_values(td)
-        new_td = np.zeros_like(td)
 
-        # Add modulated voices. Could be improved...
-        for ind in np.arange(td.shape[0]-max_delay_samples):
-            new_td[ind, :] = td[ind, :]
-            for v in range(self.number_of_voices):
-                new_td[ind, :] += td[ind+modulation[ind, v], :]
+        # Add modulated voices (fractional delays in samples)
+        engine = self.__get_engine(fs, np.max(modulation))
+        new_td = td + engine.process(td, modulation*1e-3*fs)
 
         # Mix with clean signal
         new_td = new_td * self.mix + td * (1 - self.mix)
 
-        new_td = self._restore_peak_values(_pad_trim(new_td, le))
+        new_td = self._restore_peak_values(new_td)
 
-        modulated_signal = signal.copy()
+        modulated_signal = signal.copy(with_time_data=False)
         modulated_signal.time_data = new_td
         return modulated_signal
 
+    def process_block(self, block: np.ndarray,
+                      sampling_rate_hz: int) -> np.ndarray:
+        """Applies the chorus to a block of time data. The delay line and the
+        position of the modulators are kept for the next block, so that the
+        voices continue in the following blocks. They are reset with
+        `reset()` or when the parameters change. Peak levels are not
+        restored.
+
+        Parameters
+        ----------
+        block : `np.ndarray`
+            Time data with shape (time samples, channels) or (time samples).
+            The number of channels must remain the same for all blocks.
+        sampling_rate_hz : int
+            Sampling rate of the time data.
+
+        Returns
+        -------
+        `np.ndarray`
+            Block with the effect and the same shape as the input.
+
+        Notes
+        -----
+        - One period of each LFO is generated when the first block is
+          processed and it is repeated afterwards.
+        - Modulators passed as `np.ndarray` are zero after their end.
+
+        """
+        if self._block_engine is None:
+            if type(self.modulators) != np.ndarray:
+                self.__block_waveforms = [
+                    m.get_waveform(sampling_rate_hz) for m in self.modulators]
+                max_delay_ms = np.max(self.base_delays_ms + self.depths_ms)
+            else:
+                max_delay_ms = np.max(self.modulators)
+            self._block_engine = self.__get_engine(
+                sampling_rate_hz, max_delay_ms)
+            self._block_sampling_rate_hz = sampling_rate_hz
+            self.__block_position = 0
+        assert self._block_sampling_rate_hz == sampling_rate_hz, \
+            'Sampling rate does not match the delay line. Use reset() ' +\
+            'before processing a different sampling rate'
+        x = block if block.ndim == 2 else block[:, None]
+
+        # Modulation of this block
+        position = self.__block_position
+        if type(self.modulators) != np.ndarray:
+            modulation = np.zeros((len(x), self.number_of_voices))
+            for ind, waveform in enumerate(self.__block_waveforms):
+                modulation[:, ind] = np.take(
+                    waveform, np.arange(position, position+len(x)),
+                    mode='wrap') * self.depths_ms[ind] + \
+                    self.base_delays_ms[ind]
+        else:
+            modulation = _pad_trim(
+                self.modulators[position:position+len(x)], len(x))
+        self.__block_position += len(x)
+
+        y = x + self._block_engine.process(
+            x, modulation*1e-3*sampling_rate_hz)
+        y = y * self.mix + x * (1 - self.mix)
+        return y if block.ndim == 2 else y[:, 0]
+
+    def reset(self):
+        """Resets the delay line and the modulators of block processing.
+
+        """
+        self._block_engine = None
+
 
 class DigitalDelay(AudioEffect):
     """This applies a basic digital delay to a signal.
@@ -1279,6 +1516,9 @@ class DigitalDelay(AudioEffect):
             'Feedback must be larger than one'
         self.feedback = feedback
 
+        # New parameters invalidate the state of block processing
+        self._block_engine = None
+
     def set_parameters(self, delay_time_ms: float = None,
                        feedback: float = None):
         """Set the parameters for the tremolo effect. Passing `None` in this
@@ -1307,26 +1547,43 @@ class DigitalDelay(AudioEffect):
             If `None`, a linear digital delay line is applied. If `'arctan'`,
             some arctan saturation is added to the delayed signal. Pass
             a callable if a custom saturation should be applied. It must
-            take in 1 float and return 1 float in order to be valid.
+            take in 1 float and return 1 float in order to be valid. If it
+            also takes and returns arrays, whole blocks are passed at once.
             Default: `None`.
 
         """
         if saturation is None:
             saturation = 'digital'
-        saturation = saturation.lower()
+        self.__linear = False
+        if type(saturation) == str:
+            saturation = saturation.lower()
         if saturation == 'digital':
+            self.__linear = True
+
             def func(x):
                 return x
         elif saturation == 'arctan':
             def func(x):
                 return 0.5*np.arctan(2*x)
         else:
-            assert type(saturation(1.)) == float, \
+            assert isinstance(saturation(1.), float), \
                 'Saturation function might not be valid'
-
-            def func(x):
-                return saturation(x)
+            func = saturation
+            # Functions that only take floats are applied element-wise
+            try:
+                assert np.shape(saturation(np.zeros(2))) == (2, )
+            except Exception:
+                func = np.vectorize(saturation, otypes=[float])
         self.saturation_func = func
+        self._block_engine = None
+
+    def __get_engine(self, sampling_rate_hz: int) -> DelayEngine:
+        """Returns a new delay engine for a sampling rate.
+
+        """
+        return DelayEngine(
+            np.round(self.delay_ms*1e-3*sampling_rate_hz).astype(int),
+            self.feedback, None if self.__linear else self.saturation_func)
 
     def plot_delay(self):
         """Plots the delay decay with the selected parameters.
@@ -1340,15 +1597,11 @@ class DigitalDelay(AudioEffect):
 
         """
         fs = 2_000
-        delay_samples = np.round(
-            self.delay_ms*1e-3*fs).astype(int)
+        engine = self.__get_engine(fs)
 
-        imp = np.zeros(delay_samples*10)
+        imp = np.zeros((engine.delay_samples*10, 1))
         imp[0] = 1
-
-        for i in np.arange(delay_samples, len(imp)):
-            imp[i] = imp[i] + \
-                self.feedback * self.saturation_func(imp[i-delay_samples])
+        imp = engine.process(imp)[:, 0]
 
         imp = 20*np.log10(np.clip(np.abs(imp), a_min=1e-15, a_max=None))
 
@@ -1366,22 +1619,56 @@ class DigitalDelay(AudioEffect):
         """Apply delay effect.
 
         """
-        delay_samples = np.round(
-            self.delay_ms*1e-3*signal.sampling_rate_hz).astype(int)
+        engine = self.__get_engine(signal.sampling_rate_hz)
 
-        td = signal.time_data
+        td = signal.time_data_view
         self._save_peak_values(td)
 
         # Pad signal in the end so that some repetitions are added
-        padding = int(delay_samples*(1+self.feedback*15))
+        padding = int(engine.delay_samples*(1+self.feedback*15))
         td = np.append(td, np.zeros((padding, td.shape[1])), axis=0)
 
-        for i in np.arange(delay_samples, len(td)):
-            td[i, :] = td[i, :] + \
-                self.feedback * self.saturation_func(td[i-delay_samples, :])
+        td = engine.process(td)
 
         td = self._restore_peak_values(td)
 
-        delayed_signal = signal.copy()
+        delayed_signal = signal.copy(with_time_data=False)
         delayed_signal.time_data = td
         return delayed_signal
+
+    def process_block(self, block: np.ndarray,
+                      sampling_rate_hz: int) -> np.ndarray:
+        """Applies the delay to a block of time data and keeps the delay line
+        for the next block, so that the repetitions continue in the following
+        blocks. The delay line is reset with `reset()` or when the parameters
+        change. Peak levels are not restored.
+
+        Parameters
+        ----------
+        block : `np.ndarray`
+            Time data with shape (time samples, channels) or (time samples).
+            The number of channels must remain the same for all blocks.
+        sampling_rate_hz : int
+            Sampling rate of the time data.
+
+        Returns
+        -------
+        `np.ndarray`
+            Block with the delay and the same shape as the input.
+
+        """
+        if self._block_engine is None:
+            self._block_engine = self.__get_engine(sampling_rate_hz)
+            self._block_sampling_rate_hz = sampling_rate_hz
+        assert self._block_sampling_rate_hz == sampling_rate_hz, \
+            'Sampling rate does not match the delay line. Use reset() ' +\
+            'before processing a different sampling rate'
+        x = block if block.ndim == 2 else block[:, None]
+        y = self._block_engine.process(x)
+        return y if block.ndim == 2 else y[:, 0]
+
+    def reset(self):
+        """Resets the delay line of block processing.
+
+        """
+        self._block_engine = None
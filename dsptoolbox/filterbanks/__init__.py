@@ -21,21 +21,36 @@ Other:
 - `qmf_crossover()`: Quadrature mirror filters crossover.
 - `fractional_octave_bands()`: Butterworth bandpass filter bank with signal
   energy conservation.
+- `multirate_fractional_octave_bands()`: Same bands as
+  `fractional_octave_bands()` but each band is filtered at a decimated
+  sampling rate.
 - `weightning_filter()`: A- or C-Weightning filter.
 
+Design cache:
+
+- `set_design_cache()`: The filter banks and filters above (except the QMF
+  crossover) are designed only once for each set of parameters. Designs can
+  be saved in a directory for other processes.
+- `design_cache_info()`
+
 """
 from .filterbanks import (linkwitz_riley_crossovers,
                           reconstructing_fractional_octave_bands,
                           auditory_filters_gammatone,
                           fractional_octave_bands,
+                          multirate_fractional_octave_bands,
                           qmf_crossover,
                           weightning_filter)
+from ._design_cache import set_design_cache, design_cache_info
 
 __all__ = [
     'linkwitz_riley_crossovers',
     'reconstructing_fractional_octave_bands',
     'fractional_octave_bands',
+    'multirate_fractional_octave_bands',
     'auditory_filters_gammatone',
     'qmf_crossover',
-    'weightning_filter'
+    'weightning_filter',
+    'set_design_cache',
+    'design_cache_info',
 ]
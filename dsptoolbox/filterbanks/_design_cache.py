@@ -0,0 +1,255 @@
+"""
+Process-wide cache for the designs of standard filter banks and filters
+"""
+from collections import OrderedDict
+from functools import wraps
+from hashlib import sha256
+from inspect import signature
+from pickle import dumps, loads, HIGHEST_PROTOCOL
+from threading import Lock
+from warnings import warn, catch_warnings, simplefilter
+import os
+import tempfile
+import numpy as np
+
+
+class DesignCache():
+    """Least-recently-used cache for designed filters and filter banks. The
+    designs are saved pickled and every request returns a new unpickled
+    object, so that each caller gets its own coefficients and filter states.
+    Warnings that are raised while designing are saved along with the design
+    and raised again on every request.
+    Optionally, the designs are also saved in a directory, so that other
+    processes (e.g., workers of a batch job) can load them instead of
+    designing them again.
+
+    """
+    def __init__(self, max_entries: int = 64, directory: str = None):
+        """Constructor of the design cache.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of designs that are kept in memory. Pass 0 to
+            deactivate the cache in memory. Default: 64.
+        directory : str, optional
+            Directory where designs are saved and loaded from. Pass `None`
+            to keep designs only in memory. Default: `None`.
+
+        """
+        self.__lock = Lock()
+        self.__entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.max_entries = max_entries
+        self.directory = directory
+
+    @property
+    def max_entries(self) -> int:
+        return self.__max_entries
+
+    @max_entries.setter
+    def max_entries(self, new_max_entries: int):
+        assert new_max_entries >= 0, \
+            'Maximum number of entries must be a non-negative integer'
+        self.__max_entries = int(new_max_entries)
+        with self.__lock:
+            self.__evict()
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    @directory.setter
+    def directory(self, new_directory: str):
+        if new_directory is not None:
+            os.makedirs(new_directory, exist_ok=True)
+        self.__directory = new_directory
+
+    def get_or_design(self, key: tuple, design):
+        """Returns a new copy of the saved design. Otherwise, the design is
+        loaded from the directory or created, saved and returned.
+
+        Parameters
+        ----------
+        key : tuple
+            Hashable key with the name of the design function and all its
+            parameters.
+        design : callable
+            Function without arguments that returns the design.
+
+        Returns
+        -------
+        object
+            New copy of the design.
+
+        """
+        if self.max_entries == 0 and self.directory is None:
+            return design()
+        with self.__lock:
+            data = self.__entries.get(key)
+            if data is not None:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+        if data is not None:
+            return self.__unpack(data)
+        data = self.__load(key)
+        if data is None:
+            with self.__lock:
+                self.misses += 1
+            data = dumps(self.__record(design), HIGHEST_PROTOCOL)
+            self.__save(key, data)
+        else:
+            with self.__lock:
+                self.hits += 1
+        with self.__lock:
+            self.__entries[key] = data
+            self.__evict()
+        return self.__unpack(data)
+
+    def clear(self):
+        """Removes all designs from memory. Saved files are kept.
+
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def info(self) -> dict:
+        """Returns a dictionary with the state of the cache.
+
+        """
+        return dict(hits=self.hits, misses=self.misses,
+                    entries=len(self.__entries),
+                    max_entries=self.max_entries, directory=self.directory)
+
+    @staticmethod
+    def __record(design) -> tuple:
+        """Creates the design and records all warnings that are raised
+        meanwhile.
+
+        """
+        with catch_warnings(record=True) as recorded:
+            simplefilter('always')
+            new_design = design()
+        return new_design, [(w.category, str(w.message)) for w in recorded]
+
+    @staticmethod
+    def __unpack(data: bytes):
+        """Returns a new copy of a pickled design and raises the warnings of
+        its creation again (from the caller of the design function).
+
+        """
+        new_design, recorded = loads(data)
+        for category, message in recorded:
+            warn(message, category, stacklevel=4)
+        return new_design
+
+    def __evict(self):
+        """Discards least recently used entries until the maximum number of
+        entries is not exceeded.
+
+        """
+        while len(self.__entries) > self.max_entries:
+            self.__entries.popitem(last=False)
+
+    def __path(self, key: tuple) -> str:
+        """Path of the file of a design. The version of the package is part
+        of the name, so that designs of other versions are not loaded.
+
+        """
+        from .. import __version__
+        name = sha256(repr((__version__, key)).encode()).hexdigest()
+        return os.path.join(self.directory, f'{name}.pkl')
+
+    def __load(self, key: tuple) -> bytes:
+        """Loads a pickled design from the directory or returns `None`.
+
+        """
+        if self.directory is None:
+            return None
+        try:
+            with open(self.__path(key), 'rb') as design_file:
+                return design_file.read()
+        except OSError:
+            return None
+
+    def __save(self, key: tuple, data: bytes):
+        """Saves a pickled design in the directory. The file is written under
+        a temporary name and then renamed, so that concurrent processes never
+        read incomplete files.
+
+        """
+        if self.directory is None:
+            return
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.directory, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as design_file:
+            design_file.write(data)
+        os.replace(temporary_path, self.__path(key))
+
+
+_design_cache = DesignCache()
+
+
+def _hashable(value):
+    """Converts the parameters of a design into a hashable representation
+    that is the same for equal values (e.g., lists, tuples and arrays).
+
+    """
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _cached_design(function):
+    """Decorator for design functions of filters and filter banks. Each
+    design is created only once for a set of parameters and sampling rate
+    and a new copy is returned on every call.
+
+    """
+    function_signature = signature(function)
+
+    @wraps(function)
+    def cached_function(*args, **kwargs):
+        parameters = function_signature.bind(*args, **kwargs)
+        parameters.apply_defaults()
+        key = (function.__name__, _hashable(parameters.arguments))
+        return _design_cache.get_or_design(
+            key, lambda: function(*args, **kwargs))
+    return cached_function
+
+
+def set_design_cache(max_entries: int = 64, directory: str = None):
+    """Sets the cache for the designs of the filter banks and filters in this
+    module. Every design is created only once for its parameters and sampling
+    rate and each call returns a new copy of it (with its own filter states).
+    Warnings of the design are raised again on each call.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of designs that are kept in memory. The least recently
+        used ones are discarded first. Pass 0 to deactivate the cache.
+        Default: 64.
+    directory : str, optional
+        Directory in which the designs are saved as well. Processes that use
+        the same directory load the saved designs instead of creating them
+        again. Pass `None` to keep the designs only in memory.
+        Default: `None`.
+
+    """
+    _design_cache.max_entries = max_entries
+    _design_cache.directory = directory
+
+
+def design_cache_info() -> dict:
+    """Returns a dictionary with the number of `hits` and `misses`, the
+    number of saved `entries` in memory, `max_entries` and the `directory`
+    of the design cache.
+
+    """
+    return _design_cache.info()
@@ -7,13 +7,17 @@ from os import sep
 from pickle import dump, HIGHEST_PROTOCOL
 from copy import deepcopy
 
-from scipy.signal import (sosfilt, sosfilt_zi, butter, sosfiltfilt)
+from scipy.signal import (sosfilt, sosfilt_zi, butter, sosfiltfilt, firwin,
+                          kaiserord)
 from ..classes import Signal, MultiBandSignal, FilterBank, Filter
+from ..classes._filter import _filter_time_data, _filter_and_resample
 
 from ..generators import dirac
 from ..plots import general_plot
 from .._general_helpers import _get_normalized_spectrum
 from .._standard import _group_delay_direct
+from .._fft import rfft
+from ._gammatone_engine import GammaToneEngine, _gammatone_reconstruct
 
 
 # ============== First implementation
@@ -25,7 +29,9 @@ class LRFilterBank():
     It is a cascaded structure that handles every band and its respective
     initial values for the filters to work in streaming applications. Since
     the crossovers need allpasses at every other crossover frequency, the
-    structure used for the zi's is very convoluted.
+    zi's are saved in arrays for the crossovers (`cross_zi`) and for the
+    allpasses of each crossover (`allpass_zi`). All channels are filtered at
+    once.
 
     """
     # ======== Constructor and initiliazers ===================================
@@ -105,7 +111,11 @@ class LRFilterBank():
 
     def _create_filters_sos(self):
         """Creates and saves filter's sos representations in a list with
-        ascending order.
+        ascending order. Linkwitz-Riley filters (butterworth filters applied
+        twice) are additionally saved as one cascade per crossover and band
+        in an array with shape (crossovers, 2 (low, high), sections, 6). The
+        cascades of lower order are padded with sections that do not modify
+        the signal.
 
         """
         self.sos = []
@@ -116,6 +126,26 @@ class LRFilterBank():
                         fs=self.sampling_rate_hz, output='sos')
             self.sos.append([lp, hp])
 
+        number_sections = max([2*len(lp) for lp, _ in self.sos])
+        self._sos_cascades = np.zeros(
+            (self.number_of_cross, 2, number_sections, 6))
+        self._sos_cascades[..., [0, 3]] = 1
+        for i, sos_pair in enumerate(self.sos):
+            for band, sos in enumerate(sos_pair):
+                self._sos_cascades[i, band, :2*len(sos)] = \
+                    np.concatenate([sos, sos], axis=0)
+
+    def _get_zero_states(self, number_of_channels: int) -> tuple:
+        """Returns zero states for the crossovers with shape (crossovers,
+        2 (low, high), sections, 2, channels) and for the allpasses with
+        shape (crossovers, allpasses, 2 (low, high), sections, 2, channels).
+
+        """
+        shape = (*self._sos_cascades.shape[:-1], 2, number_of_channels)
+        cross_zi = np.zeros(shape)
+        allpass_zi = np.zeros((self.number_of_cross, *shape))
+        return cross_zi, allpass_zi
+
     def initialize_zi(self, number_of_channels: int = 1):
         """Initiates the zi of the filters for the given number of channels.
 
@@ -126,25 +156,16 @@ class LRFilterBank():
             Default: 1.
 
         """
-        # total signal separates low band from the rest (2 zi)
-        # all_cross_zi = [[cross0_zi], [cross1_zi], [cross2_zi], ...]
-        # cross0_zi = [[low_zi, high_zi], [allpass1_zi], [allpass2_zi], ...]
-        # allpass1_zi = [low_zi, high_zi]
-        self.channels_zi = []
-        for _ in range(number_of_channels):
-            cross_zi = []
-            allpass_zi = []
-            for i in range(self.number_of_cross):
-                band_zi_l = sosfilt_zi(self.sos[i][0])  # Low band
-                band_zi_h = sosfilt_zi(self.sos[i][1])  # High band
-                cross_zi.append([band_zi_l, band_zi_h])
-                al = []
-                for i2 in range(self.number_of_cross):
-                    allp_zi_l = sosfilt_zi(self.sos[i2][0])  # Low band
-                    allp_zi_h = sosfilt_zi(self.sos[i2][1])  # High band
-                    al.append([allp_zi_l, allp_zi_h])
-                    allpass_zi.append(al)
-            self.channels_zi.append([cross_zi, allpass_zi])
+        # Crossover i splits the remaining signal into the low band and the
+        # rest. Its low band passes through the allpasses of all following
+        # crossovers (allpass_zi[i, i2] with i2 > i)
+        self.cross_zi, self.allpass_zi = \
+            self._get_zero_states(number_of_channels)
+        for i in range(self.number_of_cross):
+            for band in range(2):
+                zi = sosfilt_zi(self._sos_cascades[i, band])[..., None]
+                self.cross_zi[i, band] = zi
+                self.allpass_zi[:, i, band] = zi
 
     # ======== Filtering ======================================================
     def filter_signal(self, s: Signal, mode: str = 'parallel',
@@ -184,54 +205,32 @@ class LRFilterBank():
             'Sampling rates do not match'
         assert not (activate_zi and zero_phase), \
             'Zero phase filtering and activating zi is a valid setting'
-        new_time_data = np.zeros((s.time_data.shape[0],
-                                  s.number_of_channels,
-                                  self.number_of_bands))
-        in_sig = s.time_data
+        in_sig = s.time_data_view
 
         # Filter with zi
         if activate_zi:
-            if not hasattr(self, 'channels_zi'):
+            if not hasattr(self, 'cross_zi'):
                 self.initialize_zi(s.number_of_channels)
-            elif len(self.channels_zi) != s.number_of_channels:
+            elif self.cross_zi.shape[-1] != s.number_of_channels:
                 self.initialize_zi(s.number_of_channels)
-            for ch in range(s.number_of_channels):
-                for cn in range(self.number_of_cross):
-                    band, in_sig[:, ch] = \
-                        self._two_way_split_zi(
-                            in_sig[:, ch], channel_number=ch,
-                            cross_number=cn)
-                    # band, in_sig[:, ch] = self._filt(in_sig[:, ch], cn)
-                    for ap_n in range(cn+1, self.number_of_cross):
-                        band = \
-                            self._allpass_zi(
-                                band, channel_number=ch,
-                                cross_number=cn, ap_number=ap_n)
-                        # band = self._filt(band, ap_n, split=False)
-                    new_time_data[:, ch, cn] = band
-                # Last high frequency component
-                new_time_data[:, ch, cn+1] = in_sig[:, ch]
+            new_time_data = self._filter_time_data(
+                in_sig, self.cross_zi, self.allpass_zi)
         # Zero phase
         elif zero_phase:
+            new_time_data = np.zeros((self.number_of_bands, *in_sig.shape))
             for cn in range(self.number_of_cross):
-                new_time_data[:, :, cn] = \
+                new_time_data[cn] = \
                     sosfiltfilt(self.sos[cn][0], in_sig, axis=0)
                 in_sig = sosfiltfilt(self.sos[cn][1], in_sig, axis=0)
             # Last high frequency component
-            new_time_data[:, :, cn+1] = in_sig
+            new_time_data[cn+1] = in_sig
         # Standard filtering
         else:
-            for cn in range(self.number_of_cross):
-                band, in_sig = self._filt(in_sig, cn)
-                for ap_n in range(cn+1, self.number_of_cross):
-                    band = self._filt(band, ap_n, split=False)
-                new_time_data[:, :, cn] = band
-            # Last high frequency component
-            new_time_data[:, :, cn+1] = in_sig
+            new_time_data = self._filter_time_data(in_sig)
 
         b = []
         for n in range(self.number_of_bands):
-            b.append(Signal(None, new_time_data[:, :, n], s.sampling_rate_hz,
+            b.append(Signal(None, new_time_data[n], s.sampling_rate_hz,
                             signal_type=s.signal_type))
         d = dict(
             readme='MultiBandSignal made using Linkwitz-Riley filter bank',
@@ -242,60 +241,77 @@ class LRFilterBank():
             out_sig = out_sig.collapse()
         return out_sig
 
-    # ======== Update zi's and backend filtering ============================
-    def _allpass_zi(self, s, channel_number, cross_number, ap_number):
-        # Unpack zi's
-        ap_zi = self.channels_zi[channel_number][1][cross_number][ap_number]
-        zi_l = ap_zi[0]
-        zi_h = ap_zi[1]
-        # Low band
-        s_l, zi_l = sosfilt(self.sos[ap_number][0], x=s, zi=zi_l)
-        s_l, zi_l = sosfilt(self.sos[ap_number][0], x=s_l, zi=zi_l)
-        # High band
-        s_h, zi_h = sosfilt(self.sos[ap_number][1], x=s, zi=zi_h)
-        s_h, zi_h = sosfilt(self.sos[ap_number][1], x=s_h, zi=zi_h)
-        # Pack zi's
-        ap_zi[0] = zi_l
-        ap_zi[1] = zi_h
-        self.channels_zi[channel_number][1][cross_number][ap_number] = ap_zi
-        # self.allpass_zi[cross_number][ap_number] = ap_zi
-        return s_l + s_h
-
-    def _two_way_split_zi(self, s, channel_number, cross_number):
-        # Unpack zi's
-        cross_zi = self.channels_zi[channel_number][0][cross_number]
-        # cross_zi = self.cross_zi[cross_number]
-        zi_l = cross_zi[0]
-        zi_h = cross_zi[1]
-        # Low band
-        s_l, zi_l = sosfilt(self.sos[cross_number][0], x=s, zi=zi_l)
-        s_l, zi_l = sosfilt(self.sos[cross_number][0], x=s_l, zi=zi_l)
-        # High band
-        s_h, zi_h = sosfilt(self.sos[cross_number][1], x=s, zi=zi_h)
-        s_h, zi_h = sosfilt(self.sos[cross_number][1], x=s_h, zi=zi_h)
-        # Pack zi's
-        cross_zi[0] = zi_l
-        cross_zi[1] = zi_h
-        self.channels_zi[channel_number][0][cross_number] = cross_zi
-        # self.cross_zi[cross_number] = cross_zi
-        return s_l, s_h
-
-    def _filt(self, s, f_number, split: bool = True):
-        """Filters signal with the sos corresponding to f_number.
-        `split=True` returns two bands; when `False`, the summed bands are
-        returned (allpass).
+    def process_block(self, block: np.ndarray) -> np.ndarray:
+        """Filters a block of time data and keeps the filter states for the
+        next block, so that consecutive blocks are filtered as one continuous
+        signal. No `Signal` or `MultiBandSignal` objects are created. The
+        states start from zero and can be reset with `reset()`. They are
+        independent of the zi's used by `filter_signal`.
+
+        Parameters
+        ----------
+        block : `np.ndarray`
+            Time data with shape (time samples, channels) or (time samples).
+            The number of channels must remain the same for all blocks.
+
+        Returns
+        -------
+        `np.ndarray`
+            Bands with shape (bands, time samples, channels) or (bands,
+            time samples) for 1D-input.
+
+        """
+        x = block if block.ndim == 2 else block[:, None]
+        state = getattr(self, '_block_state', None)
+        if state is None:
+            state = self._get_zero_states(x.shape[1])
+            self._block_state = state
+        assert state[0].shape[-1] == x.shape[1], \
+            'Number of channels does not match the filter states. Use ' +\
+            'reset() before processing a different number of channels'
+        y = self._filter_time_data(x, *state)
+        return y if block.ndim == 2 else y[..., 0]
+
+    def reset(self):
+        """Resets the states of `process_block`.
 
         """
-        # Low band
-        s_l = sosfilt(self.sos[f_number][0], x=s, axis=0)
-        s_l = sosfilt(self.sos[f_number][0], x=s_l, axis=0)
-        # High band
-        s_h = sosfilt(self.sos[f_number][1], x=s, axis=0)
-        s_h = sosfilt(self.sos[f_number][1], x=s_h, axis=0)
-        if split:
-            return s_l, s_h
-        else:
-            return s_l + s_h
+        self._block_state = None
+
+    # ======== Backend filtering ==============================================
+    def _filter_time_data(self, x: np.ndarray, cross_zi: np.ndarray = None,
+                          allpass_zi: np.ndarray = None) -> np.ndarray:
+        """Filters time data with shape (time samples, channels) and returns
+        the bands with shape (bands, time samples, channels). All channels
+        are filtered at once. If zi's are passed, they are updated in-place.
+
+        """
+        new_time_data = np.empty((self.number_of_bands, *x.shape))
+        for cn in range(self.number_of_cross):
+            band, x = self._split(
+                x, cn, None if cross_zi is None else cross_zi[cn])
+            for ap_n in range(cn+1, self.number_of_cross):
+                band = np.add(*self._split(
+                    band, ap_n,
+                    None if allpass_zi is None else allpass_zi[cn, ap_n]))
+            new_time_data[cn] = band
+        # Last high frequency component
+        new_time_data[-1] = x
+        return new_time_data
+
+    def _split(self, x: np.ndarray, cross_number: int,
+               zi: np.ndarray = None) -> tuple:
+        """Filters time data with the low- and highpass of a crossover. The
+        sum of both is an allpass. zi with shape (2, sections, 2, channels)
+        are updated in-place if passed.
+
+        """
+        sos = self._sos_cascades[cross_number]
+        if zi is None:
+            return sosfilt(sos[0], x, axis=0), sosfilt(sos[1], x, axis=0)
+        x_l, zi[0] = sosfilt(sos[0], x, zi=zi[0], axis=0)
+        x_h, zi[1] = sosfilt(sos[1], x, zi=zi[1], axis=0)
+        return x_l, x_h
 
     # ======== IR =============================================================
     def get_ir(self, length_samples: int = 1024, test_zi: bool = False):
@@ -380,7 +396,7 @@ class LRFilterBank():
                                range_y=[-30, 10])
         # Summed signal
         summed = np.sum(np.array(summed).T, axis=1)
-        sp_summed = np.fft.rfft(summed)
+        sp_summed = rfft(summed)
         f_s, sp_summed = \
             _get_normalized_spectrum(
                 f, sp_summed,
@@ -576,6 +592,10 @@ class GammaToneFilterBank(FilterBank):
         self._coefficients = coefficients
         self._normalizations = normalizations
 
+        # All bands are filtered at once by the engine
+        self._engine = GammaToneEngine(coefficients, normalizations)
+        self._reconstruction_history = None
+
         self._delay = 0.004  # Delay in ms
         self._compute_delays_and_phase_factors()
         self._compute_gains()
@@ -592,13 +612,7 @@ class GammaToneFilterBank(FilterBank):
 
         # apply filterbank to impulse to estimate the required values
         d = dirac(delay_samples + 3, sampling_rate_hz=self.sampling_rate_hz)
-        d = self.filter_signal(d, mode='parallel')
-        d = d.get_all_bands(channel=0)
-        real, imag = d.time_data, d.time_data_imaginary
-
-        real = real.T
-        imag = imag.T
-        ir = real + 1j * imag
+        ir = self._filter_time_data(d.time_data_view)[..., 0]
         env = np.abs(ir)
 
         # sample at which the maximum occurs
@@ -650,6 +664,102 @@ class GammaToneFilterBank(FilterBank):
 
         self._gains = gains.flatten()
 
+    # ======== Filtering ======================================================
+    def _filter_time_data(self, time_data: np.ndarray,
+                          workers: int = None) -> np.ndarray:
+        """Filters time data with shape (time samples, channels) with all
+        bands and zero initial states. Returns complex array with shape
+        (bands, time samples, channels).
+
+        """
+        engine = GammaToneEngine(
+            self._coefficients, self._normalizations, time_data.shape[1])
+        return engine.process(time_data, workers=workers)
+
+    def filter_signal(self, signal: Signal, mode: str = 'parallel',
+                      activate_zi: bool = False, zero_phase: bool = False,
+                      workers: int = None) -> Signal | MultiBandSignal:
+        """Applies the filter bank to a signal. In `'parallel'` and
+        `'summed'` mode, all bands are filtered at once by a dedicated engine
+        (unless zi's or zero-phase filtering are used). See
+        `FilterBank.filter_signal` for all details.
+
+        Parameters
+        ----------
+        signal : `Signal`
+            Signal to be filtered.
+        mode : str, optional
+            Way to apply filter bank to the signal. Supported modes are:
+            `'parallel'`, `'sequential'`, `'summed'`. Default: `'parallel'`.
+        activate_zi : bool, optional
+            Takes in the filter initial values and updates them for
+            streaming purposes. Default: `False`.
+        zero_phase : bool, optional
+            Activates zero_phase filtering for the filter bank. It cannot be
+            used at the same time with `zi=True`. Default: `False`.
+        workers : int, optional
+            Number of threads that filter the bands concurrently.
+            Default: `None`.
+
+        Returns
+        -------
+        new_sig : `'sequential'` or `'summed'` -> `Signal`.
+                  `'parallel'` -> `MultiBandSignal`.
+            New signal after filtering.
+
+        """
+        if activate_zi or zero_phase or \
+                type(signal) != Signal or \
+                mode.lower() not in ('parallel', 'summed'):
+            return super().filter_signal(
+                signal, mode=mode, activate_zi=activate_zi,
+                zero_phase=zero_phase, workers=workers)
+        assert signal.sampling_rate_hz == self.sampling_rate_hz, \
+            'Sampling rates do not match'
+
+        y = self._filter_time_data(signal.time_data_view, workers)
+        if mode.lower() == 'summed':
+            new_sig = signal.copy(with_time_data=False)
+            new_sig.time_data = y.sum(axis=0)
+            return new_sig
+        bands = []
+        for n in range(self.number_of_filters):
+            band = signal.copy(with_time_data=False)
+            band.time_data = y[n]
+            bands.append(band)
+        return MultiBandSignal(bands, same_sampling_rate=True)
+
+    def process_block(self, block: np.ndarray) -> np.ndarray:
+        """Filters a block of time data with all bands and keeps the filter
+        states for the next block. The states start from zero and can be
+        reset with `reset()`.
+
+        Parameters
+        ----------
+        block : `np.ndarray`
+            Time data with shape (time samples, channels) or (time samples).
+            The number of channels must remain the same for all blocks.
+
+        Returns
+        -------
+        `np.ndarray`
+            Complex output with shape (bands, time samples, channels) or
+            (bands, time samples) for 1D-input.
+
+        """
+        x = block if block.ndim == 2 else block[:, None]
+        if self._engine.number_of_channels != x.shape[1]:
+            self._engine.number_of_channels = x.shape[1]
+        y = self._engine.process(x)
+        return y if block.ndim == 2 else y[..., 0]
+
+    def reset(self):
+        """Resets the states of `process_block` and `reconstruct_block`.
+
+        """
+        self._engine.reset()
+        self._reconstruction_history = None
+
     # ======== Reconstruct signal =============================================
     def reconstruct(self, signal: MultiBandSignal) -> Signal:
         """This method reconstructs a signal filtered with the gamma tone
@@ -676,36 +786,49 @@ class GammaToneFilterBank(FilterBank):
         assert condition, \
             'Not all bands have imaginary time data. Reconstruction cannot ' +\
             'be done'
-        shape = (signal.number_of_bands,
-                 signal.bands[0].time_data.shape[0],
-                 signal.number_of_channels)
         # (bands, time samples, channels)
-        time = np.empty(shape, dtype='cfloat')
+        time = np.empty(
+            (signal.number_of_bands, len(signal.bands[0]),
+             signal.number_of_channels), dtype='cfloat')
         for ind, b in enumerate(signal.bands):
-            time[ind, :, :] = b.time_data + b.time_data_imaginary * 1j
+            time[ind].real = b.time_data_view
+            time[ind].imag = b.time_data_imaginary
 
-        # Reordering axis for later to (bands, channels, time samples) or
-        # (bands, time samples) when single channel
-        if time.shape[-1] == 1:
-            time = time.squeeze()
-        else:
-            time = np.moveaxis(time, -1, 1)
+        reconstructed_sig = signal.bands[0].copy(with_time_data=False)
+        reconstructed_sig.time_data, _ = _gammatone_reconstruct(
+            time, self._phase_factors, self._delays, self._gains)
+        return reconstructed_sig
 
-        reconstructed_sig = signal.bands[0].copy()
+    def reconstruct_block(self, block: np.ndarray) -> np.ndarray:
+        """Reconstructs a block of time data from the complex output of
+        `process_block`. The delays of the bands are applied with delay
+        lines, so that consecutive blocks are reconstructed as one continuous
+        signal.
 
-        # apply phase shift, delay, and gain
-        for bb, (phase_factor, delay, gain) in enumerate(zip(
-                self._phase_factors, self._delays, self._gains)):
+        Parameters
+        ----------
+        block : `np.ndarray`
+            Complex output of all bands with shape (bands, time samples,
+            channels) or (bands, time samples).
 
-            time[bb] = \
-                np.real(np.roll(time[bb], delay, axis=-1) * phase_factor) * \
-                gain
+        Returns
+        -------
+        `np.ndarray`
+            Reconstructed real time data with shape (time samples, channels)
+            or (time samples).
 
-        # sum and squeeze first axis (the signal is already real, but the data
-        # type is still complex)
-        reconstructed_sig.time_data = \
-            np.sum(np.real(time), axis=0)
-        return reconstructed_sig
+        """
+        y = block if block.ndim == 3 else block[..., None]
+        assert y.shape[0] == self.number_of_filters, \
+            'Number of bands does not match the filter bank'
+        history = self._reconstruction_history
+        if history is None or history.shape[-1] != y.shape[-1]:
+            history = np.zeros(
+                (y.shape[0], np.max(self._delays), y.shape[-1]))
+        reconstructed, self._reconstruction_history = \
+            _gammatone_reconstruct(
+                y, self._phase_factors, self._delays, self._gains, history)
+        return reconstructed if block.ndim == 3 else reconstructed[:, 0]
 
 
 class BaseCrossover(FilterBank):
@@ -1066,6 +1189,133 @@ class QMFCrossover(BaseCrossover):
 #         return [lp_filter, hp_filter]
 
 
+class MultirateOctaveFilterBank(FilterBank):
+    """Filter bank whose bands are processed at different sampling rates of
+    an octave decimation tree. The signal is decimated by 2 in each stage of
+    the tree and every band is filtered at the lowest sampling rate that is
+    adequate for its frequency range. The bands can be returned decimated or
+    upsampled back to the sampling rate of the input.
+
+    """
+    def __init__(self, filters: list, decimation_stages, info: dict = None):
+        """Constructor of the multirate filter bank.
+
+        Parameters
+        ----------
+        filters : list
+            List with the filters of each band. Each filter must have the
+            sampling rate of its stage of the decimation tree.
+        decimation_stages : array-like
+            Number of decimations by 2 for each band, i.e., the band is
+            filtered at the sampling rate `fs / 2**stage`.
+        info : dict, optional
+            Dictionary containing general information about the filter bank.
+            Default: `None`.
+
+        """
+        super().__init__(filters, same_sampling_rate=False, info=info)
+        self.decimation_stages = np.atleast_1d(
+            np.asarray(decimation_stages, dtype=int))
+        assert len(self.decimation_stages) == self.number_of_filters, \
+            'There must be one decimation stage per filter'
+        assert np.all(self.decimation_stages >= 0), \
+            'Decimation stages must be non-negative'
+        self.input_sampling_rate_hz = int(
+            self.filters[0].sampling_rate_hz *
+            2**self.decimation_stages[0])
+        for f, stage in zip(self.filters, self.decimation_stages):
+            assert f.sampling_rate_hz * 2**stage == \
+                self.input_sampling_rate_hz, \
+                'Sampling rates of the filters do not match the decimation ' +\
+                'stages'
+        self.info['decimation_stages'] = self.decimation_stages
+        self.info['input_sampling_rate_hz'] = self.input_sampling_rate_hz
+
+    def filter_signal(self, signal: Signal, mode: str = 'parallel',
+                      activate_zi: bool = False, zero_phase: bool = False,
+                      upsample: bool = True) -> MultiBandSignal | Signal:
+        """Filters a signal with all bands. The signal is decimated once per
+        stage (polyphase) and each band is filtered at its own sampling rate.
+
+        Parameters
+        ----------
+        signal : `Signal`
+            Signal to be filtered. It must have the sampling rate of the
+            input of the decimation tree.
+        mode : str, optional
+            Way to apply filter bank to the signal. Supported modes are:
+            `'parallel'` and `'summed'`. Default: `'parallel'`.
+        activate_zi : bool, optional
+            Streaming with zi's is not supported for this filter bank.
+            Default: `False`.
+        zero_phase : bool, optional
+            Activates zero-phase filtering of each band. Default: `False`.
+        upsample : bool, optional
+            When `True`, the bands are upsampled (polyphase) to the sampling
+            rate of the input. Otherwise, each band is returned with its own
+            sampling rate. `'summed'` mode requires upsampling.
+            Default: `True`.
+
+        Returns
+        -------
+        new_sig : `MultiBandSignal` or `Signal`
+            `MultiBandSignal` for `'parallel'` and `Signal` for `'summed'`.
+
+        """
+        mode = mode.lower()
+        assert mode in ('parallel', 'summed'), \
+            f'{mode} is not supported. Use either parallel or summed'
+        assert not (mode == 'summed' and not upsample), \
+            'Summed mode is only valid with upsampling'
+        assert not activate_zi, \
+            'Streaming with zi is not supported for multirate filtering'
+        assert signal.sampling_rate_hz == self.input_sampling_rate_hz, \
+            'Sampling rates do not match'
+
+        time_data = signal.time_data_view
+        length = len(time_data)
+        summed = mode == 'summed'
+        bands = [None]*self.number_of_filters
+        new_time_data = 0
+        for stage in range(np.max(self.decimation_stages)+1):
+            if stage > 0:
+                time_data = _filter_and_resample(
+                    time_data, 1, 2, [_octave_resampling_filter(2), [1]],
+                    polyphase=True)
+            indices = np.nonzero(self.decimation_stages == stage)[0]
+            # Upsampling is linear, so that the bands of a stage are summed
+            # before upsampling them only once
+            outputs = [_filter_time_data(self.filters[ind], time_data,
+                                         zero_phase=zero_phase)
+                       for ind in indices]
+            if summed and len(outputs) > 0:
+                outputs = [np.sum(outputs, axis=0)]
+            if upsample and stage > 0:
+                outputs = [
+                    _filter_and_resample(
+                        out, 2**stage, 1,
+                        [_octave_resampling_filter(2**stage), [1]],
+                        polyphase=True)[:length]
+                    for out in outputs]
+            if summed:
+                new_time_data = new_time_data + sum(outputs)
+                continue
+            for ind, out in zip(indices, outputs):
+                bands[ind] = out
+
+        if summed:
+            new_sig = signal.copy(with_time_data=False)
+            new_sig.time_data = new_time_data
+            return new_sig
+        for ind in range(self.number_of_filters):
+            band = signal.copy(with_time_data=False)
+            if not upsample:
+                band.sampling_rate_hz = self.filters[ind].sampling_rate_hz
+            band.time_data = bands[ind]
+            bands[ind] = band
+        return MultiBandSignal(bands, same_sampling_rate=upsample)
+
+
 def _crossover_downsample(signal: Signal, filters: list, mode: str,
                           down_factor: int = 2) -> Signal | MultiBandSignal:
     """Apply crossover and downsample on signal.
@@ -1107,16 +1357,13 @@ def _crossover_downsample(signal: Signal, filters: list, mode: str,
                 signal,
                 new_sampling_rate_hz=signal.sampling_rate_hz//down_factor)
     else:
-        new_time_data = \
-            np.zeros((signal.time_data.shape[0]//down_factor,
-                      signal.number_of_channels, n_filt))
+        new_time_data = 0
         for n in range(n_filt):
             s = filters[n].filter_and_resample_signal(
                 signal,
                 new_sampling_rate_hz=signal.sampling_rate_hz//down_factor)
-            new_time_data[:, :, n] = s.time_data
-        new_time_data = np.sum(new_time_data, axis=-1)
-        out_sig = signal.copy()
+            new_time_data = new_time_data + s.time_data_view
+        out_sig = signal.copy(with_time_data=False)
         out_sig.sampling_rate_hz = signal.sampling_rate_hz//down_factor
         out_sig.time_data = new_time_data
     return out_sig
@@ -1153,3 +1400,15 @@ def _reconstruct_from_crossover_upsample(sig_low: Signal, sig_high: Signal,
         sig_high, new_sampling_rate_hz=sig_low.sampling_rate_hz*up_factor)
     rec_sig.time_data += temp_sig.time_data
     return rec_sig
+
+
+def _octave_resampling_filter(factor: int) -> np.ndarray:
+    """Lowpass FIR filter for polyphase resampling by an integer factor in
+    a multirate octave filter bank. The bands lie below half of the lower
+    nyquist frequency, so that the transition band can go from there to 1.5
+    times the lower nyquist frequency (only aliases and images of the
+    transition band fall in between). Attenuation is 60 dB.
+
+    """
+    numtaps, beta = kaiserord(60, 1/factor)
+    return firwin(numtaps | 1, 1/factor, window=('kaiser', beta))
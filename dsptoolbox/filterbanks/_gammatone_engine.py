@@ -0,0 +1,154 @@
+"""
+Batched filtering and reconstruction for the gamma tone filter bank
+"""
+import numpy as np
+from scipy.signal import sosfilt
+
+from ..classes._filter import _map_in_threads
+from .._config import _complex_dtype
+
+
+class GammaToneEngine():
+    """Applies all bands of a gamma tone filter bank (fourth-order cascades
+    of complex one-pole filters) to time data at once. The filter states of
+    all bands and channels are kept in one array with shape (bands, sections,
+    2, channels), so that the time data can be passed in consecutive blocks.
+    The output of all bands is written into one contiguous complex array.
+
+    """
+    def __init__(self, coefficients: np.ndarray, normalizations: np.ndarray,
+                 number_of_channels: int = 1):
+        """Constructor of the engine.
+
+        Parameters
+        ----------
+        coefficients : `np.ndarray`
+            Complex pole of each band.
+        normalizations : `np.ndarray`
+            Normalization (gain) of each band.
+        number_of_channels : int, optional
+            Number of channels of the time data. Default: 1.
+
+        """
+        coefficients = np.atleast_1d(coefficients)
+        normalizations = np.atleast_1d(normalizations)
+        assert coefficients.ndim == 1 and \
+            coefficients.shape == normalizations.shape, \
+            'There must be one coefficient and one normalization per band'
+        # The four one-pole filters of each band are combined into two
+        # sections with a double pole (half the passes over the data),
+        # shape (bands, 2, 6)
+        self.sos = np.zeros((len(coefficients), 2, 6), dtype='cfloat')
+        self.sos[:, :, 0] = 1
+        self.sos[:, :, 3] = 1
+        self.sos[:, :, 4] = -2*coefficients[:, None]
+        self.sos[:, :, 5] = coefficients[:, None]**2
+        self.sos[:, 1, 0] = normalizations
+        self.number_of_channels = number_of_channels
+
+    @property
+    def number_of_bands(self) -> int:
+        return self.sos.shape[0]
+
+    @property
+    def number_of_channels(self) -> int:
+        return self.__number_of_channels
+
+    @number_of_channels.setter
+    def number_of_channels(self, new_number: int):
+        assert new_number > 0, 'There must be at least one channel'
+        self.__number_of_channels = int(new_number)
+        self.reset()
+
+    def reset(self):
+        """Sets all filter states to zero.
+
+        """
+        self.__state = np.zeros(
+            (*self.sos.shape[:2], 2, self.number_of_channels),
+            dtype='cfloat')
+
+    def process(self, x: np.ndarray, workers: int = None) -> np.ndarray:
+        """Filters the next block of time data with all bands and updates the
+        filter states.
+
+        Parameters
+        ----------
+        x : `np.ndarray`
+            Time data with shape (time samples, channels).
+        workers : int, optional
+            Number of threads that filter the bands concurrently. `None`
+            filters all bands in the calling thread. Default: `None`.
+
+        Returns
+        -------
+        y : `np.ndarray`
+            Complex output with shape (bands, time samples, channels).
+
+        """
+        assert x.ndim == 2 and x.shape[1] == self.number_of_channels, \
+            'Time data must have shape (time samples, channels) with the ' +\
+            'number of channels of the engine'
+        y = np.empty((self.number_of_bands, *x.shape),
+                     dtype=_complex_dtype(x))
+
+        def filter_band(band: int):
+            y[band], self.__state[band] = sosfilt(
+                self.sos[band], x, zi=self.__state[band], axis=0)
+
+        for _ in _map_in_threads(
+                filter_band, range(self.number_of_bands), workers):
+            pass
+        return y
+
+
+def _gammatone_reconstruct(y: np.ndarray, phase_factors: np.ndarray,
+                           delays: np.ndarray, gains: np.ndarray,
+                           history: np.ndarray = None) -> tuple:
+    """Sums all bands of a gamma tone filter bank with their delays, phase
+    factors and gains (Section 4 in Hohmann 2002).
+
+    Parameters
+    ----------
+    y : `np.ndarray`
+        Complex output of all bands with shape (bands, time samples,
+        channels).
+    phase_factors : `np.ndarray`
+        Phase factor of each band.
+    delays : `np.ndarray`
+        Delay in samples of each band.
+    gains : `np.ndarray`
+        Gain of each band.
+    history : `np.ndarray`, optional
+        Weighted real output of the previous block with shape (bands, maximum
+        delay, channels). Pass `None` to delay the bands circularly as if the
+        time data were the whole signal. Default: `None`.
+
+    Returns
+    -------
+    reconstructed : `np.ndarray`
+        Real time data with shape (time samples, channels).
+    history : `np.ndarray`
+        History for the next block or `None` if none was passed.
+
+    """
+    weights = phase_factors * gains
+    length = y.shape[1]
+    reconstructed = np.zeros(y.shape[1:], dtype=y.real.dtype)
+    if history is not None:
+        history = history.copy()
+        max_delay = history.shape[1]
+    for band, delay in enumerate(np.asarray(delays, dtype=int)):
+        # Real part of the band with phase factor and gain
+        weighted = y[band].real * weights[band].real - \
+            y[band].imag * weights[band].imag
+        if history is None:
+            delay %= length
+            reconstructed[delay:] += weighted[:length-delay]
+            reconstructed[:delay] += weighted[length-delay:]
+            continue
+        # Delay line
+        extended = np.concatenate([history[band], weighted], axis=0)
+        reconstructed += extended[max_delay-delay:max_delay-delay+length]
+        history[band] = extended[length:]
+    return reconstructed, history
@@ -7,9 +7,13 @@ from scipy.signal import windows, bilinear_zpk
 import warnings
 from .. import (Filter, FilterBank, fractional_octave_frequencies,
                 erb_frequencies)
-from ._filterbank import (LRFilterBank, GammaToneFilterBank, QMFCrossover)
+from ._filterbank import (LRFilterBank, GammaToneFilterBank, QMFCrossover,
+                          MultirateOctaveFilterBank)
+from ._design_cache import _cached_design
+from .._fft import irfft
 
 
+@_cached_design
 def linkwitz_riley_crossovers(crossover_frequencies_hz, order,
                               sampling_rate_hz: int) ->\
         LRFilterBank:
@@ -35,6 +39,7 @@ def linkwitz_riley_crossovers(crossover_frequencies_hz, order,
     return LRFilterBank(crossover_frequencies_hz, order, sampling_rate_hz)
 
 
+@_cached_design
 def reconstructing_fractional_octave_bands(
         frequency_range_hz=[63, 16000], octave_fraction: int = 1,
         overlap: float = 1, slope: int = 0, n_samples: int = 2**11,
@@ -152,7 +157,7 @@ def reconstructing_fractional_octave_bands(
     g = g.astype(complex) * np.exp(-1j * 2 * np.pi * frequencies * group_delay)
 
     # get impulse responses
-    time = np.fft.irfft(g)
+    time = irfft(g)
 
     # window
     time *= windows.hann(time.shape[-1])
@@ -168,6 +173,7 @@ def reconstructing_fractional_octave_bands(
     return filt_bank
 
 
+@_cached_design
 def auditory_filters_gammatone(frequency_range_hz=[20, 20000],
                                resolution: float = 1,
                                sampling_rate_hz: int = None) \
@@ -203,7 +209,10 @@ def auditory_filters_gammatone(frequency_range_hz=[20, 20000],
     -------
     Apart from all the methods of the `FilterBank` class, there is also the
     `reconstruct()` method, which takes a `MultiBandSignal` and recreates
-    the original `Signal` from it.
+    the original `Signal` from it. All bands are filtered at once in
+    `'parallel'` and `'summed'` mode. For streaming, `process_block()`
+    returns the complex output of all bands for a block of time data and
+    `reconstruct_block()` sums it back.
 
     References
     ----------
@@ -278,6 +287,7 @@ def qmf_crossover(lowpass: Filter) -> QMFCrossover:
     return QMFCrossover(lowpass)
 
 
+@_cached_design
 def fractional_octave_bands(frequency_range_hz=[31.5, 16e3],
                             octave_fraction: int = 1, filter_order: int = 6,
                             sampling_rate_hz: int = None):
@@ -344,6 +354,99 @@ def fractional_octave_bands(frequency_range_hz=[31.5, 16e3],
     return octave_filter_bank
 
 
+@_cached_design
+def multirate_fractional_octave_bands(frequency_range_hz=[31.5, 16e3],
+                                      octave_fraction: int = 1,
+                                      filter_order: int = 6,
+                                      sampling_rate_hz: int = None) \
+        -> MultirateOctaveFilterBank:
+    """Create a fractional octave filter bank with the same bands as
+    `fractional_octave_bands` but where each band is designed and filtered at
+    the lowest adequate sampling rate of an octave decimation tree. The signal
+    is decimated by 2 in each stage (polyphase) so that the low-frequency
+    bands need a fraction of the computational effort. The bands can be
+    returned decimated or upsampled to the original sampling rate.
+
+    A band is filtered at the sampling rate `fs / 2**stage` if its upper
+    cut-off frequency is below 40% of the nyquist frequency of that rate.
+    Since sampling rates must be integers, the number of stages is limited by
+    the number of times that the sampling rate is divisible by 2 (e.g., 7 for
+    48 kHz but only 2 for 44.1 kHz).
+
+    The band levels agree with `fractional_octave_bands` (within 0.1 dB for
+    white noise), but the waveforms are not the same. Aliases from the
+    transition band of the resampling filters leak into the decimated bands,
+    so that the difference to the full-rate bands is around -30 dB relative
+    to the band energy (between -23 and -34 dB for third octaves at 48 kHz).
+
+    Parameters
+    ----------
+    frequency_range_hz : array-like, optional
+        Frequency range in Hz for which to compute the filter bank.
+        Default: [31.5, 16000].
+    octave_fraction : int, optional
+        Octave fraction to use. Default: 1.
+    filter_order : int, optional
+        Filter order to be used. Less than 4 is not recommended. Default: 6.
+    sampling_rate_hz : int
+        Sampling rate in Hz.
+
+    Returns
+    -------
+    octave_filter_bank : `MultirateOctaveFilterBank`
+        Filter bank containing fractional octave band filters. Use
+        `filter_signal(..., upsample=False)` to obtain the decimated bands.
+
+    References
+    ----------
+    - ANSI S1.11:2004.
+
+    """
+    assert sampling_rate_hz is not None, \
+        'A sampling rate must be passed for the filter bank'
+    frequency_range_hz = np.atleast_1d(np.squeeze(frequency_range_hz))
+    frequency_range_hz.sort()
+    assert len(frequency_range_hz) == 2, \
+        'Frequency range must contain exactly two entries'
+    assert frequency_range_hz[-1] < sampling_rate_hz//2, \
+        'The highest frequency in the range is higher than the nyquist ' +\
+        'frequency'
+
+    # Number of decimation stages with integer sampling rates
+    max_stages = 0
+    while sampling_rate_hz % 2**(max_stages+1) == 0:
+        max_stages += 1
+
+    lower, upper = fractional_octave_frequencies(
+        octave_fraction, frequency_range_hz, return_cutoff=True)[2]
+
+    filters = []
+    stages = []
+    for ind in range(len(lower)):
+        top = 'bandpass'
+        freqs = [lower[ind], upper[ind]]
+        stage = 0
+        if upper[ind] > sampling_rate_hz//2:
+            top = 'highpass'
+            freqs = lower[ind]
+        else:
+            while stage < max_stages and \
+                    upper[ind] < 0.4 * sampling_rate_hz / 2**(stage+2):
+                stage += 1
+        f = Filter('iir', dict(type_of_pass=top,
+                               filter_design_method='butter',
+                               order=filter_order,
+                               freqs=freqs),
+                   sampling_rate_hz=sampling_rate_hz // 2**stage)
+        filters.append(f)
+        stages.append(stage)
+
+    return MultirateOctaveFilterBank(
+        filters, stages,
+        info={'Type of filter bank': 'Multirate fractional octave bands'})
+
+
+@_cached_design
 def weightning_filter(weightning: str = 'a', sampling_rate_hz: int = None):
     """Returns a digital IIR weightning filter according to [1]. The
     approximation is based on the coefficients given in [2].
@@ -8,6 +8,7 @@ from ..classes.signal_class import Signal
 from .._general_helpers import (
     _normalize, _fade, _pad_trim, _frequency_weightning)
 from ..classes._filter import _impulse
+from .._fft import irfft
 
 
 def noise(type_of_noise: str = 'white', length_seconds: float = 1,
@@ -92,7 +93,7 @@ def noise(type_of_noise: str = 'white', length_seconds: float = 1,
     elif type_of_noise == 'grey':
         w = _frequency_weightning(f, 'a', db_output=False)
         mag[id_low:, :] /= w[id_low:][..., None]
-    t_vec = np.fft.irfft(mag*np.exp(1j*ph), n=l_samples, axis=0)
+    t_vec = irfft(mag*np.exp(1j*ph), n=l_samples, axis=0)
     vec = _normalize(t_vec, dbfs=peak_level_dbfs, mode='peak')
     if fade is not None:
         fade_length = 0.05 * length_seconds
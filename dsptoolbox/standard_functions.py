@@ -21,7 +21,9 @@ from ._standard import (_latency,
                         _exact_center_frequencies_fractional_octaves,
                         _kaiser_window_beta,
                         _indices_above_threshold_dbfs,
-                        _detrend, _rms, _fractional_latency)
+                        _detrend, _rms, _fractional_latency,
+                        _welch_setup, _welch_weighted_sum, _welch_scaling)
+from ._config import _float_dtype, _complex_dtype
 from ._general_helpers import (
     _pad_trim, _normalize, _fade, _check_format_in_path,
     _get_smoothing_factor_ema)
@@ -90,13 +92,13 @@ def latency(in1: Signal | MultiBandSignal,
                 'Number of channels between the two signals must match'
             assert type(in2) == Signal, \
                 'Both signals must be of type Signal'
-            td2 = in2.time_data
+            td2 = in2.time_data_view
         else:
             assert in1.number_of_channels > 1, \
                 'Signal must have at least 2 channels to compare'
             td2 = None
         return latency_func(
-            in1.time_data, td2, polynomial_points=polynomial_points)
+            in1.time_data_view, td2, polynomial_points=polynomial_points)
     elif type(in1) == MultiBandSignal:
         if in2 is not None:
             assert type(in2) == MultiBandSignal, \
@@ -154,17 +156,15 @@ def pad_trim(signal: Signal | MultiBandSignal, desired_length_samples: int,
         for n in range(signal.number_of_channels):
             new_time_data[:, n] = \
                 _pad_trim(
-                    signal.time_data[:, n],
+                    signal.time_data_view[:, n],
                     desired_length_samples,
                     in_the_end=in_the_end)
-        new_sig = signal.copy()
-        if hasattr(new_sig, 'window'):
-            del new_sig.window
+        new_sig = signal.copy(with_time_data=False)
         new_sig.time_data = new_time_data
     elif type(signal) == MultiBandSignal:
         assert signal.same_sampling_rate, \
             'Padding or trimming is not supported for multirate signals'
-        new_sig = signal.copy()
+        new_sig = signal.copy(with_time_data=False)
         for ind, b in enumerate(signal.bands):
             new_sig.bands[ind] = pad_trim(
                 b, desired_length_samples, in_the_end)
@@ -207,17 +207,16 @@ def merge_signals(in1: Signal | MultiBandSignal, in2: Signal | MultiBandSignal,
             'Both signals have to be type Signal'
         assert in1.sampling_rate_hz == in2.sampling_rate_hz, \
             'Sampling rates do not match'
-        if in1.time_data.shape[0] != in2.time_data.shape[0]:
+        if len(in1) != len(in2):
             if padding_trimming:
-                in2 = pad_trim(in2, in1.time_data.shape[0], in_the_end=at_end)
+                in2 = pad_trim(in2, len(in1), in_the_end=at_end)
             else:
                 raise ValueError(
                     'Signals have different lengths and padding or trimming ' +
                     'is not activated')
-        new_time_data = np.append(in1.time_data, in2.time_data, axis=1)
-        new_sig = in1.copy()
-        if hasattr(new_sig, 'window'):
-            del new_sig.window
+        new_time_data = np.append(
+            in1.time_data_view, in2.time_data_view, axis=1)
+        new_sig = in1.copy(with_time_data=False)
         new_sig.time_data = new_time_data
     elif type(in1) == MultiBandSignal:
         assert type(in2) == MultiBandSignal, \
@@ -296,10 +295,9 @@ def resample(sig: Signal, desired_sampling_rate_hz: int) -> Signal:
     ratio = Fraction(
         numerator=desired_sampling_rate_hz, denominator=sig.sampling_rate_hz)
     u, d = ratio.as_integer_ratio()
-    new_time_data = resample_poly(sig.time_data, up=u, down=d, axis=0)
-    new_sig = sig.copy()
-    if hasattr(new_sig, 'window'):
-        del new_sig.window
+    new_time_data = resample_poly(
+        sig.time_data_view, up=u, down=d, axis=0)
+    new_sig = sig.copy(with_time_data=False)
     new_sig.time_data = new_time_data
     new_sig.sampling_rate_hz = desired_sampling_rate_hz
     return new_sig
@@ -399,17 +397,17 @@ def normalize(sig: Signal | MultiBandSignal, peak_dbfs: float = -6,
 
     """
     if type(sig) == Signal:
-        new_sig = sig.copy()
-        new_time_data = np.empty_like(sig.time_data)
+        new_sig = sig.copy(with_time_data=False)
+        new_time_data = np.empty_like(sig.time_data_view)
         if each_channel:
             for n in range(sig.number_of_channels):
                 new_time_data[:, n] = \
-                    _normalize(sig.time_data[:, n], peak_dbfs)
+                    _normalize(sig.time_data_view[:, n], peak_dbfs)
         else:
-            new_time_data = _normalize(sig.time_data, peak_dbfs)
+            new_time_data = _normalize(sig.time_data_view, peak_dbfs)
         new_sig.time_data = new_time_data
     elif type(sig) == MultiBandSignal:
-        new_sig = sig.copy()
+        new_sig = sig.copy(with_time_data=False)
         for ind in range(sig.number_of_bands):
             new_sig.bands[ind] = normalize(sig.bands[ind], peak_dbfs)
     else:
@@ -477,9 +475,9 @@ def fade(sig: Signal, type_fade: str = 'lin',
     assert length_fade_seconds < sig.time_vector_s[-1], \
         'Fade length should not be longer than the signal itself'
 
-    new_time_data = np.empty_like(sig.time_data)
+    new_time_data = np.empty_like(sig.time_data_view)
     for n in range(sig.number_of_channels):
-        vec = sig.time_data[:, n]
+        vec = sig.time_data_view[:, n].copy()
         if at_start:
             new_time_data[:, n] = _fade(
                 vec, length_fade_seconds,
@@ -490,7 +488,7 @@ def fade(sig: Signal, type_fade: str = 'lin',
                 vec, length_fade_seconds,
                 mode=type_fade,
                 sampling_rate_hz=sig.sampling_rate_hz, at_start=False)
-    new_sig = sig.copy()
+    new_sig = sig.copy(with_time_data=False)
     new_sig.time_data = new_time_data
     return new_sig
 
@@ -597,9 +595,9 @@ def true_peak_level(signal: Signal | MultiBandSignal) \
         # Resample by 4
         sig_over = resample(sig, sig.sampling_rate_hz*4)
         true_peak_levels = 20*np.log10(np.max(
-            np.abs(sig_over.time_data), axis=0) * up_factor)
+            np.abs(sig_over.time_data_view), axis=0) * up_factor)
         peak_levels = 20*np.log10(np.max(
-            np.abs(sig.time_data), axis=0) * up_factor)
+            np.abs(sig.time_data_view), axis=0) * up_factor)
     elif type(signal) == MultiBandSignal:
         true_peak_levels = \
             np.empty((signal.number_of_bands, signal.number_of_channels))
@@ -664,9 +662,9 @@ def fractional_delay(sig: Signal | MultiBandSignal, delay_seconds: float,
                  'Delay it manually by creating another signal object, if ' +
                  'needed.')
         delay_samples = delay_seconds*sig.sampling_rate_hz
-        assert delay_samples < sig.time_data.shape[0], \
+        assert delay_samples < len(sig), \
             'Delay too large for the given signal'
-        assert order + 1 < sig.time_data.shape[0], \
+        assert order + 1 < len(sig), \
             'Filter order is longer than the signal itself'
         if channels is None:
             channels = np.arange(sig.number_of_channels)
@@ -724,17 +722,14 @@ def fractional_delay(sig: Signal | MultiBandSignal, delay_seconds: float,
         # compute filter and match dimensions
         frac_delay_filter = (sinc * kaiser).squeeze()
 
-        # Copy data
-        new_time_data = sig.time_data
-
-        # Create space for the filter in the end of signal
+        # Create space for the filter in the end of signal (new array)
         new_time_data = _pad_trim(
-            new_time_data,
-            sig.time_data.shape[0] + len(frac_delay_filter) - 1)
+            sig.time_data_view,
+            len(sig) + len(frac_delay_filter) - 1)
 
         # Delay channels
         new_time_data[:, channels] = convolve(
-            sig.time_data[:, channels], frac_delay_filter[..., None],
+            sig.time_data_view[:, channels], frac_delay_filter[..., None],
             mode='full')
 
         # =========== apply integer delay =====================================
@@ -760,17 +755,15 @@ def fractional_delay(sig: Signal | MultiBandSignal, delay_seconds: float,
 
         # =========== handle length ===========================================
         if keep_length:
-            new_time_data = new_time_data[:sig.time_data.shape[0], :]
+            new_time_data = new_time_data[:len(sig), :]
 
         # =========== give out object =========================================
-        out_sig = sig.copy()
-        if hasattr(out_sig, 'window'):
-            del out_sig.window
+        out_sig = sig.copy(with_time_data=False)
         out_sig.time_data = new_time_data
 
     elif type(sig) == MultiBandSignal:
         new_bands = []
-        out_sig = sig.copy()
+        out_sig = sig.copy(with_time_data=False)
         for b in sig.bands:
             new_bands.append(
                 fractional_delay(b, delay_seconds, channels, keep_length))
@@ -871,14 +864,11 @@ def activity_detector(signal: Signal, threshold_dbfs: float = -20,
     noise_indices = ~signal_indices
 
     # Separate signals
-    detected_sig = signal.copy()
-    noise = signal.copy()
-    if hasattr(detected_sig, 'window'):
-        del detected_sig.window
-        del noise.window
+    detected_sig = signal.copy(with_time_data=False)
+    noise = signal.copy(with_time_data=False)
 
     try:
-        detected_sig.time_data = signal.time_data[signal_indices, 0]
+        detected_sig.time_data = signal.time_data_view[signal_indices, 0]
     except ValueError as e:
         warn('No detected activity, threshold might be too high. Detected ' +
              'signal will be a vector filled with zeroes')
@@ -886,7 +876,7 @@ def activity_detector(signal: Signal, threshold_dbfs: float = -20,
         detected_sig.time_data = np.zeros(500)
 
     try:
-        noise.time_data = signal.time_data[noise_indices, 0]
+        noise.time_data = signal.time_data_view[noise_indices, 0]
     except ValueError as e:
         warn('No detected noise, threshold might be too low. Noise will be ' +
              'a vector filled with zeroes')
@@ -922,11 +912,11 @@ def detrend(sig: Signal | MultiBandSignal, polynomial_order: int = 0) \
             'Polynomial order should be positive'
         td = sig.time_data
         new_td = _detrend(td, polynomial_order)
-        detrended_sig = sig.copy()
+        detrended_sig = sig.copy(with_time_data=False)
         detrended_sig.time_data = new_td
         return detrended_sig
     elif type(sig) == MultiBandSignal:
-        detrended_sig = sig.copy()
+        detrended_sig = sig.copy(with_time_data=False)
         for n in range(sig.number_of_bands):
             detrended_sig.bands[n] = detrend(
                 sig.bands[n], polynomial_order)
@@ -955,11 +945,11 @@ def rms(sig: Signal | MultiBandSignal, in_dbfs: bool = True) -> np.ndarray:
 
     """
     if type(sig) == Signal:
-        rms = _rms(sig.time_data)
+        rms = _rms(sig.time_data_view)
     elif type(sig) == MultiBandSignal:
         rms = np.zeros((sig.number_of_bands, sig.number_of_channels))
         for ind, b in enumerate(sig):
-            rms[ind, :] = _rms(b.time_data)
+            rms[ind, :] = _rms(b.time_data_view)
     else:
         raise TypeError('Passed signal should be either a Signal or ' +
                         'MultiBandSignal type')
@@ -1163,13 +1153,13 @@ def envelope(signal: Signal | MultiBandSignal, mode: str = 'analytic',
     if type(signal) == Signal:
         signal = detrend(signal, 1)
         if mode == 'analytic':
-            env = signal.time_data
+            env = signal.time_data_view
             env = np.abs(hilbert(env, axis=0))
             return env
         else:
             assert window_length_samples > 0,\
                 'Window length must be more than 1 sample'
-            rms_vec = signal.time_data
+            rms_vec = signal.time_data_view
             rms_vec = convolve(
                 rms_vec**2,
                 np.ones(window_length_samples)[..., None]
@@ -1190,3 +1180,169 @@ def envelope(signal: Signal | MultiBandSignal, mode: str = 'analytic',
         return rms_vec
     else:
         raise TypeError('Signal must be type Signal or MultiBandSignal')
+
+
+class WelchAccumulator():
+    """This class computes power spectral densities or cross-spectral matrices
+    with Welch's method from a signal that is passed block by block. Only the
+    running sum of the spectra and a tail of the last samples (at most one
+    window) are kept, so that arbitrarily long recordings can be analyzed
+    with constant memory.
+
+    """
+    def __init__(self, sampling_rate_hz: int,
+                 window_length_samples: int = 1024, window_type='hann',
+                 overlap_percent: float = 50, detrend: bool = True,
+                 scaling='power spectral density',
+                 cross_spectra: bool = False,
+                 forgetting_factor: float = 1.):
+        """Constructor of the accumulator. The parameters have the same
+        meaning as in `Signal.set_spectrum_parameters` (and
+        `Signal.set_csm_parameters`). Without forgetting, the result after
+        passing all blocks is equal to the welch spectrum (or CSM) of the
+        whole signal with mean averaging.
+
+        Parameters
+        ----------
+        sampling_rate_hz : int
+            Sampling rate of the signal in Hz.
+        window_length_samples : int, optional
+            Window size. Default: 1024.
+        window_type : str, optional
+            Choose type of window. `scipy.signal.windows.get_window()` is used.
+            Pass a tuple if the window needs extra parameters, e.g.,
+            ('chebwin', 50). Default: `'hann'`.
+        overlap_percent : float, optional
+            Overlap in percent. Default: 50.
+        detrend : bool, optional
+            Detrending (subtracting mean). Default: True.
+        scaling : str, optional
+            Scaling for welch's method. Use `'power spectrum'`,
+            `'power spectral density'`, `'amplitude spectrum'` or
+            `'amplitude spectral density'`. Pass `None` to avoid any scaling.
+            Default: `'power spectral density'`.
+        cross_spectra : bool, optional
+            When `True`, the cross-spectral matrix is computed instead of the
+            auto-spectra. Default: `False`.
+        forgetting_factor : float, optional
+            Weight of the previous average for each new frame, i.e., an
+            exponential average is computed when it is smaller than 1. It
+            must be in (0, 1]. A frame that lies `n` frames in the past has
+            weight `forgetting_factor**n`, so that the effective memory is
+            around `1/(1-forgetting_factor)` frames. Default: 1 (no
+            forgetting).
+
+        Notes
+        -----
+        - Only the mean is available as average since the median would require
+          all frames.
+        - The spectra are accumulated in double precision. The result has the
+          precision of the passed data.
+
+        """
+        assert sampling_rate_hz > 0, 'Sampling rate must be positive'
+        assert 0 < forgetting_factor <= 1, \
+            'Forgetting factor must be in (0, 1]'
+        self.sampling_rate_hz = sampling_rate_hz
+        self.window_length_samples = window_length_samples
+        self.cross_spectra = cross_spectra
+        self.forgetting_factor = forgetting_factor
+        self.detrend = detrend
+        self.__window, self.__step, self.__scaling = _welch_setup(
+            window_type, window_length_samples, overlap_percent, 'mean',
+            scaling)
+        self.reset()
+
+    def reset(self):
+        """Discards all accumulated data. The parameters are kept.
+
+        """
+        self.number_of_channels = None
+        self.number_of_frames = 0
+        self.__tail = None
+        self.__sum = 0
+        self.__weights = 0
+
+    def update(self, block: Signal | np.ndarray):
+        """Passes a new block of the signal. Its length is arbitrary.
+
+        Parameters
+        ----------
+        block : `Signal` or `np.ndarray`
+            New block with shape (time samples, channels). The number of
+            channels must stay the same for all blocks.
+
+        """
+        if type(block) == Signal:
+            assert block.sampling_rate_hz == self.sampling_rate_hz, \
+                'Sampling rate does not match'
+            block = block.time_data_view
+        else:
+            block = np.asarray(block)
+            if block.ndim == 1:
+                block = block[..., None]
+        assert block.ndim == 2, \
+            'Block must have shape (time samples, channels)'
+        if self.number_of_channels is None:
+            self.number_of_channels = block.shape[1]
+        assert block.shape[1] == self.number_of_channels, \
+            'Number of channels does not match'
+
+        data = block if self.__tail is None else \
+            np.concatenate([self.__tail, block], axis=0)
+
+        # Only frames that are complete are accumulated, the rest of the
+        # samples are kept for the next block
+        n_frames = (len(data) - self.window_length_samples) // self.__step + 1
+        if n_frames > 0:
+            products_sum, weights_sum, _ = _welch_weighted_sum(
+                data, self.__window, self.__step, self.detrend,
+                self.cross_spectra, self.forgetting_factor, n_frames)
+            decay = self.forgetting_factor**n_frames
+            self.__sum = self.__sum*decay + products_sum
+            self.__weights = self.__weights*decay + weights_sum
+            self.number_of_frames += n_frames
+        else:
+            n_frames = 0
+        self.__tail = data[n_frames*self.__step:].copy()
+
+    def result(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the spectra of all passed blocks. Without forgetting, the
+        last samples that do not fill a complete frame are zero-padded (like
+        it is done when computing the spectrum of a `Signal`), but they are
+        kept for further updates. With forgetting, only complete frames are
+        used since the zero-padded frames would have the largest weights.
+
+        Returns
+        -------
+        f : `np.ndarray`
+            Frequency vector.
+        spectra : `np.ndarray`
+            Spectra with shape (frequency, channels) or cross-spectral matrix
+            with shape (frequency, channels, channels).
+
+        """
+        assert self.__tail is not None, \
+            'No data has been passed. Use update first'
+        if self.forgetting_factor == 1 or self.number_of_frames == 0:
+            products_sum, weights_sum, n_frames = _welch_weighted_sum(
+                self.__tail, self.__window, self.__step, self.detrend,
+                self.cross_spectra, self.forgetting_factor)
+            decay = self.forgetting_factor**n_frames
+            spectra = (self.__sum*decay + products_sum) / \
+                (self.__weights*decay + weights_sum)
+        else:
+            spectra = self.__sum / self.__weights
+        spectra = _welch_scaling(
+            spectra, self.__window, self.sampling_rate_hz, self.__scaling,
+            self.detrend)
+        if self.cross_spectra:
+            # Enforce hermitian matrices
+            spectra = np.tril(spectra) + \
+                np.swapaxes(np.tril(spectra, -1), 1, 2).conjugate()
+            spectra = spectra.astype(_complex_dtype(self.__tail))
+        else:
+            spectra = spectra.astype(_float_dtype(self.__tail))
+        f = np.fft.rfftfreq(self.window_length_samples,
+                            1/self.sampling_rate_hz)
+        return f, spectra
@@ -4,6 +4,7 @@ Backend for transfer functions methods
 import numpy as np
 from scipy.signal import get_window
 from .._general_helpers import _find_nearest, _calculate_window, _pad_trim
+from .._fft import fft, ifft, irfft
 
 
 def _spectral_deconvolve(num_fft: np.ndarray, denum_fft: np.ndarray, freqs_hz,
@@ -23,16 +24,16 @@ def _spectral_deconvolve(num_fft: np.ndarray, denum_fft: np.ndarray, freqs_hz,
         denum_reg = denum_fft.conj() /\
             (denum_fft.conj()*denum_fft + eps)
         new_time_data = \
-            np.fft.irfft(num_fft * denum_reg, n=time_signal_length)
+            irfft(num_fft * denum_reg, n=time_signal_length)
     elif mode == 'window':
         ids = _find_nearest(start_stop_hz, freqs_hz)
         window = _calculate_window(ids, len(freqs_hz), inverse=False)
         window += 10**(-200/10)
         num_fft_n = num_fft * window
-        new_time_data = np.fft.irfft(
+        new_time_data = irfft(
             np.divide(num_fft_n, denum_fft), n=time_signal_length)
     elif mode == 'standard':
-        new_time_data = np.fft.irfft(
+        new_time_data = irfft(
             np.divide(num_fft, denum_fft), n=time_signal_length)
     else:
         raise ValueError(f'{mode} is not supported. Choose window' +
@@ -94,7 +95,7 @@ def _min_phase_ir_from_real_cepstrum(time_data: np.ndarray):
         New time series.
 
     """
-    return np.real(np.fft.ifft(
+    return np.real(ifft(
         _get_minimum_phase_spectrum_from_real_cepstrum(time_data), axis=0))
 
 
@@ -115,8 +116,8 @@ def _get_minimum_phase_spectrum_from_real_cepstrum(time_data: np.ndarray):
 
     """
     # Real cepstrum
-    y = np.real(np.fft.ifft(np.log(np.abs(
-        np.fft.fft(time_data, axis=0))), axis=0))
+    y = np.real(ifft(np.log(np.abs(
+        fft(time_data, axis=0))), axis=0))
 
     # Window in the cepstral domain, like obtaining hilbert transform
     w = np.zeros(y.shape[0])
@@ -127,7 +128,7 @@ def _get_minimum_phase_spectrum_from_real_cepstrum(time_data: np.ndarray):
         w[len(w)//2] = 1
 
     # Windowing in cepstral domain and back to spectral domain
-    return np.exp(np.fft.fft(y*w[..., None], axis=0))
+    return np.exp(fft(y*w[..., None], axis=0))
 
 
 def _window_this_ir(vec, total_length: int, window_type: str = 'hann',
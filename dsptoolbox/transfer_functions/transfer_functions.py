@@ -21,6 +21,7 @@ from ..standard_functions import (
     fractional_delay, merge_signals, normalize)
 from ..generators import dirac
 from ..filterbanks import linkwitz_riley_crossovers
+from .._fft import rfft, irfft
 
 
 def spectral_deconvolve(num: Signal, denum: Signal,
@@ -66,7 +67,7 @@ def spectral_deconvolve(num: Signal, denum: Signal,
     """
     num = num.copy()
     denum = denum.copy()
-    assert num.time_data.shape[0] == denum.time_data.shape[0], \
+    assert len(num) == len(denum), \
         'Lengths do not match for spectral deconvolution'
     if denum.number_of_channels != 1:
         assert num.number_of_channels == denum.number_of_channels, \
@@ -83,11 +84,11 @@ def spectral_deconvolve(num: Signal, denum: Signal,
         assert start_stop_hz is None, \
             'No start_stop_hz vector can be passed when using standard mode'
 
-    original_length = num.time_data.shape[0]
+    original_length = len(num)
 
     if padding:
-        num.time_data = _pad_trim(num.time_data, original_length*2)
-        denum.time_data = _pad_trim(denum.time_data, original_length*2)
+        num.time_data = _pad_trim(num.time_data_view, original_length*2)
+        denum.time_data = _pad_trim(denum.time_data_view, original_length*2)
     fft_length = original_length*2 if padding else original_length
 
     denum.set_spectrum_parameters(method='standard')
@@ -96,7 +97,7 @@ def spectral_deconvolve(num: Signal, denum: Signal,
     freqs_hz, num_fft = num.get_spectrum()
     fs_hz = num.sampling_rate_hz
 
-    new_time_data = np.zeros_like(num.time_data)
+    new_time_data = np.zeros_like(num.time_data_view)
 
     for n in range(num.number_of_channels):
         n_denum = 0 if multichannel else n
@@ -125,7 +126,8 @@ def spectral_deconvolve(num: Signal, denum: Signal,
                      signal_type='ir')
     if padding:
         if keep_original_length:
-            new_sig.time_data = _pad_trim(new_sig.time_data, original_length)
+            new_sig.time_data = _pad_trim(
+                new_sig.time_data_view, original_length)
     return new_sig
 
 
@@ -177,7 +179,7 @@ def window_ir(signal: Signal, constant_percentage=0.75, exp2_trim: int = 13,
     if exp2_trim is not None:
         total_length = int(2**exp2_trim)
     else:
-        total_length = len(signal.time_data)
+        total_length = len(signal)
     new_time_data = np.zeros((total_length, signal.number_of_channels))
     start_positions_samples = np.zeros(signal.number_of_channels, dtype=int)
 
@@ -185,7 +187,7 @@ def window_ir(signal: Signal, constant_percentage=0.75, exp2_trim: int = 13,
     for n in range(signal.number_of_channels):
         new_time_data[:, n], window[:, n], start_positions_samples[n] = \
             _window_this_ir_tukey(
-                signal.time_data[:, n],
+                signal.time_data_view[:, n],
                 total_length,
                 window_type,
                 exp2_trim,
@@ -242,7 +244,8 @@ def window_centered_ir(signal: Signal, total_length: int, window_type='hann') \
 
     for n in range(signal.number_of_channels):
         new_time_data[:, n], window[:, n], start_positions_samples[n] = \
-            _window_this_ir(signal.time_data[:, n], total_length, window_type)
+            _window_this_ir(
+                signal.time_data_view[:, n], total_length, window_type)
 
     new_sig = Signal(
         None, new_time_data, signal.sampling_rate_hz,
@@ -294,7 +297,7 @@ def compute_transfer_function(output: Signal, input: Signal, mode='h2',
         f'{mode} is not a valid mode. Use H1, H2 or H3'
     assert input.sampling_rate_hz == output.sampling_rate_hz, \
         'Sampling rates do not match'
-    assert input.time_data.shape[0] == output.time_data.shape[0], \
+    assert len(input) == len(output), \
         'Signal lengths do not match'
     if input.number_of_channels != 1:
         assert input.number_of_channels == output.number_of_channels, \
@@ -313,15 +316,15 @@ def compute_transfer_function(output: Signal, input: Signal, mode='h2',
                    output.number_of_channels), dtype='cfloat')
     if multichannel:
         G_xx = _welch(
-            input.time_data[:, 0],
-            input.time_data[:, 0],
+            input.time_data_view[:, 0],
+            input.time_data_view[:, 0],
             input.sampling_rate_hz,
             window_length_samples=window_length_samples,
             **spectrum_parameters)
     for n in range(output.number_of_channels):
         G_yy = _welch(
-            output.time_data[:, n],
-            output.time_data[:, n],
+            output.time_data_view[:, n],
+            output.time_data_view[:, n],
             input.sampling_rate_hz,
             window_length_samples=window_length_samples,
             **spectrum_parameters)
@@ -330,21 +333,21 @@ def compute_transfer_function(output: Signal, input: Signal, mode='h2',
         else:
             n_input = n
             G_xx = _welch(
-                input.time_data[:, n_input],
-                input.time_data[:, n_input],
+                input.time_data_view[:, n_input],
+                input.time_data_view[:, n_input],
                 input.sampling_rate_hz,
                 window_length_samples=window_length_samples,
                 **spectrum_parameters)
         if mode == 'h2'.casefold():
             G_yx = _welch(
-                    output.time_data[:, n],
-                    input.time_data[:, n_input],
+                    output.time_data_view[:, n],
+                    input.time_data_view[:, n_input],
                     output.sampling_rate_hz,
                     window_length_samples=window_length_samples,
                     **spectrum_parameters)
         G_xy = _welch(
-            input.time_data[:, n_input],
-            output.time_data[:, n],
+            input.time_data_view[:, n_input],
+            output.time_data_view[:, n],
             output.sampling_rate_hz,
             window_length_samples=window_length_samples,
             **spectrum_parameters)
@@ -356,7 +359,7 @@ def compute_transfer_function(output: Signal, input: Signal, mode='h2',
         elif mode == 'h3'.casefold():
             tf[:, n] = G_xy / np.abs(G_xy) * (G_yy/G_xx)**0.5
         coherence[:, n] = np.abs(G_xy)**2 / G_xx / G_yy
-    tf_sig = Signal(None, np.fft.irfft(tf, axis=0), output.sampling_rate_hz,
+    tf_sig = Signal(None, irfft(tf, axis=0), output.sampling_rate_hz,
                     signal_type=mode.lower())
     tf_sig.set_coherence(coherence)
     return tf_sig, tf
@@ -386,7 +389,7 @@ def spectral_average(signal: Signal, normalize_energy: bool = True) -> Signal:
     assert signal.number_of_channels > 1, \
         'Signal has only one channel so no meaningful averaging can be done'
 
-    l_samples = signal.time_data.shape[0]
+    l_samples = len(signal)
 
     # Obtain channel magnitude and phase spectra
     _, sp = signal.get_spectrum()
@@ -403,7 +406,7 @@ def spectral_average(signal: Signal, normalize_energy: bool = True) -> Signal:
     new_sp = new_mag * np.exp(1j*new_pha)
 
     # New time data and signal object
-    new_time_data = np.fft.irfft(new_sp[..., None], n=l_samples, axis=0)
+    new_time_data = irfft(new_sp[..., None], n=l_samples, axis=0)
     avg_sig = signal.copy()
     avg_sig.time_data = new_time_data
     if hasattr(avg_sig, 'window'):
@@ -445,7 +448,7 @@ def min_phase_from_mag(spectrum: np.ndarray, sampling_rate_hz: int,
     min_spectrum = np.empty(spectrum.shape, dtype='cfloat')
     phase = _minimum_phase(spectrum, False)
     min_spectrum = spectrum*np.exp(1j*phase)
-    time_data = np.fft.irfft(min_spectrum, axis=0)
+    time_data = irfft(min_spectrum, axis=0)
     sig_min_phase = Signal(
         None, time_data=time_data,
         sampling_rate_hz=sampling_rate_hz, signal_type=signal_type)
@@ -529,7 +532,7 @@ def lin_phase_from_mag(spectrum: np.ndarray, sampling_rate_hz: int,
             gd = group_delay_ms
         lin_spectrum[:, n] = spectrum[:, n]*np.exp(
             -1j * 2 * np.pi * f_vec * gd)
-    time_data = np.fft.irfft(lin_spectrum, axis=0)
+    time_data = irfft(lin_spectrum, axis=0)
     sig_lin_phase = Signal(
         None, time_data=time_data,
         sampling_rate_hz=sampling_rate_hz, signal_type=signal_type)
@@ -569,14 +572,12 @@ def min_phase_ir(sig: Signal, method: str = 'real cepstrum') -> Signal:
     assert method in ('real cepstrum', 'log hilbert', 'equiripple'), \
         f'{method} is not valid. Use either real cepstrum, log hilbert or ' +\
         'equiripple'
-    new_time_data = np.zeros_like(sig.time_data)
-
     if method == 'real cepstrum':
-        new_time_data = _min_phase_ir_from_real_cepstrum(sig.time_data)
+        new_time_data = _min_phase_ir_from_real_cepstrum(sig.time_data_view)
     else:
         _, min_phases = minimum_phase(sig, method=method)
         _, sp = sig.get_spectrum()
-        new_time_data = np.fft.irfft(np.abs(sp)*np.exp(1j*min_phases), axis=0)
+        new_time_data = irfft(np.abs(sp)*np.exp(1j*min_phases), axis=0)
 
     min_phase_sig = sig.copy()
     min_phase_sig.time_data = new_time_data
@@ -620,10 +621,9 @@ def group_delay(signal: Signal, method='matlab') \
     else:
         group_delays = \
             np.zeros(
-                (signal.time_data.shape[0]//2+1,
-                 signal.time_data.shape[1]))
+                (len(signal)//2+1, signal.number_of_channels))
         for n in range(signal.number_of_channels):
-            b = signal.time_data[:, n].copy()
+            b = signal.time_data_view[:, n].copy()
             a = [1]
             _, group_delays[:, n] = _group_delay_filter(
                 [b, a], len(b)//2+1, signal.sampling_rate_hz)
@@ -663,22 +663,22 @@ def minimum_phase(signal: Signal, method: str = 'real cepstrum')\
 
     if method == 'equiripple':
         f = np.fft.rfftfreq(
-            signal.time_data.shape[0], d=1/signal.sampling_rate_hz)
+            len(signal), d=1/signal.sampling_rate_hz)
         min_phases = np.zeros(
             (len(f), signal.number_of_channels), dtype='float')
         for n in range(signal.number_of_channels):
             temp = min_phase_scipy(
-                signal.time_data[:, n], method='hilbert', n_fft=None)
-            min_phases[:, n] = np.angle(np.fft.rfft(
-                _pad_trim(temp, signal.time_data.shape[0])))
+                signal.time_data_view[:, n], method='hilbert', n_fft=None)
+            min_phases[:, n] = np.angle(rfft(
+                _pad_trim(temp, len(signal))))
     elif method == 'log hilbert':
         signal.set_spectrum_parameters('standard')
         f, sp = signal.get_spectrum()
         min_phases = _minimum_phase(np.abs(sp), unwrapped=False)
     else:
-        sp = _get_minimum_phase_spectrum_from_real_cepstrum(signal.time_data)
-        f = np.fft.fftfreq(signal.time_data.shape[0],
-                           1/signal.sampling_rate_hz)
+        sp = _get_minimum_phase_spectrum_from_real_cepstrum(
+            signal.time_data_view)
+        f = np.fft.fftfreq(len(signal), 1/signal.sampling_rate_hz)
         if sp.shape[0] % 2 == 0:
             f[sp.shape[0]//2] *= -1
         inds = f >= 0
@@ -798,14 +798,14 @@ def combine_ir_with_dirac(ir: Signal,
     ir = normalize(ir)
     # Get maximum with fractional precision by finding the root of the complex
     # part of the analytical signal
-    delay_samples = np.argmax(ir.time_data, axis=0).astype(int)
-    h = hilbert(ir.time_data, axis=0)
+    delay_samples = np.argmax(ir.time_data_view, axis=0).astype(int)
+    h = hilbert(ir.time_data_view, axis=0)
     point_around = 1
     x = np.arange(-point_around, point_around)
 
     # Make impulse
     imp = dirac(
-        len(ir.time_data),
+        len(ir),
         delay_samples=0,
         number_of_channels=1,
         sampling_rate_hz=ir.sampling_rate_hz
@@ -835,7 +835,7 @@ def combine_ir_with_dirac(ir: Signal,
     else:
         band_ir = 1
         band_imp = 0
-    td_ir = ir_multi.bands[band_ir].time_data
+    td_ir = ir_multi.bands[band_ir].time_data_view
     td_imp = imp_multi.bands[band_imp].time_data
 
     if normalization == 'energy':
@@ -896,7 +896,7 @@ def ir_to_filter(signal: Signal, channel: int = 0,
     elif phase_mode == 'lin':
         f, sp = signal.get_spectrum()
         signal = lin_phase_from_mag(np.abs(sp), signal.sampling_rate_hz)
-    b = signal.time_data[:, 0]
+    b = signal.time_data_view[:, 0].copy()
     a = [1]
     filt = Filter(
         'other', {'ba': [b, a]}, sampling_rate_hz=signal.sampling_rate_hz)
@@ -985,7 +985,7 @@ def spectrum_with_cycles(ir: Signal, cycles: int, channel: int = None,
     else:
         channel = np.atleast_1d(channel)
 
-    td = ir.time_data[:, channel]
+    td = ir.time_data_view[:, channel]
 
     f = np.fft.rfftfreq(td.shape[0], 1/fs)
     inds = (f > frequency_range_hz[0]) & (f < frequency_range_hz[1])
@@ -1010,5 +1010,5 @@ def spectrum_with_cycles(ir: Signal, cycles: int, channel: int = None,
             alpha = alpha_factor / cycles_per_freq_samples[ind]
 
             w = np.exp(-0.5 * (alpha * n[:td.shape[0]] / half)**2)
-            spec[ind, ch] = np.fft.rfft(w * td[:, ch])[ind_f]
+            spec[ind, ch] = rfft(w * td[:, ch])[ind_f]
     return f, spec
@@ -3,6 +3,7 @@ Backend for special module
 """
 import numpy as np
 from scipy.signal import get_window
+from .._fft import fft
 
 
 def _pitch2frequency(tuning_a_hz: float = 440):
@@ -48,7 +49,7 @@ class Wavelet():
 
         """
         x, func = self.get_base_wavelet()
-        ind = np.argmax(np.abs(np.fft.fft(func)))
+        ind = np.argmax(np.abs(fft(func)))
         # Maybe for some wavelets it might be necessary to miror around nyquist
         domain = x[-1] - x[0]
         return ind / domain
@@ -5,6 +5,8 @@ from ..classes.signal_class import Signal
 from ..plots import general_matrix_plot
 from .._standard import _reconstruct_framed_signal
 from .._general_helpers import _hz2mel, _mel2hz, _pad_trim
+from .._config import _complex_dtype
+from .._fft import fft, ifft, irfft
 from ..transforms._transforms import (
     _pitch2frequency, Wavelet, MorletWavelet, _squeeze_scalogram,
     _get_kernels_vqt)
@@ -54,10 +56,10 @@ def cepstrum(signal: Signal, mode='power') -> np.ndarray:
     _, sp = signal.get_spectrum()
 
     if mode in ('power', 'real'):
-        ceps = np.abs(np.fft.irfft((2*np.log(np.abs(sp))), axis=0))**2
+        ceps = np.abs(irfft((2*np.log(np.abs(sp))), axis=0))**2
     else:
         phase = np.unwrap(np.angle(sp), axis=0)
-        ceps = np.fft.irfft(np.log(np.abs(sp)) + 1j*phase, axis=0).real
+        ceps = irfft(np.log(np.abs(sp)) + 1j*phase, axis=0).real
     if mode == 'real':
         ceps = (ceps**0.5)/2
     return ceps
@@ -444,7 +446,7 @@ def istft(stft: np.ndarray, original_signal: Signal = None,
     if parameters['scaling']:
         stft /= np.sqrt(2 / np.sum(window)**2)
 
-    td_framed = np.fft.irfft(stft, axis=0, n=parameters['fft_length_samples'])
+    td_framed = irfft(stft, axis=0, n=parameters['fft_length_samples'])
 
     # Reconstruct from framed representation to continuous
     step = int((1 - parameters['overlap_percent']/100) * len(window))
@@ -593,10 +595,10 @@ def cwt(signal: Signal, frequencies: np.ndarray,
     if channel is None:
         channel = np.arange(signal.number_of_channels)
     channel = np.atleast_1d(channel)
-    td = signal.time_data[:, channel]
+    td = signal.time_data_view[:, channel]
 
     scalogram = np.zeros((len(frequencies), td.shape[0], td.shape[1]),
-                         dtype='cfloat')
+                         dtype=_complex_dtype(td))
 
     for ind_f, f in enumerate(frequencies):
         wv = wavelet.get_wavelet(f, signal.sampling_rate_hz)
@@ -606,7 +608,7 @@ def cwt(signal: Signal, frequencies: np.ndarray,
         #         td, wv[..., None], axes=0, mode='same')
         # else:
         scalogram[ind_f, ...] = oaconvolve(
-            td, wv[..., None], axes=0, mode='same')
+            td, wv.astype(scalogram.dtype)[..., None], axes=0, mode='same')
 
     if synchrosqueezed:
         scalogram = _squeeze_scalogram(
@@ -643,7 +645,7 @@ def hilbert(signal: Signal):
     """
     td = signal.time_data
 
-    sp = np.fft.fft(td, axis=0)
+    sp = fft(td, axis=0)
     if len(td) % 2 == 0:
         nyquist = len(td) // 2
         sp[1:nyquist, :] *= 2
@@ -653,7 +655,7 @@ def hilbert(signal: Signal):
         sp[(len(td) + 1)//2:, :] = 0
 
     analytic = signal.copy()
-    analytic.time_data = np.fft.ifft(sp, axis=0)
+    analytic.time_data = ifft(sp, axis=0)
     return analytic
 
 
@@ -730,13 +732,13 @@ def vqt(signal: Signal, channel: np.ndarray = None, q: float = 1,
                                mid_fs, window, gamma)
 
     octs = octaves[1]-octaves[0]+1
-    cqt = np.zeros((0, signal.time_data.shape[0], signal.number_of_channels),
-                   dtype='cfloat')
+    cqt = np.zeros((0, len(signal), signal.number_of_channels),
+                   dtype=_complex_dtype(signal.time_data_view))
 
     for oc in np.arange(octs):
         # Accumulator for octave
         acc = np.zeros((0, td.shape[0], td.shape[1]),
-                       dtype='cfloat')
+                       dtype=cqt.dtype)
 
         for k in kernels:
             out = oaconvolve(td, k[..., None], mode='same', axes=0)
@@ -124,6 +124,28 @@ def fractional_octave_bands():
     dsp.plots.show()
 
 
+def multirate_fractional_octave_bands():
+    from time import time
+    fs = 48000
+    s = dsp.generators.noise('white', length_seconds=20, sampling_rate_hz=fs)
+    fb = dsp.filterbanks.fractional_octave_bands(
+        frequency_range_hz=[31.5, 16e3], octave_fraction=3,
+        sampling_rate_hz=fs)
+    fb_mr = dsp.filterbanks.multirate_fractional_octave_bands(
+        frequency_range_hz=[31.5, 16e3], octave_fraction=3,
+        sampling_rate_hz=fs)
+
+    start = time()
+    fb.filter_signal(s, mode='parallel')
+    print(f'Full sampling rate: {time() - start:.2f} s')
+    start = time()
+    fb_mr.filter_signal(s, mode='parallel', upsample=True)
+    print(f'Multirate (upsampled bands): {time() - start:.2f} s')
+    start = time()
+    fb_mr.filter_signal(s, mode='parallel', upsample=False)
+    print(f'Multirate (decimated bands): {time() - start:.2f} s')
+
+
 def test1():
     import pyfar as pf
     import numpy as np
@@ -150,6 +172,7 @@ if __name__ == '__main__':
     # gamma_tone_reconstruction()
     # qmf_crossovers()
     fractional_octave_bands()
+    # multirate_fractional_octave_bands()
     # test1()
 
     print()
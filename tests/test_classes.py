@@ -6,6 +6,7 @@ import dsptoolbox as dsp
 import numpy as np
 from os.path import join
 import scipy.signal as sig
+import scipy.fft
 
 
 class TestSignal():
@@ -64,7 +65,8 @@ class TestSignal():
             s = dsp.Signal(None, r, self.fs)
 
     def test_get_fft(self):
-        sp = np.fft.rfft(self.time_vec, axis=0)
+        # scipy.fft is the default backend
+        sp = scipy.fft.rfft(self.time_vec, axis=0)
 
         # Check normal FFT
         s = dsp.Signal(None, self.time_vec, self.fs)
@@ -197,6 +199,17 @@ class TestSignal():
     def test_get_csm(self):
         s = dsp.Signal(time_data=self.time_vec, sampling_rate_hz=self.fs)
         f, csm = s.get_csm()
+        # Hermitian matrices and auto-spectra on the diagonal
+        assert np.all(np.isclose(csm, np.swapaxes(csm, 1, 2).conjugate()))
+        s.set_spectrum_parameters(method='welch', window_length_samples=1024,
+                                  overlap_percent=75)
+        _, sp = s.get_spectrum()
+        assert np.all(np.isclose(np.diagonal(csm, axis1=1, axis2=2).real, sp))
+
+        # Median average
+        s.set_csm_parameters(average='median')
+        f, csm_median = s.get_csm()
+        assert csm_median.shape == csm.shape
 
     def test_get_stft(self):
         s = dsp.Signal(time_data=self.time_vec, sampling_rate_hz=self.fs)
@@ -231,7 +244,38 @@ class TestSignal():
 
     def test_copying_signal(self):
         s = dsp.Signal(time_data=self.time_vec, sampling_rate_hz=self.fs)
-        s.copy()
+        s.get_spectrum()
+        s2 = s.copy()
+        assert np.all(s2.time_data == s.time_data)
+        assert s2.spectral_cache_info['entries'] == 1
+
+        # Without caches
+        s2 = s.copy(with_caches=False)
+        assert np.all(s2.time_data == s.time_data)
+        assert s2.spectral_cache_info['entries'] == 0
+
+        # Without time data, only metadata and parameters
+        s2 = s.copy(with_time_data=False)
+        assert len(s2) == 0
+        assert s2.spectral_cache_info['entries'] == 0
+        assert s2._spectrum_parameters == s._spectrum_parameters
+        s2.time_data = self.time_vec[:100]
+        assert len(s2) == 100
+        assert len(s2.time_vector_s) == 100
+        assert len(s) == self.length_samp
+
+        # Window and coherence belong to the time data
+        s = dsp.Signal(time_data=self.time_vec, sampling_rate_hz=self.fs,
+                       signal_type='ir')
+        s.set_window(np.ones_like(s.time_data))
+        s.set_coherence(np.ones((len(s)//2+1, s.number_of_channels)))
+        s2 = s.copy()
+        assert np.all(s2.window == s.window) and s2.window is not s.window
+        assert np.all(s2.coherence == s.coherence)
+        s2 = s.copy(with_time_data=False)
+        assert not hasattr(s2, 'window')
+        assert not hasattr(s2, 'coherence')
+        assert hasattr(s, 'window') and hasattr(s, 'coherence')
 
     def test_show_info(self):
         s = dsp.Signal(time_data=self.time_vec, sampling_rate_hz=self.fs)
@@ -258,6 +302,117 @@ class TestSignal():
                        constrain_amplitude=False)
         assert np.all(t == s.time_data.squeeze())
 
+    def test_spectral_cache(self):
+        s = dsp.Signal(time_data=self.time_vec, sampling_rate_hz=self.fs)
+        s.set_spectrum_parameters(window_length_samples=1024)
+        _, sp1 = s.get_spectrum()
+        s.set_spectrum_parameters(window_length_samples=2048)
+        _, sp2 = s.get_spectrum()
+        assert s.spectral_cache_info['misses'] == 2
+
+        # Switching back to previous parameters uses the cache
+        s.set_spectrum_parameters(window_length_samples=1024)
+        _, sp1_ = s.get_spectrum()
+        assert np.all(sp1 == sp1_)
+        assert s.spectral_cache_info['hits'] == 1
+        assert s.spectral_cache_info['entries'] == 2
+
+        # Changing time data discards all entries
+        s.time_data = self.time_vec[:self.fs]
+        assert s.spectral_cache_info['entries'] == 0
+        _, sp1_ = s.get_spectrum()
+        assert s.spectral_cache_info['misses'] == 3
+
+        # Bounded size
+        s.set_spectral_cache(max_bytes=sp1.nbytes)
+        s.get_csm()
+        assert s.spectral_cache_info['current_bytes'] <= sp1.nbytes
+        s.set_spectral_cache(max_bytes=0)
+        assert s.spectral_cache_info['entries'] == 0
+
+    def test_channels_with_cached_spectra(self):
+        s = dsp.Signal(time_data=self.time_vec, sampling_rate_hz=self.fs)
+        s.get_spectrum()
+        s.get_csm()
+        new_channels = np.random.normal(0, 0.1, (self.length_samp, 2))
+        s.add_channel(None, new_channels, self.fs)
+        s.add_channel(None, new_channels[:, 0], self.fs)
+
+        # Caches are updated with new channels and are not recomputed
+        ref = dsp.Signal(
+            None, np.concatenate(
+                [self.time_vec, new_channels, new_channels[:, :1]], axis=1),
+            self.fs)
+        assert np.all(np.isclose(s.get_spectrum()[1], ref.get_spectrum()[1]))
+        assert np.all(np.isclose(s.get_csm()[1], ref.get_csm()[1]))
+        assert s.spectral_cache_info['misses'] == 2
+
+        # Remove channels (previous views do not change)
+        view = s.time_data_view
+        view_data = view.copy()
+        s.remove_channel(1)
+        s.remove_channel(-1)
+        assert np.all(view == view_data)
+        ref = ref.get_channels([0, 2, 3, 4, 5])
+        assert np.all(s.time_data == ref.time_data)
+        assert np.all(np.isclose(s.get_csm()[1], ref.get_csm()[1]))
+        assert s.spectral_cache_info['misses'] == 2
+        s.add_channel(None, new_channels[:, 0], self.fs)
+        assert np.all(view == view_data)
+
+    def test_time_data_view(self):
+        s = dsp.Signal(time_data=self.time_vec, sampling_rate_hz=self.fs)
+        v = s.time_data_view
+        assert np.all(v == s.time_data)
+        assert not v.flags.writeable
+        # No copy is made
+        assert np.shares_memory(v, s.time_data_view)
+        with pytest.raises(ValueError):
+            v[0, 0] = 1.
+        # Signal created from a view does not share its data
+        s2 = dsp.Signal(None, v, self.fs)
+        assert not np.shares_memory(s2.time_data_view, v)
+        s2.time_data = s2.time_data*2
+        assert np.all(s.time_data_view == self.time_vec)
+
+    def test_precision(self):
+        s = dsp.Signal(None, self.time_vec, self.fs)
+        s32 = dsp.Signal(None, self.time_vec, self.fs, precision='float32')
+        assert s32.time_data.dtype == np.float32
+        assert s32.copy().time_data.dtype == np.float32
+        assert s32.copy(with_time_data=False).time_data.dtype == np.float32
+
+        # Spectra keep single precision and are close to double precision
+        f, sp32 = s32.get_spectrum()
+        assert sp32.dtype == np.float32
+        assert np.all(np.isclose(sp32, s.get_spectrum()[1], rtol=1e-3,
+                                 atol=1e-6))
+        assert s32.get_csm()[1].dtype == np.complex64
+        assert s32.get_spectrogram()[2].dtype == np.complex64
+
+        # Filtering
+        filt = dsp.Filter('iir', dict(order=4, filter_design_method='butter',
+                                      type_of_pass='lowpass', freqs=1e3),
+                          self.fs)
+        out32 = filt.filter_signal(s32)
+        assert out32.time_data.dtype == np.float32
+        assert np.all(np.isclose(out32.time_data,
+                                 filt.filter_signal(s).time_data, atol=1e-5))
+
+        # Change precision of existing signal
+        s32.precision = 'float64'
+        assert s32.time_data.dtype == np.float64
+
+        # Default precision
+        dsp.set_default_precision('float32')
+        try:
+            assert dsp.Signal(None, self.time_vec, self.fs).precision == \
+                'float32'
+        finally:
+            dsp.set_default_precision('float64')
+        with pytest.raises(AssertionError):
+            dsp.set_default_precision('float16')
+
 
 class TestFilterClass():
     """Tests for the Filter class.
@@ -339,6 +494,58 @@ class TestFilterClass():
 
         assert condfir and condiir
 
+    def test_process_block(self):
+        t_vec = np.random.normal(0, 0.01, (self.fs, 2))
+        blocks = np.split(t_vec, np.arange(256, len(t_vec), 256))
+        biquad = dsp.Filter('biquad', dict(eq_type=0, freqs=1000, gain=3,
+                                           q=1), self.fs)
+        filters = [
+            (dsp.Filter('other', dict(ba=[self.fir, 1]), self.fs),
+             sig.lfilter(self.fir, [1], t_vec, axis=0)),
+            (dsp.Filter('other', dict(sos=self.iir), self.fs),
+             sig.sosfilt(self.iir, t_vec, axis=0)),
+            (biquad, sig.lfilter(biquad.ba[0], biquad.ba[1], t_vec, axis=0))]
+
+        # Consecutive blocks are filtered as one signal
+        for f, result_scipy in filters:
+            result_own = np.concatenate([f.process_block(b) for b in blocks])
+            assert np.all(np.isclose(result_scipy, result_own))
+
+            # Reset starts again with zero states, also for 1D-blocks
+            f.reset()
+            assert np.all(np.isclose(
+                result_scipy[:256, 0], f.process_block(t_vec[:256, 0])))
+            with pytest.raises(AssertionError):
+                f.process_block(t_vec)
+            f.reset()
+
+        # zi's are kept between calls of filter_signal
+        f = dsp.Filter('iir', dict(order=6, freqs=1000,
+                                   type_of_pass='lowpass'), self.fs)
+        s = dsp.Signal(None, t_vec, self.fs)
+        f.filter_signal(s, activate_zi=True)
+        f.filter_signal(s, activate_zi=True)
+        assert len(f.zi) == s.number_of_channels
+
+    def test_partitioned_convolution(self):
+        t_vec = np.random.normal(0, 0.01, (self.fs, 2))
+        b = np.random.normal(0, 0.01, 5000)
+        result_scipy = sig.lfilter(b, [1], t_vec, axis=0)
+        f = dsp.Filter('other', dict(ba=[b, 1]), self.fs)
+        f.set_fir_engine('partitioned', partition_size_samples=512)
+
+        # Whole signal
+        s = dsp.Signal(None, t_vec, self.fs)
+        assert np.all(np.isclose(f.filter_signal(s).time_data, result_scipy))
+
+        # Blocks with lengths that do not match the partitions
+        blocks = np.split(t_vec, np.arange(100, len(t_vec), 700))
+        result_own = np.concatenate([f.process_block(b) for b in blocks])
+        assert np.all(np.isclose(result_own, result_scipy))
+
+        with pytest.raises(AssertionError):
+            f.set_fir_engine('overlap-add')
+
     def test_plots(self):
         f = dsp.Filter('other', filter_configuration=dict(sos=self.iir),
                        sampling_rate_hz=self.fs)
@@ -364,10 +571,35 @@ class TestFilterClass():
         f.get_coefficients(mode='sos')
         f.get_coefficients(mode='zpk')
 
+        # Conversions are cached and returned coefficients can be modified
+        b, a = f.get_coefficients(mode='ba')
+        b *= 0
+        assert np.all(f.get_coefficients(mode='ba')[0] != 0)
+        z, p, k = f.get_coefficients(mode='zpk')
+        assert np.all(np.isclose(sig.sos2zpk(self.iir)[1], p))
+
+        # New parameters invalidate the cache
+        f.set_filter_parameters('other', dict(ba=[[1, 0.5], [1]]))
+        b, a = f.get_coefficients(mode='ba')
+        assert np.all(b == [1, 0.5])
+        assert len(f.get_coefficients(mode='zpk')[0]) == 1
+
     def test_get_ir(self):
         f = dsp.Filter('other', filter_configuration=dict(sos=self.iir),
                        sampling_rate_hz=self.fs)
-        f.get_ir()
+        ir = f.get_ir()
+
+        # Cached impulse response is the same and can be modified
+        ir.time_data *= 0
+        impulse = np.zeros(512)
+        impulse[0] = 1
+        assert np.all(np.isclose(
+            f.get_ir().time_data[:, 0], sig.sosfilt(self.iir, impulse)))
+        assert len(f.get_ir(length_samples=1024)) == 1024
+
+        # New parameters invalidate the cache
+        f.set_filter_parameters('other', dict(ba=[[1, 0.5], [1]]))
+        assert np.all(f.get_ir().time_data[:3, 0] == [1, 0.5, 0])
 
     def test_other_functionalities(self):
         f = dsp.Filter('other', filter_configuration=dict(sos=self.iir),
@@ -418,6 +650,18 @@ class TestFilterClass():
 
         assert np.all(np.isclose(t_res_sc, t_res))
 
+        # Multichannel, upsampling and rational factors are the same as scipy
+        t_vec = np.random.normal(0, 0.01, (self.fs//2 + 1, 3))
+        t_signal = dsp.Signal(None, t_vec, self.fs)
+        for up, down in ((1, 2), (2, 1), (3, 2)):
+            f = dsp.Filter('other', filter_configuration=dict(ba=[b, 1]),
+                           sampling_rate_hz=self.fs*up)
+            t_res = f.filter_and_resample_signal(
+                t_signal, self.fs*up//down).time_data
+            t_res_sc = sig.resample_poly(t_vec, up=up, down=down, window=b,
+                                         axis=0)
+            assert np.all(t_res_sc == t_res)
+
     def test_filter_length(self):
         b = sig.firwin(
             1500, (self.fs//2//2),
@@ -531,6 +775,18 @@ class TestFilterBankClass():
         # Others
         fb.get_ir()
         fb.copy()
+
+        # Impulse responses from the cached responses of the filters
+        d = dsp.generators.dirac(2048, sampling_rate_hz=self.fs)
+        for mode in ('parallel', 'summed'):
+            ir = fb.get_ir(mode=mode)
+            ir_ = fb.filter_signal(d, mode=mode)
+            if mode == 'summed':
+                assert np.all(np.isclose(ir.time_data, ir_.time_data))
+                continue
+            for n in range(fb.number_of_filters):
+                assert np.all(np.isclose(
+                    ir.bands[n].time_data, ir_.bands[n].time_data))
         fb.show_info()
         print(fb)
 
@@ -588,11 +844,111 @@ class TestFilterBankClass():
         s_ = fb.filter_signal(s, mode='sequential', zero_phase=True)
         s_ = fb.filter_signal(s, mode='summed', zero_phase=True)
 
+        # Filter bank and single filters share the same filtering backend
+        fb_single = fb.copy()
+        for zero_phase, activate_zi in ((True, False), (False, True)):
+            s_ = fb.filter_signal(s, mode='parallel', zero_phase=zero_phase,
+                                  activate_zi=activate_zi)
+            for n, f in enumerate(fb_single.filters):
+                single = f.filter_signal(s, activate_zi=activate_zi,
+                                         zero_phase=zero_phase)
+                assert np.all(np.isclose(s_.bands[n].time_data,
+                                         single.time_data))
+                if activate_zi:
+                    assert np.all(np.isclose(fb.filters[n].zi, f.zi))
+
+        # Threads give the same results and update the zi's
+        fb_threads = fb.copy()
+        s_ = fb.filter_signal(s, mode='parallel', activate_zi=True)
+        s_threads = fb_threads.filter_signal(
+            s, mode='parallel', activate_zi=True, workers=2)
+        for n in range(fb.number_of_filters):
+            assert np.all(np.isclose(s_.bands[n].time_data,
+                                     s_threads.bands[n].time_data))
+            assert np.all(np.isclose(fb.filters[n].zi,
+                                     fb_threads.filters[n].zi))
+        s_ = fb.filter_signal(s, mode='summed', workers=-1)
+        temp = sig.lfilter(filt2, [1], s.time_data, axis=0)
+        temp += sig.sosfilt(filt1, s.time_data, axis=0)
+        assert np.all(np.isclose(s_.time_data, temp))
+
         # No zi and zero phase filtering at the same time!
         with pytest.raises(AssertionError):
             s_ = fb.filter_signal(s, mode='summed', activate_zi=True,
                                   zero_phase=True)
 
+    def test_compile(self):
+        t_vec = np.random.normal(0, 0.01, (self.fs, 2))
+        s = dsp.Signal(None, t_vec, self.fs)
+        s1 = dsp.Signal(None, t_vec[:self.fs//2], self.fs)
+        s2 = dsp.Signal(None, t_vec[self.fs//2:], self.fs)
+
+        # IIR filters and biquads -> one SOS cascade
+        fb = dsp.FilterBank()
+        for freq, gain in zip([200, 1000, 5000], [3, -4, 6]):
+            fb.add_filter(dsp.Filter(
+                'biquad', dict(eq_type=0, freqs=freq, gain=gain, q=1.2),
+                self.fs))
+        fb.add_filter(dsp.Filter(
+            'iir', dict(order=4, freqs=8000, type_of_pass='lowpass'),
+            self.fs))
+        filt = fb.compile()
+        assert type(filt) == dsp.Filter
+        assert filt.filter_type == 'iir'
+        assert len(filt.sos) == 5
+        assert np.all(np.isclose(
+            filt.filter_signal(s).time_data,
+            fb.filter_signal(s, mode='sequential').time_data, atol=1e-6))
+
+        # zi's are combined for streaming
+        fb.filter_signal(s1, mode='sequential', activate_zi=True)
+        filt = fb.compile()
+        assert np.all(np.isclose(
+            filt.filter_signal(s2, activate_zi=True).time_data,
+            fb.filter_signal(s2, mode='sequential',
+                             activate_zi=True).time_data, atol=1e-6))
+
+        # FIR filters -> one kernel
+        fb = dsp.FilterBank()
+        fb.add_filter(dsp.Filter(
+            'fir', dict(order=40, freqs=10000, type_of_pass='lowpass'),
+            self.fs))
+        fb.add_filter(dsp.Filter(
+            'fir', dict(order=20, freqs=200, type_of_pass='highpass'),
+            self.fs))
+        fb.filter_signal(s1, mode='sequential', activate_zi=True)
+        filt = fb.compile()
+        assert filt.filter_type == 'fir'
+        assert len(filt) == 61
+        assert np.all(np.isclose(
+            filt.filter_signal(s2, activate_zi=True).time_data,
+            fb.filter_signal(s2, mode='sequential',
+                             activate_zi=True).time_data))
+
+        # Short FIR filters are fused with IIR filters, long ones are not
+        fb = dsp.FilterBank()
+        fb.add_filter(dsp.Filter(
+            'biquad', dict(eq_type=0, freqs=1000, gain=3, q=1.2), self.fs))
+        fb.add_filter(dsp.Filter('other', dict(ba=[[0.5, 0.3, 0.2], [1.]]),
+                                 self.fs))
+        filt = fb.compile()
+        assert np.all(np.isclose(
+            filt.filter_signal(s).time_data,
+            fb.filter_signal(s, mode='sequential').time_data, atol=1e-6))
+        for order in (20, 400):
+            fb.add_filter(dsp.Filter(
+                'fir', dict(order=order, freqs=5000, type_of_pass='lowpass'),
+                self.fs))
+            with pytest.raises(AssertionError):
+                fb.compile()
+            fb.remove_filter(-1)
+
+        # Multirate filter banks cannot be compiled
+        fb = dsp.FilterBank(same_sampling_rate=False)
+        fb.add_filter(dsp.Filter('biquad', sampling_rate_hz=self.fs))
+        with pytest.raises(AssertionError):
+            fb.compile()
+
     def test_multirate(self):
         fb = dsp.FilterBank(same_sampling_rate=False)
         config = dict(
@@ -1,3 +1,4 @@
+import numpy as np
 import dsptoolbox as dsp
 import pytest
 
@@ -16,7 +17,37 @@ class TestFilterbanksModule():
 
         # Test filtering
         s = dsp.generators.noise('white', sampling_rate_hz=5_000)
-        fb.filter_signal(s, mode='parallel')
+        mb = fb.filter_signal(s, mode='parallel')
+
+        # Streaming in blocks gives the same bands
+        fb.reset()
+        y = np.concatenate(
+            [fb.process_block(s.time_data[ind:ind+500])
+             for ind in range(0, len(s), 500)], axis=1)
+        assert y.shape == (fb.number_of_bands, len(s), 1)
+        for n in range(fb.number_of_bands):
+            assert np.all(np.isclose(y[n], mb.bands[n].time_data))
+
+        # zi's of all channels are updated at once
+        s = dsp.Signal(None, np.random.normal(0, 0.01, (5_000, 3)), 5_000)
+        fb.initialize_zi(3)
+        mb = fb.filter_signal(s, activate_zi=True)
+        assert fb.cross_zi.shape[-1] == 3
+        fb.initialize_zi(3)
+        mb_1 = fb.filter_signal(
+            dsp.Signal(None, s.time_data[:2_000], 5_000), activate_zi=True)
+        mb_2 = fb.filter_signal(
+            dsp.Signal(None, s.time_data[2_000:], 5_000), activate_zi=True)
+        for n in range(fb.number_of_bands):
+            # Amplitudes might have been normalized differently
+            band = np.concatenate(
+                [mb_1.bands[n].time_data /
+                 mb_1.bands[n].amplitude_scale_factor,
+                 mb_2.bands[n].time_data /
+                 mb_2.bands[n].amplitude_scale_factor])
+            assert np.all(np.isclose(
+                band, mb.bands[n].time_data /
+                mb.bands[n].amplitude_scale_factor))
 
     def test_reconstructing_fractional_octave_bands(self):
         # Only functionality
@@ -35,7 +66,33 @@ class TestFilterbanksModule():
         # Reconstruct signal
         s = dsp.generators.noise(type_of_noise='pink', sampling_rate_hz=4_000)
         mb = fb.filter_signal(s)
-        fb.reconstruct(mb)
+        rec = fb.reconstruct(mb)
+
+        # All bands at once give the same as filtering each band
+        mb_ = dsp.FilterBank.filter_signal(fb, s)
+        for n in range(mb.number_of_bands):
+            assert np.all(np.isclose(
+                mb.bands[n].time_data, mb_.bands[n].time_data))
+            assert np.all(np.isclose(
+                mb.bands[n].time_data_imaginary,
+                mb_.bands[n].time_data_imaginary))
+
+        # Streaming in blocks
+        fb.reset()
+        y = []
+        rec_blocks = []
+        for ind in range(0, len(s), 1000):
+            y.append(fb.process_block(s.time_data[ind:ind+1000, 0]))
+            rec_blocks.append(fb.reconstruct_block(y[-1]))
+        y = np.concatenate(y, axis=1)
+        rec_blocks = np.concatenate(rec_blocks)
+        assert y.shape == (fb.number_of_filters, len(s))
+        assert np.all(np.isclose(
+            y.real, mb.get_all_bands(channel=0).time_data.T))
+        # Same as offline reconstruction apart from the circular delay
+        delay = np.max(fb._delays)
+        assert np.all(np.isclose(
+            rec_blocks[delay:], rec.time_data[delay:, 0]))
 
     def test_qmf_crossover(self):
         # Only functionality
@@ -70,7 +127,77 @@ class TestFilterbanksModule():
                 frequency_range_hz=[31, 8000], octave_fraction=1,
                 filter_order=6, sampling_rate_hz=fs_hz)
 
+    def test_multirate_octave_filter_bank(self):
+        fs_hz = 48_000
+        fb = dsp.filterbanks.fractional_octave_bands(
+            frequency_range_hz=[31.5, 16e3], octave_fraction=3,
+            sampling_rate_hz=fs_hz)
+        fb_mr = dsp.filterbanks.multirate_fractional_octave_bands(
+            frequency_range_hz=[31.5, 16e3], octave_fraction=3,
+            sampling_rate_hz=fs_hz)
+        assert fb_mr.number_of_filters == fb.number_of_filters
+        assert np.any(fb_mr.decimation_stages > 0)
+
+        # Band energies are the same as with the full sampling rate
+        s = dsp.generators.noise('white', length_seconds=2,
+                                 sampling_rate_hz=fs_hz)
+        mb = fb.filter_signal(s, mode='parallel')
+        mb_mr = fb_mr.filter_signal(s, mode='parallel')
+        for n in range(fb.number_of_filters):
+            energy = np.sum(mb.bands[n].time_data**2)
+            energy_mr = np.sum(mb_mr.bands[n].time_data**2)
+            assert np.abs(10*np.log10(energy_mr/energy)) < 0.1
+
+        # Decimated bands
+        mb_mr = fb_mr.filter_signal(s, mode='parallel', upsample=False)
+        for n in range(fb.number_of_filters):
+            assert mb_mr.bands[n].sampling_rate_hz == \
+                fs_hz // 2**fb_mr.decimation_stages[n]
+
+        # Summed
+        fb_mr.filter_signal(s, mode='summed')
+        with pytest.raises(AssertionError):
+            fb_mr.filter_signal(s, mode='summed', upsample=False)
+        with pytest.raises(AssertionError):
+            fb_mr.filter_signal(s, activate_zi=True)
+
     def test_weightning_filter(self):
         fs_hz = 5_000
         dsp.filterbanks.weightning_filter('a', fs_hz)
         dsp.filterbanks.weightning_filter('c', fs_hz)
+
+    def test_design_cache(self, tmp_path):
+        fs_hz = 5_000
+        dsp.filterbanks.set_design_cache(max_entries=4)
+        fb = dsp.filterbanks.fractional_octave_bands(
+            frequency_range_hz=[31, 2000], sampling_rate_hz=fs_hz)
+        hits = dsp.filterbanks.design_cache_info()['hits']
+
+        # Equal parameters (also as arrays) return a new copy of the design
+        fb_2 = dsp.filterbanks.fractional_octave_bands(
+            frequency_range_hz=np.array([31, 2000]), sampling_rate_hz=fs_hz)
+        assert dsp.filterbanks.design_cache_info()['hits'] == hits + 1
+        assert fb_2 is not fb
+        fb_2.filters[0].set_filter_parameters('other', dict(ba=[[1.], [1.]]))
+        assert np.all(fb.filters[0].sos == dsp.filterbanks.
+                      fractional_octave_bands(
+                          frequency_range_hz=[31, 2000],
+                          sampling_rate_hz=fs_hz).filters[0].sos)
+
+        # Designs are loaded from the directory
+        dsp.filterbanks.set_design_cache(max_entries=0, directory=tmp_path)
+        filt = dsp.filterbanks.weightning_filter('a', fs_hz)
+        hits = dsp.filterbanks.design_cache_info()['hits']
+        filt_2 = dsp.filterbanks.weightning_filter('a', fs_hz)
+        assert dsp.filterbanks.design_cache_info()['hits'] == hits + 1
+        assert np.all(filt.sos == filt_2.sos)
+
+        # Warnings of the design are raised on every request
+        for max_entries, directory in ((4, None), (0, tmp_path)):
+            dsp.filterbanks.set_design_cache(max_entries, directory)
+            for _ in range(2):
+                with pytest.warns(UserWarning, match='Nyquist'):
+                    dsp.filterbanks.reconstructing_fractional_octave_bands(
+                        frequency_range_hz=[63, 4000],
+                        sampling_rate_hz=fs_hz)
+        dsp.filterbanks.set_design_cache()
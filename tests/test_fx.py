@@ -3,6 +3,7 @@ Tests regarding functionality of audio fx
 """
 import dsptoolbox as dsp
 import numpy as np
+import pytest
 from os.path import join
 
 
@@ -35,13 +36,52 @@ class TestEffectsModule():
             noise_forgetting_factor=0.9, subtraction_factor=1,
             subtraction_exponent=1, ad_attack_time_ms=1.5,
             ad_release_time_ms=30)
-        specSub.apply(self.speech)
+        denoised = specSub.apply(self.speech)
+
+        # Noise spectrum is Welch's method on the detected noise
+        _, others = dsp.activity_detector(
+            self.speech, threshold_dbfs=-10, attack_time_ms=1.5,
+            release_time_ms=30)
+        others['noise'].set_spectrum_parameters(
+            method='welch', window_length_samples=specSub.window_length,
+            overlap_percent=50, window_type='hamming', scaling=None)
+        _, noise_psd = others['noise'].get_spectrum()
+        specSub.set_parameters(spectrum_to_subtract=noise_psd)
+        assert np.all(np.isclose(specSub.apply(self.speech).time_data,
+                                 denoised.time_data))
 
         # With imported spectrum
         spectrum_to_subtract = np.random.uniform(0, 1, specSub.window_length)
         specSub.set_parameters(spectrum_to_subtract=spectrum_to_subtract)
         specSub.apply(self.speech)
 
+        # All channels are denoised at once and independently
+        specSub.set_parameters(spectrum_to_subtract=False)
+        td = self.speech.time_data
+        stereo = dsp.Signal(
+            None, np.hstack([td, np.random.normal(0, 0.01, td.shape)]),
+            self.fs_hz)
+        assert np.all(np.isclose(specSub.apply(stereo).time_data[:, 0],
+                                 specSub.apply(self.speech).time_data[:, 0]))
+        with pytest.raises(AssertionError):
+            specSub.process_block(td, self.fs_hz)
+
+        # Streaming in blocks gives the adaptive mode delayed by one window
+        specSub.set_parameters(adaptive_mode=True, threshold_rms_dbfs=-30)
+        denoised = specSub.apply(stereo).time_data
+        latency = specSub.window_length
+        td = np.vstack([stereo.time_data, np.zeros((latency, 2))])
+        y = np.concatenate(
+            [specSub.process_block(td[ind:ind+300], self.fs_hz)
+             for ind in range(0, len(td), 300)])
+        assert np.all(y[:latency] == 0)
+        y = y[latency:]
+        y *= np.max(np.abs(stereo.time_data), axis=0) / \
+            np.max(np.abs(y), axis=0)
+        assert np.all(np.isclose(y, denoised))
+        specSub.reset()
+        specSub.process_block(td[:300, 0], self.fs_hz)
+
     def testDistortion(self):
         """Test different distortion parameters.
 
@@ -75,6 +115,39 @@ class TestEffectsModule():
 
         comp.show_compression()
 
+        # Loud part is compressed
+        td = np.sin(np.arange(4_000)/5)[:, None] * np.array([[0.9, 0.1]])
+        td[:2_000] *= 0.1
+        stereo = dsp.Signal(None, td, self.fs_hz)
+        comp = dsp.effects.Compressor(
+            threshold_dbfs=-20, attack_time_ms=1, release_time_ms=20,
+            ratio=4, relative_to_peak_level=False)
+        comp.set_advanced_parameters(automatic_make_up_gain=False)
+        compressed = comp.apply(stereo).time_data
+        assert np.max(np.abs(compressed[3_000:, 0])) < 0.3
+        assert np.isclose(np.max(np.abs(compressed[:1_000, 0])), 0.09,
+                          atol=1e-3)
+        # Channel below the threshold is unchanged
+        assert np.all(np.isclose(compressed[:, 1], td[:, 1]))
+
+        # Linked channels get the same gain
+        comp.set_advanced_parameters(automatic_make_up_gain=False,
+                                     linked_channels=True)
+        compressed = comp.apply(stereo).time_data
+        assert np.all(np.isclose(compressed[:, 0]/9, compressed[:, 1]))
+
+        # Streaming in blocks gives the same output
+        y = np.concatenate(
+            [comp.process_block(td[ind:ind+300], self.fs_hz)
+             for ind in range(0, len(td), 300)])
+        assert np.all(np.isclose(y, compressed))
+        comp.reset()
+        assert np.all(np.isclose(
+            comp.process_block(td[:300, 0], self.fs_hz), compressed[:300, 0]))
+        comp.set_parameters(relative_to_peak_level=True)
+        with pytest.raises(AssertionError):
+            comp.process_block(td, self.fs_hz)
+
     def testLFO(self):
         l_osc = dsp.effects.LFO(
             frequency_hz=100, waveform='triangle', random_phase=True,
@@ -111,6 +184,39 @@ class TestEffectsModule():
             modulators=[l_osc]*3, mix_percent=0.95)
         chor.apply(self.speech)
 
+        # Causal delay of all channels with fractional delays
+        td = np.random.normal(0, 0.1, (2_000, 2))
+        delay_ms = 10/self.fs_hz*1e3
+        chor = dsp.effects.Chorus(
+            modulators=np.full((len(td), 1), delay_ms), mix_percent=50)
+        expected = td.copy()
+        expected[10:] += 0.5*td[:-10]
+        stereo = dsp.Signal(None, td, self.fs_hz)
+        for interpolation in ('linear', 'allpass'):
+            chor.set_advanced_parameters(interpolation)
+            assert np.all(np.isclose(chor.process_block(td, self.fs_hz),
+                                     expected))
+
+            # Streaming in blocks gives the same as the whole signal
+            modulation = delay_ms*(2 + np.sin(np.arange(len(td))/100))
+            chor.set_parameters(modulators=np.stack(
+                [modulation, modulation[::-1]], axis=1))
+            y = np.concatenate(
+                [chor.process_block(td[ind:ind+300], self.fs_hz)
+                 for ind in range(0, len(td), 300)])
+            y *= np.max(np.abs(td), axis=0) / np.max(np.abs(y), axis=0)
+            assert np.all(np.isclose(y, chor.apply(stereo).time_data))
+            chor.set_parameters(modulators=np.full((len(td), 1), delay_ms))
+
+        # LFOs continue in the following blocks
+        chor.set_parameters(modulators=l_osc, depths_ms=2, base_delays_ms=5)
+        y = chor.process_block(td[:, 0], self.fs_hz)
+        chor.reset()
+        y_blocks = np.concatenate(
+            [chor.process_block(td[ind:ind+300, 0], self.fs_hz)
+             for ind in range(0, len(td), 300)])
+        assert np.all(np.isclose(y, y_blocks))
+
     def testDigitalDelay(self):
         delay = dsp.effects.DigitalDelay(150, feedback=0.15)
         delay.set_advanced_parameters(None)
@@ -118,6 +224,33 @@ class TestEffectsModule():
 
         delay.set_advanced_parameters('arctan')
         delay.apply(self.speech)
+        delay.plot_delay()
+
+        # Comb filter (linear) and saturated feedback of all channels
+        td = np.random.normal(0, 0.1, (2_000, 2))
+        for saturation, func in ((None, lambda x: x),
+                                 ('arctan', lambda x: 0.5*np.arctan(2*x))):
+            for delay_ms in (2, 100):
+                delay = dsp.effects.DigitalDelay(delay_ms, feedback=0.5)
+                delay.set_advanced_parameters(saturation)
+                delay_samples = int(delay_ms*1e-3*self.fs_hz)
+                expected = td.copy()
+                for i in range(delay_samples, len(expected)):
+                    expected[i] += 0.5*func(expected[i-delay_samples])
+
+                # Streaming in blocks
+                y = np.concatenate(
+                    [delay.process_block(td[ind:ind+300], self.fs_hz)
+                     for ind in range(0, len(td), 300)])
+                assert np.all(np.isclose(y, expected))
+                delay.reset()
+                assert np.all(np.isclose(
+                    delay.process_block(td[:300, 0], self.fs_hz),
+                    expected[:300, 0]))
+
+        # Custom saturation that only takes floats
+        delay.set_advanced_parameters(lambda x: float(np.tanh(x)))
+        delay.apply(self.speech)
 
     def testOther(self):
         assert 1 == \
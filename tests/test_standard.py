@@ -195,7 +195,11 @@ class TestStandardModule():
         # Create harmonic signal and silence afterwards
         s = dsp.generators.harmonic(sampling_rate_hz=self.fs)
         s = dsp.pad_trim(s, s.time_data.shape[0]*2)
-        dsp.activity_detector(s)
+        s.time_data = s.time_data + \
+            np.random.normal(0, 1e-4, s.time_data.shape)
+        _, others = dsp.activity_detector(s)
+        assert np.all(others['signal_indices'][len(s)//8:3*len(s)//8])
+        assert np.all(others['noise_indices'][-len(s)//4:])
 
     def test_detrend(self):
         # Functionality
@@ -286,3 +290,71 @@ class TestStandardModule():
                                                         s.sampling_rate_hz)
         ss = fb.filter_signal(s)
         dsp.envelope(ss)
+
+    def test_welch_accumulator(self):
+        s = self.audio_multi.copy()
+        td = s.time_data
+        s.set_spectrum_parameters(overlap_percent=50)
+        s.set_csm_parameters(overlap_percent=50)
+
+        # Spectra from blocks with arbitrary lengths are the same as for the
+        # whole signal
+        acc = dsp.WelchAccumulator(self.fs, overlap_percent=50)
+        acc_csm = dsp.WelchAccumulator(self.fs, overlap_percent=50,
+                                       cross_spectra=True)
+        borders = np.sort(np.random.randint(0, len(td), 20))
+        for block in np.split(td, borders):
+            acc.update(block)
+            acc_csm.update(block)
+        f, sp = acc.result()
+        assert np.all(np.isclose(f, s.get_spectrum()[0]))
+        assert np.all(np.isclose(sp, s.get_spectrum()[1]))
+        assert np.all(np.isclose(acc_csm.result()[1], s.get_csm()[1]))
+
+        # Signal as block and reset
+        acc.reset()
+        acc.update(s)
+        assert np.all(np.isclose(acc.result()[1], s.get_spectrum()[1]))
+        with pytest.raises(AssertionError):
+            acc.update(td[:, :2])
+
+        # Forgetting: spectrum follows the most recent (quieter) blocks
+        acc = dsp.WelchAccumulator(self.fs, forgetting_factor=0.9)
+        acc.update(td)
+        acc.update(td*0.1)
+        _, sp_forget = acc.result()
+        ratio = np.mean(sp_forget[10:], axis=0) / np.mean(sp[10:], axis=0)
+        assert np.all(np.isclose(ratio, 0.01, rtol=0.1))
+
+    def test_fft_backend(self):
+        s = self.audio_multi.copy()
+        s.set_spectrum_parameters('standard')
+        _, sp = s.get_spectrum()
+
+        # Workers and numpy backend give the same result
+        with dsp.fft_config(workers=2):
+            _, sp_workers = s.get_spectrum(force_computation=True)
+        with dsp.fft_config(backend='numpy'):
+            _, sp_numpy = s.get_spectrum(force_computation=True)
+        assert np.all(np.isclose(sp, sp_workers))
+        assert np.all(np.isclose(sp, sp_numpy))
+
+        # Register own backend
+        class CountingBackend():
+            fft, ifft, irfft = np.fft.fft, np.fft.ifft, np.fft.irfft
+            calls = 0
+
+            def rfft(self, *args, **kwargs):
+                self.calls += 1
+                return np.fft.rfft(*args, **kwargs)
+
+        backend = CountingBackend()
+        dsp.set_fft_backend(backend)
+        try:
+            s.get_spectrum(force_computation=True)
+        finally:
+            dsp.set_fft_backend('scipy')
+        assert backend.calls == 1
+
+        with pytest.raises(AssertionError):
+            dsp.set_fft_backend('fftw')